@@ -0,0 +1,198 @@
+# =========================
+# file: src/alt_pathfinder.py
+# =========================
+from __future__ import annotations
+
+from array import array
+from typing import Any, Callable, Dict, List, Optional, Tuple
+import random
+import time
+
+from .core_types import Grid, State
+from .move_masks import VALID_ACTIONS, MoveMasks, movesFor
+from .pathfinder import Pathfinder
+
+
+def bfsDistances(masks: MoveMasks, source: int) -> array:
+    # unit-cost distances from a flat cell id (-1 = unreachable)
+    n = masks.rows * masks.cols
+    dist = array("i", [-1]) * n
+    dist[source] = 0
+
+    cellMasks = masks.masks
+    offsets = masks.offsets
+    frontier = [source]
+    d = 0
+    while frontier:
+        d += 1
+        nextFrontier = []
+        for cur in frontier:
+            for a in VALID_ACTIONS[cellMasks[cur]]:
+                nxt = cur + offsets[a]
+                if dist[nxt] < 0:
+                    dist[nxt] = d
+                    nextFrontier.append(nxt)
+        frontier = nextFrontier
+    return dist
+
+
+class LandmarkTable:
+    # k landmarks with one BFS distance array each, placed by farthest-point
+    # selection: each new landmark maximises the distance to the closest
+    # one chosen so far. Only the largest component found by a few random
+    # probes is covered; queries elsewhere fall back to h = 0.
+
+    def __init__(self, masks: MoveMasks, k: int = 8, seed: Optional[int] = 0, probes: int = 4) -> None:
+        self.masks: MoveMasks = masks
+        self.k: int = max(1, int(k))
+        self.landmarks: List[int] = []
+        self.tables: List[array] = []
+
+        t0 = time.perf_counter()
+        self._select(random.Random(seed), max(1, probes))
+        self.build_s: float = time.perf_counter() - t0
+
+    def _select(self, rng: random.Random, probes: int) -> None:
+        masks = self.masks
+        cols = masks.cols
+        free = [i for i in range(masks.rows * cols) if masks.grid[i // cols][i % cols] == 0]
+        if not free:
+            return
+
+        reach: List[int] = []
+        probe = None
+        for _ in range(probes):
+            dist = bfsDistances(masks, free[rng.randrange(len(free))])
+            cells = [i for i in free if dist[i] >= 0]
+            if len(cells) > len(reach):
+                reach, probe = cells, dist
+
+        # first landmark: the cell farthest from the probe
+        cand = max(reach, key=lambda i: probe[i])
+        nearest = {i: -1 for i in reach}
+
+        while len(self.landmarks) < self.k:
+            dist = bfsDistances(masks, cand)
+            self.landmarks.append(cand)
+            self.tables.append(dist)
+
+            best = 0
+            for i in reach:
+                d = dist[i]
+                if nearest[i] < 0 or d < nearest[i]:
+                    nearest[i] = d
+                if nearest[i] > best:
+                    best = nearest[i]
+                    cand = i
+
+            if best == 0:
+                break
+
+    def heuristic(self, goalId: int) -> Callable[[int], int]:
+        # h(v) = max_L |d(L, goal) - d(L, v)|, skipping landmarks that do
+        # not reach both cells; admissible and consistent on unit-cost grids
+        pairs = [(t, t[goalId]) for t in self.tables if t[goalId] >= 0]
+
+        def h(v: int) -> int:
+            best = 0
+            for t, dg in pairs:
+                dv = t[v]
+                if dv >= 0:
+                    x = dv - dg if dv > dg else dg - dv
+                    if x > best:
+                        best = x
+            return best
+
+        return h
+
+
+class ALTPathfinder(Pathfinder):
+    # A* with landmark (ALT) lower bounds instead of Manhattan distance.
+    # Paths stay optimal; the landmark tables are built once per grid and
+    # reused by every query on it.
+
+    def __init__(self, landmarks: int = 8, seed: Optional[int] = 0) -> None:
+        super().__init__()
+        self.landmarkCount: int = landmarks
+        self.seed: Optional[int] = seed
+
+        self._table: Optional[LandmarkTable] = None
+
+    def landmarks(self, grid: Grid) -> LandmarkTable:
+        masks = movesFor(grid)
+        t = self._table
+        if t is None or t.masks is not masks:
+            t = self._table = LandmarkTable(masks, self.landmarkCount, self.seed)
+        return t
+
+    def invalidate(self) -> None:
+        # call after editing a cached grid in place
+        self._table = None
+
+    def heuristicFor(self, masks: MoveMasks, goalId: int) -> Optional[Callable[[int], int]]:
+        t = self._table
+        if t is None or t.masks is not masks:
+            t = self.landmarks(masks.grid)
+        return t.heuristic(goalId)
+
+
+def compareHeuristics(grid: Grid, queries: List[Tuple[State, State]], landmarks: int = 8) -> Dict[str, Any]:
+    # expansions and latency of Manhattan A* vs ALT on the same queries
+    flat = Pathfinder()
+    alt = ALTPathfinder(landmarks)
+    table = alt.landmarks(grid)
+
+    out: Dict[str, Any] = {"queries": len(queries), "landmarks": len(table.landmarks), "build_s": round(table.build_s, 4)}
+
+    results = {}
+    for name, pf in (("manhattan", flat), ("alt", alt)):
+        lengths = []
+        t0 = time.perf_counter()
+        for start, goal in queries:
+            path = pf.getAStarPath(grid, start, goal)
+            lengths.append(len(path) if path is not None else -1)
+        elapsed = time.perf_counter() - t0
+        n = max(1, len(queries))
+        out[name] = {"expansions": pf.totalExpansions / n, "latency_ms": 1000.0 * elapsed / n}
+        results[name] = lengths
+
+    out["same_lengths"] = results["manhattan"] == results["alt"]
+    if out["manhattan"]["expansions"]:
+        out["expansion_ratio"] = round(out["alt"]["expansions"] / out["manhattan"]["expansions"], 4)
+    return out
+
+
+def main() -> None:
+    import argparse
+    import json
+
+    from .core_types import MazeGenParams
+    from .maze_generator import MazeGenerator
+
+    p = argparse.ArgumentParser(description="ALT vs Manhattan A* on random queries")
+    p.add_argument("--rows", type=int, default=200)
+    p.add_argument("--cols", type=int, default=200)
+    p.add_argument("--wallDensity", type=float, default=0.35)
+    p.add_argument("--mazeAlgorithm", type=str, default="random")
+    p.add_argument("--landmarks", type=int, default=8)
+    p.add_argument("--queries", type=int, default=100)
+    p.add_argument("--seed", type=int, default=42)
+    args = p.parse_args()
+
+    grid, _, _ = MazeGenerator().generate(MazeGenParams(
+        rows=args.rows,
+        cols=args.cols,
+        wallDensity=args.wallDensity,
+        seed=args.seed,
+        algorithm=args.mazeAlgorithm,
+    ))
+
+    rng = random.Random(args.seed)
+    free = [(r, c) for r in range(len(grid)) for c in range(len(grid[0])) if grid[r][c] == 0]
+    queries = [(rng.choice(free), rng.choice(free)) for _ in range(args.queries)]
+
+    print(json.dumps(compareHeuristics(grid, queries, args.landmarks), indent=2))
+
+
+if __name__ == "__main__":
+    main()
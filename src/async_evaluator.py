@@ -0,0 +1,185 @@
+# =========================
+# file: src/async_evaluator.py
+# =========================
+from __future__ import annotations
+
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+import multiprocessing as mp
+import sys
+import time
+
+from .core_types import Grid, State
+from .environment import Environment
+from .move_masks import CORRIDOR_NEXT
+
+Maze = Tuple[Grid, State, State]
+
+_ZERO_ROW = (0.0, 0.0, 0.0, 0.0)
+
+
+def evaluateGreedy(
+    qTable: Dict[State, List[float]],
+    grid: Grid,
+    start: State,
+    goal: State,
+    maxSteps: int,
+    options: bool = False,
+) -> Dict[str, Any]:
+    # greedy rollout (same tie-breaking as HybridAgent._argmaxAction);
+    # unlike getActionWithSource it never inserts rows into qTable. With
+    # options, corridors are followed without consulting the table.
+    env = Environment(grid, start, goal, maxSteps=maxSteps)
+    state = env.reset()
+    totalReward = 0.0
+    steps = 0
+    follow = -1
+
+    while True:
+        if follow >= 0:
+            action = follow
+        else:
+            q = qTable.get(state, _ZERO_ROW)
+            action = 0
+            for a in (1, 2, 3):
+                if q[a] > q[action]:
+                    action = a
+
+        nextState, reward, done = env.step(action)
+        if options:
+            follow = -1 if done or nextState == state else CORRIDOR_NEXT[env.moveMask()][action]
+        state = nextState
+        totalReward += reward
+        steps += 1
+        if done:
+            break
+
+    return {"steps": steps, "total_reward": totalReward, "success": env.agentPos == goal}
+
+
+def evaluateMazes(qTable: Dict[State, List[float]], mazes: List[Maze], maxSteps: int, options: bool = False) -> Dict[str, Any]:
+    runs = []
+    for grid, start, goal in mazes:
+        t0 = time.perf_counter()
+        run = evaluateGreedy(qTable, grid, start, goal, maxSteps, options)
+        run["elapsed_s"] = time.perf_counter() - t0
+        runs.append(run)
+    return {
+        "runs": runs,
+        "success_rate": sum(1 for r in runs if r["success"]) / max(1, len(runs)),
+    }
+
+
+def _forkedEval(conn: Any, qTable: Dict[State, List[float]], mazes: List[Maze], maxSteps: int, options: bool) -> None:
+    try:
+        conn.send(evaluateMazes(qTable, mazes, maxSteps, options))
+    finally:
+        conn.close()
+
+
+class AsyncEvaluator:
+    # Evaluates Q-table snapshots off the training thread.
+    # - "fork": one forked process per snapshot; the child sees the Q-table
+    #   as it was at fork time through copy-on-write pages, so submit() costs
+    #   a fork instead of a copy (Linux / macOS)
+    # - "thread": copies the table and evaluates on a worker thread
+    # Results come back through poll()/drain() tagged with the episode of
+    # the snapshot they were taken from.
+
+    def __init__(
+        self,
+        mazes: List[Maze],
+        maxSteps: int,
+        mode: str = "auto",
+        maxInFlight: int = 2,
+        options: bool = False,
+    ) -> None:
+        if mode == "auto":
+            mode = "thread" if sys.platform.startswith("win") else "fork"
+        if mode not in ("fork", "thread"):
+            raise ValueError(f"Unknown evaluation mode: {mode}")
+
+        self.mazes: List[Maze] = mazes
+        self.maxSteps: int = maxSteps
+        self.mode: str = mode
+        self.maxInFlight: int = max(1, int(maxInFlight))
+        self.options: bool = options
+
+        self.submitted: int = 0
+        self.skipped: int = 0
+
+        self._pending: List[Tuple[int, Any, Any]] = []  # (episode, handle, conn)
+        self._ready: List[Dict[str, Any]] = []
+        self._pool: Optional[ThreadPoolExecutor] = None
+
+    def inFlight(self) -> int:
+        return len(self._pending)
+
+    def submit(self, episode: int, qTable: Dict[State, List[float]]) -> bool:
+        # returns False (and counts a skip) when maxInFlight snapshots are
+        # still being evaluated, so a slow evaluation never stalls training
+        self._ready = self._collect(block=False)
+        if len(self._pending) >= self.maxInFlight:
+            self.skipped += 1
+            return False
+
+        if self.mode == "fork":
+            ctx = mp.get_context("fork")
+            recv, send = ctx.Pipe(duplex=False)
+            proc = ctx.Process(target=_forkedEval, args=(send, qTable, self.mazes, self.maxSteps, self.options), daemon=True)
+            proc.start()
+            send.close()
+            self._pending.append((episode, proc, recv))
+        else:
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(max_workers=self.maxInFlight, thread_name_prefix="eval")
+            snapshot = {s: tuple(q) for s, q in qTable.items()}
+            fut = self._pool.submit(evaluateMazes, snapshot, self.mazes, self.maxSteps, self.options)
+            self._pending.append((episode, fut, None))
+
+        self.submitted += 1
+        return True
+
+    def poll(self) -> List[Dict[str, Any]]:
+        return self._collect(block=False)
+
+    def drain(self) -> List[Dict[str, Any]]:
+        return self._collect(block=True)
+
+    def _collect(self, block: bool) -> List[Dict[str, Any]]:
+        # finished results accumulate in _ready until poll()/drain() hands them out
+        done = self._ready
+        self._ready = []
+        still: List[Tuple[int, Any, Any]] = []
+
+        for episode, handle, conn in self._pending:
+            if conn is not None:
+                if not block and not conn.poll():
+                    still.append((episode, handle, conn))
+                    continue
+                try:
+                    res = conn.recv()
+                except EOFError:
+                    res = {"runs": [], "success_rate": 0.0, "error": "evaluation process died"}
+                conn.close()
+                handle.join()
+            else:
+                fut: Future = handle
+                if not block and not fut.done():
+                    still.append((episode, handle, conn))
+                    continue
+                res = fut.result()
+
+            res["episode"] = episode
+            done.append(res)
+
+        self._pending = still
+        done.sort(key=lambda r: r["episode"])
+        return done
+
+    def close(self) -> List[Dict[str, Any]]:
+        results = self.drain()
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+            self._pool = None
+        return results
@@ -0,0 +1,289 @@
+# =========================
+# file: src/benchmark.py
+# =========================
+from __future__ import annotations
+
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, replace
+from typing import Any, Callable, Dict, List, Optional, Tuple
+import csv
+import json
+import multiprocessing as mp
+import os
+import platform
+import sys
+import tempfile
+import time
+
+from .core_types import Grid, MazeGenParams, State, TrainingConfig
+from .maze_generator import MazeGenerator
+
+Maze = Tuple[Grid, State, State]
+
+
+# ------------------------
+# Scenario grids
+# ------------------------
+def openField(n: int, seed: int) -> Maze:
+    return [[0] * n for _ in range(n)], (0, 0), (n - 1, n - 1)
+
+
+def denseRandom(n: int, seed: int) -> Maze:
+    return MazeGenerator().generate(MazeGenParams(rows=n, cols=n, wallDensity=0.35, seed=seed))
+
+
+def perfectMaze(n: int, seed: int) -> Maze:
+    return MazeGenerator().generate(MazeGenParams(rows=n, cols=n, seed=seed, algorithm="backtracker"))
+
+
+def spiral(n: int, seed: int) -> Maze:
+    # concentric wall rings, each with one gap on alternating sides, so
+    # the path to the centre winds half way round every ring
+    grid = [[0] * n for _ in range(n)]
+    i = 0
+    while True:
+        lo = 2 * i + 1
+        hi = n - 2 - 2 * i
+        if hi - lo < 2:
+            break
+        for k in range(lo, hi + 1):
+            grid[lo][k] = grid[hi][k] = grid[k][lo] = grid[k][hi] = 1
+        if i % 2 == 0:
+            grid[lo][lo + 1] = 0
+        else:
+            grid[hi][hi - 1] = 0
+        i += 1
+
+    goal = (n // 2, n // 2)
+    grid[goal[0]][goal[1]] = 0
+    return grid, (0, 0), goal
+
+
+def comb(n: int, seed: int) -> Maze:
+    # open top row with dead-end teeth below it; the goal is at the bottom
+    # of the last tooth
+    grid = [[0] * n for _ in range(n)]
+    for c in range(1, n - 1, 2):
+        for r in range(1, n):
+            grid[r][c] = 1
+    return grid, (0, 0), (n - 1, n - 1)
+
+
+@dataclass(frozen=True)
+class Scenario:
+    name: str
+    build: Callable[[int, int], Maze]
+    size: int
+    episodes: int
+    maxSteps: int
+
+
+def _catalog() -> Dict[str, Scenario]:
+    out: Dict[str, Scenario] = {}
+    kinds = (("open", openField), ("dense", denseRandom), ("spiral", spiral), ("comb", comb), ("perfect", perfectMaze))
+    for kind, build in kinds:
+        for size, episodes in ((16, 150), (32, 150), (64, 100)):
+            name = f"{kind}_{size}"
+            out[name] = Scenario(name, build, size, episodes, maxSteps=8 * size * size // 4 + 200)
+    return out
+
+
+SCENARIOS: Dict[str, Scenario] = _catalog()
+
+
+# ------------------------
+# Runner
+# ------------------------
+_WINDOW = 20
+
+
+def _timeToTarget(episodesPath: str, target: float) -> Tuple[Optional[float], Optional[int], int]:
+    # (elapsed_s, episode) when the rolling train success rate over a full
+    # window first reached target, plus the total number of train steps
+    reached: Tuple[Optional[float], Optional[int]] = (None, None)
+    steps = 0
+    seen = 0
+    with open(episodesPath, newline="", encoding="utf-8") as f:
+        for row in csv.DictReader(f):
+            if row["mode"] != "train":
+                continue
+            steps += int(row["steps"])
+            seen += 1
+            if reached[0] is None and seen >= _WINDOW and row.get("sr_window") and float(row["sr_window"]) >= target:
+                reached = (float(row["elapsed_s"]), int(row["episode"]))
+    return reached[0], reached[1], steps
+
+
+def runScenario(name: str, seed: int = 0, config: Optional[TrainingConfig] = None, targetSR: float = 0.8) -> Dict[str, Any]:
+    # one headless MainController run; call in a fresh process for a
+    # meaningful peak RSS
+    from .environment import Environment
+    from .hybrid_agent import HybridAgent
+    from .logger import Logger, logPaths
+    from .main_controller import MainController
+    from .memory_profiler import peakRSS
+    from .planners import makePathfinder
+
+    sc = SCENARIOS[name]
+    grid, start, goal = sc.build(sc.size, seed)
+
+    cfg = replace(
+        config or TrainingConfig(),
+        episodes=sc.episodes,
+        evalEvery=0,
+        maxStepsPerEpisode=sc.maxSteps,
+        visual=False,
+        actors=1,
+        metricsWindows=(_WINDOW,),
+        metricsSummaryPath="",
+        checkpointEvery=0,
+        profileMemory=0,
+    )
+
+    agent = HybridAgent(
+        alpha=cfg.alpha,
+        gamma=cfg.gamma,
+        epsilon=cfg.epsilon,
+        heuristicRate=cfg.heuristicRate,
+        seed=seed,
+        pathfinder=makePathfinder(cfg),
+    )
+
+    with tempfile.TemporaryDirectory(prefix="mazebench_") as tmp:
+        logPath = os.path.join(tmp, "bench.csv")
+        logger = Logger(logPath, console=False)
+        controller = MainController(Environment(grid, start, goal, maxSteps=cfg.maxStepsPerEpisode), agent, None, logger, None)
+
+        t0 = time.perf_counter()
+        try:
+            controller.startTraining(cfg)
+        finally:
+            logger.close()
+        wall = time.perf_counter() - t0
+
+        tts, ttsEpisode, steps = _timeToTarget(logPaths(logPath)[1], targetSR)
+
+    episodes = cfg.episodes
+    return {
+        "scenario": name,
+        "seed": seed,
+        "episodes": episodes,
+        "wall_s": round(wall, 4),
+        "episodes_per_s": round(episodes / wall, 3),
+        "steps_per_s": round(steps / wall, 1),
+        "env_steps": steps,
+        "astar_calls_per_episode": round(agent.pathfinder.queries / episodes, 3),
+        "peak_rss_mb": round((peakRSS() or 0) / 2 ** 20, 1),
+        "time_to_target_s": tts,
+        "episodes_to_target": ttsEpisode,
+        "final_success_rate": round(controller.metrics.successRate("train"), 3),
+    }
+
+
+def runBenchmarks(names: List[str], seed: int = 0, config: Optional[TrainingConfig] = None, isolate: bool = True) -> Dict[str, Any]:
+    results: Dict[str, Any] = {}
+    for name in names:
+        if name not in SCENARIOS:
+            raise ValueError(f"Unknown scenario: {name}")
+
+        if isolate:
+            # spawn rather than fork: a forked child starts with the
+            # parent's ru_maxrss
+            ctx = mp.get_context("spawn")
+            with ProcessPoolExecutor(max_workers=1, mp_context=ctx) as ex:
+                results[name] = ex.submit(runScenario, name, seed, config).result()
+        else:
+            results[name] = runScenario(name, seed, config)
+
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "seed": seed,
+            "planner": (config or TrainingConfig()).planner,
+        },
+        "results": results,
+    }
+
+
+# higher is better for these; lower for the rest
+_HIGHER = ("episodes_per_s", "steps_per_s", "final_success_rate")
+_COMPARED = (
+    "episodes_per_s",
+    "steps_per_s",
+    "astar_calls_per_episode",
+    "peak_rss_mb",
+    "time_to_target_s",
+    "final_success_rate",
+)
+
+
+def compareResults(base: Dict[str, Any], new: Dict[str, Any], threshold: float = 0.10) -> List[Dict[str, Any]]:
+    # per scenario and metric: new / base and whether it is a regression
+    rows = []
+    for name, b in base["results"].items():
+        n = new["results"].get(name)
+        if n is None:
+            continue
+        for key in _COMPARED:
+            bv, nv = b.get(key), n.get(key)
+            if key == "time_to_target_s" and bv is not None and nv is None:
+                # the new run never reached the target the base run did
+                rows.append({"scenario": name, "metric": key, "base": bv, "new": None, "ratio": None, "regression": True})
+                continue
+            if not bv or nv is None:
+                continue
+            ratio = nv / bv
+            worse = ratio < 1 - threshold if key in _HIGHER else ratio > 1 + threshold
+            rows.append({"scenario": name, "metric": key, "base": bv, "new": nv, "ratio": round(ratio, 3), "regression": worse})
+    return rows
+
+
+def main() -> None:
+    import argparse
+
+    p = argparse.ArgumentParser(description="End-to-end training benchmark over a scenario catalog")
+    p.add_argument("--scenarios", type=str, default="open_16,dense_32,spiral_32,comb_32,perfect_32",
+                   help="comma separated names, or 'all'")
+    p.add_argument("--out", type=str, default="benchmark.json")
+    p.add_argument("--seed", type=int, default=0)
+    p.add_argument("--planner", type=str, default="astar", choices=["astar", "hpa", "alt", "corridor"])
+    p.add_argument("--list", type=int, default=0)
+    p.add_argument("--compare", nargs=2, metavar=("BASE", "NEW"))
+    p.add_argument("--threshold", type=float, default=0.10)
+    args = p.parse_args()
+
+    if args.list:
+        for sc in SCENARIOS.values():
+            print(f"{sc.name:14s} size={sc.size} episodes={sc.episodes} maxSteps={sc.maxSteps}")
+        return
+
+    if args.compare:
+        with open(args.compare[0], encoding="utf-8") as f:
+            base = json.load(f)
+        with open(args.compare[1], encoding="utf-8") as f:
+            new = json.load(f)
+        rows = compareResults(base, new, args.threshold)
+        for r in rows:
+            flag = "  REGRESSION" if r["regression"] else ""
+            ratio = "never" if r["ratio"] is None else f"x{r['ratio']:.3f}"
+            print(f"{r['scenario']:14s} {r['metric']:24s} {r['base']:>10} -> {str(r['new']):>10}  {ratio}{flag}")
+        if any(r["regression"] for r in rows):
+            sys.exit(1)
+        return
+
+    names = list(SCENARIOS) if args.scenarios == "all" else [s.strip() for s in args.scenarios.split(",") if s.strip()]
+    report = runBenchmarks(names, args.seed, TrainingConfig(planner=args.planner))
+    with open(args.out, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+
+    for name, r in report["results"].items():
+        print(
+            f"{name:14s} {r['episodes_per_s']:8.2f} ep/s {r['steps_per_s']:10.1f} steps/s "
+            f"A*/ep={r['astar_calls_per_episode']:7.2f} rss={r['peak_rss_mb']}MB tts={r['time_to_target_s']}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,164 @@
+# =========================
+# file: src/checkpoint.py
+# =========================
+from __future__ import annotations
+
+from array import array
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+import os
+import pickle
+import struct
+
+from .core_types import State
+
+MANIFEST = "checkpoint.pkl"
+
+_MAGIC = b"QTB1"
+_HEADER = struct.Struct("<4sQ")
+
+
+def encodeRows(qTable: Dict[State, List[float]], states: Iterable[State]) -> bytes:
+    # header + int32 (r, c) pairs + float64 Q rows, in the same order
+    cells = array("i")
+    values = array("d")
+    for s in states:
+        row = qTable.get(s)
+        if row is None:
+            continue
+        cells.append(s[0])
+        cells.append(s[1])
+        values.extend(row)
+    return _HEADER.pack(_MAGIC, len(cells) // 2) + cells.tobytes() + values.tobytes()
+
+
+def decodeRows(data: bytes, into: Dict[State, List[float]]) -> None:
+    magic, count = _HEADER.unpack_from(data)
+    if magic != _MAGIC:
+        raise ValueError("not a Q-table checkpoint file")
+
+    cells = array("i")
+    values = array("d")
+    off = _HEADER.size
+    cells.frombytes(data[off:off + 2 * count * cells.itemsize])
+    off += 2 * count * cells.itemsize
+    values.frombytes(data[off:off + 4 * count * values.itemsize])
+
+    for k in range(count):
+        into[(cells[2 * k], cells[2 * k + 1])] = values[4 * k:4 * k + 4].tolist()
+
+
+def atomicWrite(path: str, data: bytes) -> None:
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
+class CheckpointManager:
+    # Incremental checkpoints in one directory:
+    # - q_base_NNNNNN.bin      full Q-table
+    # - q_delta_NNNNNN.bin     rows changed since the previous checkpoint
+    # - checkpoint.pkl         manifest: file list + caller state (pickled)
+    # Each file is written to a tmp name and renamed; the manifest goes
+    # last, so a crash leaves the previous checkpoint intact. Rows are
+    # encoded on the calling thread (O(changed states)); disk writes run on
+    # a single worker thread, in order. After compactEvery deltas the next
+    # save writes a fresh base instead.
+
+    def __init__(self, directory: str, compactEvery: int = 20) -> None:
+        self.directory: str = directory
+        self.compactEvery: int = max(1, int(compactEvery))
+
+        self.base: Optional[str] = None
+        self.deltas: List[str] = []
+        self.saves: int = 0
+
+        self._seq: int = 0
+        self._writer: Optional[ThreadPoolExecutor] = None
+        self._pending: List[Future] = []
+
+        os.makedirs(directory, exist_ok=True)
+
+    def exists(self) -> bool:
+        return os.path.exists(os.path.join(self.directory, MANIFEST))
+
+    def save(
+        self,
+        qTable: Dict[State, List[float]],
+        changed: Iterable[State],
+        state: Dict[str, Any],
+    ) -> None:
+        self._raiseErrors()
+
+        obsolete: List[str] = []
+        self._seq += 1
+        if self.base is None or len(self.deltas) >= self.compactEvery:
+            name = f"q_base_{self._seq:06d}.bin"
+            data = encodeRows(qTable, list(qTable))
+            obsolete = ([self.base] if self.base else []) + self.deltas
+            self.base = name
+            self.deltas = []
+        else:
+            name = f"q_delta_{self._seq:06d}.bin"
+            data = encodeRows(qTable, changed)
+            self.deltas.append(name)
+
+        manifest = pickle.dumps(
+            {"version": 1, "seq": self._seq, "base": self.base, "deltas": list(self.deltas), "state": state},
+            protocol=pickle.HIGHEST_PROTOCOL,
+        )
+
+        if self._writer is None:
+            self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="checkpoint")
+        self._pending = [f for f in self._pending if not f.done()]
+        self._pending.append(self._writer.submit(self._write, name, data, manifest, obsolete))
+        self.saves += 1
+
+    def _write(self, name: str, data: bytes, manifest: bytes, obsolete: List[str]) -> None:
+        atomicWrite(os.path.join(self.directory, name), data)
+        atomicWrite(os.path.join(self.directory, MANIFEST), manifest)
+        for old in obsolete:
+            try:
+                os.remove(os.path.join(self.directory, old))
+            except FileNotFoundError:
+                pass
+
+    def load(self) -> Optional[Tuple[Dict[State, List[float]], Dict[str, Any]]]:
+        # (qTable, state) of the last complete checkpoint, or None
+        path = os.path.join(self.directory, MANIFEST)
+        if not os.path.exists(path):
+            return None
+
+        with open(path, "rb") as f:
+            manifest = pickle.load(f)
+
+        qTable: Dict[State, List[float]] = {}
+        for name in [manifest["base"]] + manifest["deltas"]:
+            with open(os.path.join(self.directory, name), "rb") as f:
+                decodeRows(f.read(), qTable)
+
+        # continue the same file sequence
+        self.base = manifest["base"]
+        self.deltas = list(manifest["deltas"])
+        self._seq = manifest["seq"]
+        return qTable, manifest["state"]
+
+    def wait(self) -> None:
+        for f in self._pending:
+            f.result()
+        self._pending = []
+
+    def _raiseErrors(self) -> None:
+        for f in self._pending:
+            if f.done() and f.exception() is not None:
+                self._pending.remove(f)
+                raise f.exception()
+
+    def close(self) -> None:
+        if self._writer is not None:
+            self._writer.shutdown(wait=True)
+            self._writer = None
+        self.wait()
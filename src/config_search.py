@@ -0,0 +1,334 @@
+# =========================
+# file: src/config_search.py
+# =========================
+from __future__ import annotations
+
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field, replace
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+import itertools
+import json
+import math
+import random
+import time
+
+from .async_evaluator import Maze, evaluateMazes
+from .core_types import State, TrainingConfig
+
+# TrainingConfig fields a search may vary
+SEARCH_FIELDS = ("alpha", "gamma", "epsilon", "heuristicRate")
+
+
+@dataclass
+class Trial:
+    # one configuration and the training state it carries between rungs
+    trialId: int
+    params: Dict[str, float]
+    seed: int
+    episodes: int = 0
+    envSteps: int = 0
+    cpuS: float = 0.0
+    qTable: Dict[State, List[float]] = field(default_factory=dict)
+    rngState: Any = None
+    # (eval success rate, -mean eval steps, -mean train steps of the last rung);
+    # the train steps separate trials that all still fail the greedy eval
+    score: Tuple[float, float, float] = (0.0, 0.0, 0.0)
+    history: List[Dict[str, Any]] = field(default_factory=list)
+
+
+def runTrial(
+    maze: Maze,
+    evalMazes: List[Maze],
+    config: TrainingConfig,
+    qTable: Dict[State, List[float]],
+    rngState: Any,
+    seed: int,
+    episodes: int,
+) -> Dict[str, Any]:
+    # trains `episodes` more headless episodes from the given Q-table / RNG
+    # state, then evaluates greedily (runs in a worker process)
+    from .environment import Environment
+    from .hybrid_agent import HybridAgent
+    from .main_controller import MainController
+    from .planners import makePathfinder
+
+    t0 = time.process_time()
+    grid, start, goal = maze
+    agent = HybridAgent(
+        alpha=config.alpha,
+        gamma=config.gamma,
+        epsilon=config.epsilon,
+        heuristicRate=config.heuristicRate,
+        seed=seed,
+        pathfinder=makePathfinder(config),
+    )
+    agent.qTable = qTable
+    if rngState is not None:
+        agent._rng.setstate(rngState)
+
+    controller = MainController(Environment(grid, start, goal, maxSteps=config.maxStepsPerEpisode), agent, None, None, None)
+    controller.startTraining(replace(config, episodes=episodes))
+
+    ev = evaluateMazes(agent.qTable, [maze] + list(evalMazes), config.maxStepsPerEpisode, config.options)
+    runs = ev["runs"]
+    return {
+        "qTable": agent.qTable,
+        "rngState": agent._rng.getstate(),
+        "envSteps": controller.envSteps,
+        "cpu_s": time.process_time() - t0,
+        "success_rate": ev["success_rate"],
+        "eval_steps": sum(r["steps"] for r in runs) / max(1, len(runs)),
+    }
+
+
+def sampleConfigs(space: Dict[str, Sequence[float]], n: int, seed: int = 0) -> List[Dict[str, float]]:
+    # the full grid when it has at most n points, else n distinct samples
+    names = list(space)
+    grid = [dict(zip(names, values)) for values in itertools.product(*(space[k] for k in names))]
+    if len(grid) <= n:
+        return grid
+    return random.Random(seed).sample(grid, n)
+
+
+def hyperbandBrackets(maxEpisodes: int, minEpisodes: int, eta: int) -> List[Tuple[int, int]]:
+    # (configs, first-rung episodes) per bracket, most exploratory first;
+    # each bracket spends about the same total budget
+    sMax = max(0, int(math.floor(math.log(max(1, maxEpisodes // max(1, minEpisodes))) / math.log(eta) + 1e-9)))
+    out = []
+    for s in range(sMax, -1, -1):
+        n = int(math.ceil((sMax + 1) / (s + 1) * eta ** s))
+        out.append((n, max(1, int(round(maxEpisodes / eta ** s)))))
+    return out
+
+
+class SuccessiveHalving:
+    # Successive halving over TrainingConfig variants: every trial trains
+    # minEpisodes, the best 1/eta by eval success (ties: fewer eval steps,
+    # then fewer train steps per episode) continue to eta x the episodes,
+    # and so on up to maxEpisodes. Survivors keep their Q-table and RNG
+    # state, so a rung only trains the extra episodes. Trials of a rung run
+    # in parallel worker processes.
+
+    def __init__(
+        self,
+        maze: Maze,
+        base: TrainingConfig,
+        evalMazes: Optional[List[Maze]] = None,
+        eta: int = 3,
+        minEpisodes: int = 20,
+        maxEpisodes: int = 540,
+        workers: int = 1,
+        seed: int = 0,
+        logger: Any = None,
+    ) -> None:
+        self.maze: Maze = maze
+        self.base: TrainingConfig = replace(
+            base,
+            evalEvery=0,
+            visual=False,
+            interactive=False,
+            actors=1,
+            checkpointEvery=0,
+            resume=False,
+            profileMemory=0,
+            heatmapEvery=0,
+            metricsSummaryPath="",
+            asyncEval=False,
+        )
+        self.evalMazes: List[Maze] = list(evalMazes or [])
+        self.eta: int = max(2, int(eta))
+        self.minEpisodes: int = max(1, int(minEpisodes))
+        self.maxEpisodes: int = max(self.minEpisodes, int(maxEpisodes))
+        self.workers: int = max(1, int(workers))
+        self.seed: int = seed
+        self.logger = logger
+
+        self.trials: List[Trial] = []
+        self.rungs: List[Dict[str, Any]] = []
+
+    def _info(self, msg: str) -> None:
+        if self.logger is not None:
+            self.logger.info(msg)
+
+    def _config(self, trial: Trial) -> TrainingConfig:
+        return replace(self.base, **trial.params)
+
+    def _train(self, pool: Optional[ProcessPoolExecutor], trials: List[Trial], target: int) -> None:
+        jobs = []
+        for t in trials:
+            args = (self.maze, self.evalMazes, self._config(t), t.qTable, t.rngState, t.seed, target - t.episodes)
+            jobs.append((t, pool.submit(runTrial, *args) if pool is not None else None, args))
+
+        for t, fut, args in jobs:
+            res = fut.result() if fut is not None else runTrial(*args)
+            t.qTable = res["qTable"]
+            t.rngState = res["rngState"]
+            t.envSteps += res["envSteps"]
+            t.cpuS += res["cpu_s"]
+            trainSteps = res["envSteps"] / max(1, target - t.episodes)
+            t.episodes = target
+            t.score = (res["success_rate"], -res["eval_steps"], -trainSteps)
+            t.history.append({
+                "episodes": target,
+                "success_rate": res["success_rate"],
+                "eval_steps": res["eval_steps"],
+                "train_steps": round(trainSteps, 1),
+            })
+
+    def bracket(self, configs: List[Dict[str, float]], minEpisodes: int, pool: Optional[ProcessPoolExecutor]) -> Trial:
+        alive = []
+        for params in configs:
+            t = Trial(len(self.trials), dict(params), self.seed + len(self.trials))
+            self.trials.append(t)
+            alive.append(t)
+
+        target = minEpisodes
+        while True:
+            t0 = time.time()
+            self._train(pool, alive, target)
+            alive.sort(key=lambda t: t.score, reverse=True)
+            best = alive[0]
+            self.rungs.append({
+                "episodes": target,
+                "trials": len(alive),
+                "wall_s": round(time.time() - t0, 3),
+                "best": best.trialId,
+                "best_success_rate": best.score[0],
+            })
+            self._info(
+                f"[SEARCH] rung episodes={target} trials={len(alive)} best=#{best.trialId} {best.params} "
+                f"evalSR={best.score[0]:.2f} evalSteps={-best.score[1]:.0f}"
+            )
+
+            if len(alive) == 1 or target >= self.maxEpisodes:
+                return best
+            alive = alive[:max(1, len(alive) // self.eta)]
+            target = min(self.maxEpisodes, target * self.eta)
+
+    def run(self, configs: List[Dict[str, float]], hyperband: bool = False) -> Dict[str, Any]:
+        t0 = time.time()
+        pool = ProcessPoolExecutor(max_workers=self.workers) if self.workers > 1 else None
+        try:
+            if hyperband:
+                winners = []
+                offset = 0
+                for n, first in hyperbandBrackets(self.maxEpisodes, self.minEpisodes, self.eta):
+                    chunk = [configs[(offset + i) % len(configs)] for i in range(min(n, len(configs)))]
+                    offset += len(chunk)
+                    winners.append(self.bracket(chunk, first, pool))
+                best = max(winners, key=lambda t: (t.episodes, t.score))
+            else:
+                best = self.bracket(configs, self.minEpisodes, pool)
+        finally:
+            if pool is not None:
+                pool.shutdown()
+
+        report = self.report(best, time.time() - t0)
+        self._info(
+            f"[SEARCH] winner #{best.trialId} {best.params} evalSR={best.score[0]:.2f} "
+            f"episodes={report['compute']['episodes']} (full sweep {report['compute']['full_sweep_episodes']})"
+        )
+        return report
+
+    def report(self, best: Trial, wallS: float) -> Dict[str, Any]:
+        episodes = sum(t.episodes for t in self.trials)
+        return {
+            "winner": {
+                "trial": best.trialId,
+                "params": best.params,
+                "episodes": best.episodes,
+                "success_rate": best.score[0],
+                "eval_steps": -best.score[1],
+            },
+            "compute": {
+                "trials": len(self.trials),
+                "episodes": episodes,
+                "env_steps": sum(t.envSteps for t in self.trials),
+                "cpu_s": round(sum(t.cpuS for t in self.trials), 3),
+                "wall_s": round(wallS, 3),
+                "full_sweep_episodes": len(self.trials) * self.maxEpisodes,
+            },
+            "rungs": self.rungs,
+            "trials": [
+                {"trial": t.trialId, "params": t.params, "episodes": t.episodes, "history": t.history}
+                for t in self.trials
+            ],
+        }
+
+
+def main() -> None:
+    import argparse
+
+    from .core_types import MazeGenParams
+    from .logger import Logger
+    from .maze_generator import MazeGenerator
+
+    def floats(text: str) -> List[float]:
+        return [float(x) for x in text.split(",") if x.strip()]
+
+    p = argparse.ArgumentParser(description="Successive-halving / Hyperband search over training configs")
+    p.add_argument("--alpha", type=str, default="0.05,0.1,0.2,0.4")
+    p.add_argument("--gamma", type=str, default="0.99")
+    p.add_argument("--epsilon", type=str, default="0.05,0.1,0.2,0.3")
+    p.add_argument("--heuristicRate", type=str, default="0.0,0.2,0.4")
+    p.add_argument("--configs", type=int, default=27, help="configs to sample from the grid")
+    p.add_argument("--eta", type=int, default=3)
+    p.add_argument("--minEpisodes", type=int, default=20)
+    p.add_argument("--maxEpisodes", type=int, default=540)
+    p.add_argument("--hyperband", type=int, default=0, help="1 = run all Hyperband brackets")
+    p.add_argument("--workers", type=int, default=4)
+    p.add_argument("--rows", type=int, default=25)
+    p.add_argument("--cols", type=int, default=25)
+    p.add_argument("--wallDensity", type=float, default=0.25)
+    p.add_argument("--mazeAlgorithm", type=str, default="random")
+    p.add_argument("--evalMazes", type=int, default=0)
+    p.add_argument("--maxSteps", type=int, default=600)
+    p.add_argument("--planner", type=str, default="astar", choices=["astar", "hpa", "alt", "corridor"])
+    p.add_argument("--options", type=int, default=0)
+    p.add_argument("--seed", type=int, default=0)
+    p.add_argument("--out", type=str, default="config_search.json")
+    args = p.parse_args()
+
+    genParams = MazeGenParams(
+        rows=args.rows,
+        cols=args.cols,
+        wallDensity=args.wallDensity,
+        seed=args.seed,
+        algorithm=args.mazeAlgorithm,
+    )
+    mazeGen = MazeGenerator()
+    maze = mazeGen.generate(genParams)
+    evalMazes = [mazeGen.generate(replace(genParams, seed=args.seed + 1 + i)) for i in range(args.evalMazes)]
+
+    space = {name: floats(getattr(args, name)) for name in SEARCH_FIELDS}
+    configs = sampleConfigs(space, args.configs, args.seed)
+
+    base = TrainingConfig(
+        maxStepsPerEpisode=args.maxSteps,
+        planner=args.planner,
+        options=bool(args.options),
+    )
+    logger = Logger(args.out + ".log.csv", console=True)
+    try:
+        search = SuccessiveHalving(
+            maze,
+            base,
+            evalMazes,
+            eta=args.eta,
+            minEpisodes=args.minEpisodes,
+            maxEpisodes=args.maxEpisodes,
+            workers=args.workers,
+            seed=args.seed,
+            logger=logger,
+        )
+        report = search.run(configs, hyperband=bool(args.hyperband))
+    finally:
+        logger.close()
+
+    with open(args.out, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(json.dumps({"winner": report["winner"], "compute": report["compute"]}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
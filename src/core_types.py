@@ -41,6 +41,10 @@ class MazeGenParams:
     seed: Optional[int] = 42
     maxTries: int = 250
 
+    # "random" = wall noise + A* rejection; "backtracker", "kruskal" and
+    # "wilson" build perfect mazes that are solvable by construction
+    algorithm: str = "random"
+
 
 @dataclass
 class TrainingConfig:
@@ -52,8 +56,45 @@ class TrainingConfig:
     epsilon: float = 0.25
     heuristicRate: float = 0.30
 
+    # exploration schedules ("constant", "linear", "exp", "cosine") from
+    # epsilon / heuristicRate down to the *End values over scheduleEpisodes
+    # (0 = episodes); adaptiveExploration scales both by the eval success rate
+    epsilonSchedule: str = "constant"
+    epsilonEnd: float = 0.05
+    heuristicSchedule: str = "constant"
+    heuristicRateEnd: float = 0.0
+    scheduleEpisodes: int = 0
+    adaptiveExploration: bool = False
+    adaptiveTargetSR: float = 0.8
+    adaptiveGain: float = 0.5
+
     maxStepsPerEpisode: int = 600
 
+    # corridor options: the agent decides only at junctions / dead ends and
+    # follows corridors in between (SMDP Q-learning, one update per option)
+    options: bool = False
+
+    # experience replay (replayCapacity 0 = off): after every train episode
+    # replayBatches batches of replayBatch stored transitions are replayed
+    replayCapacity: int = 0
+    replayBatch: int = 64
+    replayBatches: int = 4
+    replayPrioritized: bool = False
+
+    # background evaluation on Q-table snapshots ("fork", "thread" or "auto")
+    asyncEval: bool = False
+    evalMode: str = "auto"
+
+    # A* guidance planner: "astar" (flat), "hpa" (hierarchical, clusterSize
+    # cells), "alt" (landmark heuristic with `landmarks` BFS tables) or
+    # "corridor" (search on the junction graph with corridors contracted)
+    planner: str = "astar"
+    clusterSize: int = 16
+    landmarks: int = 8
+    # Unix socket of a running path service (python -m src.path_service);
+    # "" = plan in process
+    pathService: str = ""
+
     # UI
     visual: bool = False
     cellSize: int = 28
@@ -61,6 +102,44 @@ class TrainingConfig:
 
     # interactive training controls (visual mode)
     interactive: bool = True
+    uiPollInterval: float = 0.05   # seconds between input polls while running
+    pauseWaitMs: int = 250         # max block on the event queue while paused
 
     # logging
     logFilePath: str = "training_logs.csv"
+
+    # tracemalloc memory timeline every N episodes (0 = off)
+    profileMemory: int = 0
+    profileDir: str = "./data/memory"
+
+    # incremental checkpoints every N episodes (0 = off); resume continues
+    # from the last one in checkpointDir, cutting the logs back to it
+    checkpointEvery: int = 0
+    checkpointDir: str = "./data/checkpoints"
+    resume: bool = False
+
+    # step log rotation (0 = off), closed segments are gzipped in the background
+    rotateBytes: int = 0
+    rotateEpisodes: int = 0
+    compressLogs: bool = True
+
+    # actor-learner training (actors > 1 runs that many actor processes)
+    actors: int = 1
+    actorRefreshEvery: int = 5     # actor episodes between Q snapshot refreshes
+    publishEvery: int = 10         # learner episodes between Q publishes
+
+    # per-cell heatmaps (0 = off): arrays + PNGs every N episodes
+    heatmapEvery: int = 0
+    heatmapDir: str = "./data/heatmaps"
+
+    # telemetry (console output and metrics off the training thread)
+    asyncConsole: bool = False
+    consoleInterval: float = 0.5
+    metricsPath: str = ""
+
+    # streaming episode metrics: rolling windows (the first one drives the
+    # HUD / log success rate), EMA smoothing and an optional JSON summary
+    metricsWindows: Tuple[int, ...] = (50,)
+    metricsEmaAlpha: float = 0.05
+    metricsSummaryPath: str = ""
+    metricsSummaryEvery: int = 50
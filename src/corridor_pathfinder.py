@@ -0,0 +1,335 @@
+# =========================
+# file: src/corridor_pathfinder.py
+# =========================
+from __future__ import annotations
+
+from array import array
+from typing import Any, Dict, List, Optional, Set, Tuple
+import heapq
+import random
+import time
+
+from .core_types import Grid, State
+from .move_masks import DEGREE, VALID_ACTIONS, MoveMasks, movesFor
+from .pathfinder import Path, Pathfinder
+
+
+class CorridorGraph:
+    # Contracted graph of one grid:
+    # - nodes are free cells whose degree is not 2 (junctions, dead ends),
+    #   plus one cell of every cycle made only of degree-2 cells
+    # - each maximal run of degree-2 cells between two nodes becomes one
+    #   edge weighted by its length; its interior cells are kept in order
+    #   (from edgeU's side) so paths can be expanded again
+    # Every corridor cell knows its edge and its distance from edgeU, which
+    # is how queries starting or ending mid-corridor attach to the graph.
+
+    def __init__(self, masks: MoveMasks) -> None:
+        self.masks: MoveMasks = masks
+        n = masks.rows * masks.cols
+
+        self.nodeCell = array("i")
+        self.nodeOf = array("i", [-1]) * n
+        self.adj: List[List[Tuple[int, int, int]]] = []  # (other node, weight, edge)
+
+        self.edgeU = array("i")
+        self.edgeV = array("i")
+        self.edgeW = array("i")
+        self.edgeStart = array("i")
+        self.edgeCells = array("i")
+        self.edgeOf = array("i", [-1]) * n
+        self.posOf = array("i", bytes(array("i").itemsize * n))
+
+        t0 = time.perf_counter()
+        self._build()
+        self.build_s: float = time.perf_counter() - t0
+
+    def _addNode(self, cell: int) -> int:
+        k = len(self.nodeCell)
+        self.nodeCell.append(cell)
+        self.nodeOf[cell] = k
+        self.adj.append([])
+        return k
+
+    def _build(self) -> None:
+        masks = self.masks
+        cellMasks = masks.masks
+        grid = masks.grid
+        cols = masks.cols
+
+        free = [i for i in range(masks.rows * cols) if grid[i // cols][i % cols] == 0]
+        for i in free:
+            if DEGREE[cellMasks[i]] != 2:
+                self._addNode(i)
+
+        for k in range(len(self.nodeCell)):
+            self._walkFrom(k)
+
+        # cycles without any junction
+        for i in free:
+            if self.nodeOf[i] < 0 and self.edgeOf[i] < 0:
+                self._walkFrom(self._addNode(i))
+
+    def _walkFrom(self, u: int) -> None:
+        masks = self.masks
+        cellMasks = masks.masks
+        offsets = masks.offsets
+        nodeOf = self.nodeOf
+        edgeOf = self.edgeOf
+        start = self.nodeCell[u]
+
+        for a in VALID_ACTIONS[cellMasks[start]]:
+            prev = start
+            cur = start + offsets[a]
+            if edgeOf[cur] >= 0:
+                continue  # corridor already walked from its other end
+            v = nodeOf[cur]
+            if v >= 0 and v < u:
+                continue  # direct node-node edge, added from v
+
+            e = len(self.edgeU)
+            interior = []
+            while v < 0:
+                edgeOf[cur] = e
+                self.posOf[cur] = len(interior) + 1
+                interior.append(cur)
+                for b in VALID_ACTIONS[cellMasks[cur]]:
+                    nxt = cur + offsets[b]
+                    if nxt != prev:
+                        break
+                prev, cur = cur, nxt
+                v = nodeOf[cur]
+
+            w = len(interior) + 1
+            self.edgeU.append(u)
+            self.edgeV.append(v)
+            self.edgeW.append(w)
+            self.edgeStart.append(len(self.edgeCells))
+            self.edgeCells.extend(interior)
+            self.adj[u].append((v, w, e))
+            if v != u:
+                self.adj[v].append((u, w, e))
+
+    @property
+    def nodes(self) -> int:
+        return len(self.nodeCell)
+
+    @property
+    def edges(self) -> int:
+        return len(self.edgeU)
+
+    def attach(self, cell: int) -> List[Tuple[int, int]]:
+        # (node, distance) pairs a cell connects to
+        k = self.nodeOf[cell]
+        if k >= 0:
+            return [(k, 0)]
+        e = self.edgeOf[cell]
+        if e < 0:
+            return []
+        p = self.posOf[cell]
+        return [(self.edgeU[e], p), (self.edgeV[e], self.edgeW[e] - p)]
+
+    def edgeSpan(self, e: int, fromCell: int, toCell: int) -> List[int]:
+        # cells after fromCell up to and including toCell along edge e;
+        # either end may be a node of the edge or one of its interior cells
+        s = self.edgeStart[e]
+        line = [self.nodeCell[self.edgeU[e]]] + self.edgeCells[s:s + self.edgeW[e] - 1].tolist() \
+            + [self.nodeCell[self.edgeV[e]]]
+        # a loop edge touches its node at both ends: take the nearer one
+        i, j = min(
+            ((i, j) for i in self._indices(e, fromCell, line) for j in self._indices(e, toCell, line) if i != j),
+            key=lambda ij: abs(ij[0] - ij[1]),
+        )
+        return line[i + 1:j + 1] if j > i else line[j:i][::-1]
+
+    def _indices(self, e: int, cell: int, line: List[int]) -> Tuple[int, ...]:
+        if self.edgeOf[cell] == e:
+            return (self.posOf[cell],)
+        last = len(line) - 1
+        return tuple(i for i in (0, last) if line[i] == cell)
+
+
+class CorridorPathfinder(Pathfinder):
+    # A* on the contracted corridor graph (CorridorGraph, cached per grid).
+    # Edge weights are exact corridor lengths, so paths are optimal; cells
+    # inside corridors are only visited when the path is expanded.
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._graph: Optional[CorridorGraph] = None
+
+    def graph(self, grid: Grid) -> CorridorGraph:
+        masks = movesFor(grid)
+        g = self._graph
+        if g is None or g.masks is not masks:
+            g = self._graph = CorridorGraph(masks)
+        return g
+
+    def invalidate(self) -> None:
+        # call after editing a cached grid in place
+        self._graph = None
+
+    def getAStarPath(self, grid: Grid, start: State, goal: State) -> Optional[Path]:
+        return self._path(grid, start, goal, legs=-1)
+
+    def nextMove(self, grid: Grid, start: State, goal: State) -> Optional[int]:
+        # expands only the first leg
+        return self.nextMoveFromPath(self._path(grid, start, goal, legs=1))
+
+    def _path(self, grid: Grid, start: State, goal: State, legs: int) -> Optional[Path]:
+        if start == goal:
+            return [start]
+
+        g = self.graph(grid)
+        cols = g.masks.cols
+        s = start[0] * cols + start[1]
+        t = goal[0] * cols + goal[1]
+
+        chain = self._search(g, s, t)
+        if chain is None:
+            return None
+
+        # chain: [(cell, edge used to reach it)], starting at s
+        path: Path = [start]
+        for i in range(1, len(chain) if legs < 0 else min(len(chain), legs + 1)):
+            cell, e = chain[i]
+            path.extend(divmod(x, cols) for x in g.edgeSpan(e, chain[i - 1][0], cell))
+        return path
+
+    def _search(self, g: CorridorGraph, s: int, t: int) -> Optional[List[Tuple[int, int]]]:
+        cols = g.masks.cols
+        sources = g.attach(s)
+        targets = dict()
+        for k, d in g.attach(t):
+            if d < targets.get(k, d + 1):
+                targets[k] = d
+        self.queries += 1
+        if not sources or not targets:
+            self.lastExpansions = 0
+            return None
+
+        # virtual nodes: -1 = start, -2 = goal
+        best: Dict[int, int] = {}
+        parent: Dict[int, Tuple[int, int]] = {}
+        gr, gc = divmod(t, cols)
+        nodeCell = g.nodeCell
+
+        def h(k: int) -> int:
+            r, c = divmod(nodeCell[k], cols)
+            return abs(r - gr) + abs(c - gc)
+
+        heap: List[Tuple[int, int, int]] = []
+        se = g.edgeOf[s]
+        if se >= 0 and se == g.edgeOf[t]:
+            # same corridor: the direct run is one candidate
+            best[-2] = abs(g.posOf[s] - g.posOf[t])
+            parent[-2] = (-1, se)
+            heapq.heappush(heap, (best[-2], best[-2], -2))
+        for k, d in sources:
+            if d < best.get(k, d + 1):
+                best[k] = d
+                parent[k] = (-1, se)
+                heapq.heappush(heap, (d + h(k), d, k))
+
+        closed: Set[int] = set()
+        expansions = 0
+        while heap:
+            _, d, k = heapq.heappop(heap)
+            if k in closed or d != best.get(k):
+                continue
+            closed.add(k)
+            expansions += 1
+            if k == -2:
+                break
+
+            edges = list(g.adj[k])
+            if k in targets:
+                edges.append((-2, targets[k], g.edgeOf[t]))
+            for m, w, e in edges:
+                nd = d + w
+                if nd < best.get(m, nd + 1):
+                    best[m] = nd
+                    parent[m] = (k, e)
+                    heapq.heappush(heap, (nd + (0 if m == -2 else h(m)), nd, m))
+
+        self.lastExpansions = expansions
+        self.totalExpansions += expansions
+        if -2 not in closed:
+            return None
+
+        chain: List[Tuple[int, int]] = []
+        k = -2
+        while k != -1:
+            prev, e = parent[k]
+            chain.append((t if k == -2 else nodeCell[k], e))
+            k = prev
+        chain.append((s, -1))
+        chain.reverse()
+
+        # drop zero-length hops where the start or goal is itself a node
+        return [step for i, step in enumerate(chain) if i == 0 or step[0] != chain[i - 1][0]]
+
+
+def compareWithFlat(grid: Grid, queries: List[Tuple[State, State]]) -> Dict[str, Any]:
+    # expansions and latency of the contracted search vs flat A*
+    flat = Pathfinder()
+    cor = CorridorPathfinder()
+    graph = cor.graph(grid)
+
+    out: Dict[str, Any] = {
+        "queries": len(queries),
+        "free_cells": sum(1 for row in grid for v in row if v == 0),
+        "nodes": graph.nodes,
+        "edges": graph.edges,
+        "build_s": round(graph.build_s, 4),
+    }
+
+    results = {}
+    for name, pf in (("flat", flat), ("corridor", cor)):
+        lengths = []
+        t0 = time.perf_counter()
+        for start, goal in queries:
+            path = pf.getAStarPath(grid, start, goal)
+            lengths.append(len(path) if path is not None else -1)
+        elapsed = time.perf_counter() - t0
+        n = max(1, len(queries))
+        out[name] = {"expansions": pf.totalExpansions / n, "latency_ms": 1000.0 * elapsed / n}
+        results[name] = lengths
+
+    out["same_lengths"] = results["flat"] == results["corridor"]
+    return out
+
+
+def main() -> None:
+    import argparse
+    import json
+
+    from .core_types import MazeGenParams
+    from .maze_generator import MazeGenerator
+
+    p = argparse.ArgumentParser(description="Corridor-contracted vs flat A* on random queries")
+    p.add_argument("--rows", type=int, default=201)
+    p.add_argument("--cols", type=int, default=201)
+    p.add_argument("--wallDensity", type=float, default=0.25)
+    p.add_argument("--mazeAlgorithm", type=str, default="backtracker")
+    p.add_argument("--queries", type=int, default=100)
+    p.add_argument("--seed", type=int, default=42)
+    args = p.parse_args()
+
+    grid, _, _ = MazeGenerator().generate(MazeGenParams(
+        rows=args.rows,
+        cols=args.cols,
+        wallDensity=args.wallDensity,
+        seed=args.seed,
+        algorithm=args.mazeAlgorithm,
+    ))
+
+    rng = random.Random(args.seed)
+    free = [(r, c) for r in range(len(grid)) for c in range(len(grid[0])) if grid[r][c] == 0]
+    queries = [(rng.choice(free), rng.choice(free)) for _ in range(args.queries)]
+
+    print(json.dumps(compareWithFlat(grid, queries), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -5,6 +5,7 @@ from __future__ import annotations
 
 from typing import Tuple
 from .core_types import Grid, State, Action
+from .move_masks import DELTA_C, DELTA_R, VALID_ACTIONS, MoveMasks, isCached, movesFor
 
 
 class Environment:
@@ -28,6 +29,25 @@ class Environment:
         self._collisionPenalty: float = -10.0
         self._stepPenalty: float = -1.0
 
+        # legal-move bitmask per cell, shared with Pathfinder / HybridAgent
+        self._moves: MoveMasks = movesFor(gridMatrix)
+
+    def moves(self) -> MoveMasks:
+        # checked against the cache, so invalidateMoves() after an in-place
+        # grid edit reaches existing environments too
+        m = self._moves
+        if m.grid is not self.gridMatrix or not isCached(m):
+            m = self._moves = movesFor(self.gridMatrix)
+        return m
+
+    def moveMask(self) -> int:
+        if self._done:
+            return 0
+        return self.moves().mask(self.agentPos[0], self.agentPos[1])
+
+    def validActions(self) -> Tuple[int, ...]:
+        return VALID_ACTIONS[self.moveMask()]
+
     def reset(self) -> State:
         self.agentPos = self._startPos
         self._steps = 0
@@ -38,16 +58,10 @@ class Environment:
         if self._done:
             return False
 
-        dr, dc = Action.delta(action)
-        nr = self.agentPos[0] + dr
-        nc = self.agentPos[1] + dc
-
-        if nr < 0 or nc < 0:
-            return False
-        if nr >= len(self.gridMatrix) or nc >= len(self.gridMatrix[0]):
-            return False
+        if action not in Action.ALL:
+            Action.delta(action)  # raises ValueError
 
-        return self.gridMatrix[nr][nc] == 0
+        return bool(self.moveMask() >> action & 1)
 
     def step(self, action: int) -> Tuple[State, float, bool]:
         if self._done:
@@ -56,8 +70,7 @@ class Environment:
         self._steps += 1
 
         if self.isValidMove(action):
-            dr, dc = Action.delta(action)
-            self.agentPos = (self.agentPos[0] + dr, self.agentPos[1] + dc)
+            self.agentPos = (self.agentPos[0] + DELTA_R[action], self.agentPos[1] + DELTA_C[action])
 
             if self.agentPos == self.goalPos:
                 self._done = True
@@ -0,0 +1,146 @@
+# =========================
+# file: src/experience_replay.py
+# =========================
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Optional, Tuple
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from .hybrid_agent import HybridAgent
+
+
+class ReplayBuffer:
+    # Fixed-capacity ring buffer of transitions in preallocated arrays.
+    # States are flat cell ids (r * cols + c). terminal marks transitions
+    # into the goal (no bootstrap); step-limit ends still bootstrap, as in
+    # HybridAgent.updateQ.
+    # Sampling is uniform, or proportional to priority ** alpha with
+    # importance weights (N * P) ** -beta when prioritized.
+
+    def __init__(
+        self,
+        capacity: int,
+        prioritized: bool = False,
+        alpha: float = 0.6,
+        beta: float = 0.4,
+        seed: Optional[int] = None,
+    ) -> None:
+        self.capacity: int = max(1, int(capacity))
+        self.prioritized: bool = prioritized
+        self.alpha: float = alpha
+        self.beta: float = beta
+
+        self.state = np.zeros(self.capacity, dtype=np.int32)
+        self.action = np.zeros(self.capacity, dtype=np.int8)
+        self.reward = np.zeros(self.capacity, dtype=np.float64)
+        self.nextState = np.zeros(self.capacity, dtype=np.int32)
+        self.terminal = np.zeros(self.capacity, dtype=np.bool_)
+        self.priority = np.zeros(self.capacity, dtype=np.float64)
+
+        self.size: int = 0
+        self.added: int = 0
+        self._next: int = 0
+        self._maxPriority: float = 1.0
+        self._rng = np.random.default_rng(seed)
+
+    def __len__(self) -> int:
+        return self.size
+
+    def add(self, state: int, action: int, reward: float, nextState: int, terminal: bool) -> None:
+        i = self._next
+        self.state[i] = state
+        self.action[i] = action
+        self.reward[i] = reward
+        self.nextState[i] = nextState
+        self.terminal[i] = terminal
+        # new transitions are replayed at least once with high probability
+        self.priority[i] = self._maxPriority
+
+        self._next = (i + 1) % self.capacity
+        self.size = min(self.size + 1, self.capacity)
+        self.added += 1
+
+    def sample(self, batchSize: int) -> Tuple[np.ndarray, np.ndarray]:
+        # (indices, importance weights)
+        n = self.size
+        if not self.prioritized:
+            return self._rng.integers(0, n, size=batchSize), np.ones(batchSize)
+
+        p = self.priority[:n] ** self.alpha
+        p /= p.sum()
+        idx = self._rng.choice(n, size=batchSize, p=p)
+        w = (n * p[idx]) ** -self.beta
+        return idx, w / w.max()
+
+    def updatePriorities(self, idx: np.ndarray, tdErrors: np.ndarray) -> None:
+        pr = np.abs(tdErrors) + 1e-3
+        self.priority[idx] = pr
+        self._maxPriority = max(self._maxPriority, float(pr.max()))
+
+
+def batchUpdate(
+    q: np.ndarray,
+    s: np.ndarray,
+    a: np.ndarray,
+    r: np.ndarray,
+    ns: np.ndarray,
+    terminal: np.ndarray,
+    lr: float,
+    gamma: float,
+    weights: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    # One synchronous Q-learning step for a batch on a dense (states, 4)
+    # table: all targets use the Q values from before the batch, and an
+    # (s, a) pair sampled several times moves by its mean step, so lr keeps
+    # its meaning. Returns the TD errors.
+    target = r + gamma * np.where(terminal, 0.0, q[ns].max(axis=1))
+    td = target - q[s, a]
+    step = lr * td if weights is None else lr * weights * td
+    _, inv, counts = np.unique(s * 4 + a, return_inverse=True, return_counts=True)
+    np.add.at(q, (s, a), step / counts[inv])
+    return td
+
+
+def replayInto(agent: "HybridAgent", buffer: ReplayBuffer, batchSize: int, cols: int) -> int:
+    # Samples a batch and applies it to the agent's Q-table: the rows of the
+    # states involved are gathered into a small dense block, updated with
+    # batchUpdate and written back. Returns the number of transitions used.
+    if buffer.size == 0 or batchSize <= 0:
+        return 0
+
+    idx, w = buffer.sample(batchSize)
+    s = buffer.state[idx]
+    ns = buffer.nextState[idx]
+
+    ids, inverse = np.unique(np.concatenate((s, ns)), return_inverse=True)
+    states = [divmod(int(i), cols) for i in ids]
+    table = agent.qTable
+    zero = [0.0, 0.0, 0.0, 0.0]
+    block = np.array([table.get(st, zero) for st in states], dtype=np.float64)
+
+    td = batchUpdate(
+        block,
+        inverse[:batchSize],
+        buffer.action[idx].astype(np.intp),
+        buffer.reward[idx],
+        inverse[batchSize:],
+        buffer.terminal[idx],
+        agent.alpha,
+        agent.gamma,
+        w if buffer.prioritized else None,
+    )
+
+    if buffer.prioritized:
+        buffer.updatePriorities(idx, td)
+
+    # only rows that were updated (sources) are written back
+    updated = np.unique(inverse[:batchSize])
+    for k in updated:
+        table[states[k]] = block[k].tolist()
+    for tracked in (agent._changed, agent._dirty):
+        if tracked is not None:
+            tracked.update(states[k] for k in updated)
+
+    return batchSize
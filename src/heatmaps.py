@@ -0,0 +1,142 @@
+# =========================
+# file: src/heatmaps.py
+# =========================
+from __future__ import annotations
+
+from typing import Dict, List, Optional
+import os
+
+import numpy as np
+
+from .core_types import Grid, State
+
+# action sources reported by HybridAgent.getActionWithSource
+SOURCES = ("greedy", "astar", "random_valid", "random")
+
+# dark -> purple -> orange -> yellow
+_COLORMAP = np.array(
+    [[0, 0, 4], [80, 18, 123], [182, 54, 121], [251, 136, 97], [252, 253, 191]],
+    dtype=np.float32,
+)
+_WALL = np.array([60, 60, 60], dtype=np.uint8)
+
+
+def _colorize(values: np.ndarray, mask: Optional[np.ndarray]) -> np.ndarray:
+    # values (rows, cols) -> RGB uint8; NaN cells and walls are drawn grey
+    v = values.astype(np.float64)
+    finite = np.isfinite(v)
+    if mask is not None:
+        finite &= ~mask
+
+    out = np.empty(v.shape + (3,), dtype=np.uint8)
+    out[...] = _WALL
+
+    if finite.any():
+        lo = v[finite].min()
+        hi = v[finite].max()
+        t = np.zeros_like(v)
+        if hi > lo:
+            t[finite] = (v[finite] - lo) / (hi - lo)
+        pos = t * (len(_COLORMAP) - 1)
+        i0 = np.clip(pos.astype(np.int64), 0, len(_COLORMAP) - 2)
+        frac = (pos - i0)[..., None]
+        rgb = _COLORMAP[i0] * (1.0 - frac) + _COLORMAP[i0 + 1] * frac
+        out[finite] = rgb[finite].astype(np.uint8)
+
+    return out
+
+
+def renderHeatmapPNG(values: np.ndarray, path: str, wallMask: Optional[np.ndarray] = None, cellSize: int = 4) -> None:
+    import pygame  # lazy import
+
+    if not pygame.get_init():
+        # offscreen only: never open a window from a headless run
+        os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+    rgb = _colorize(values, wallMask)
+    # surfarray is (x, y) = (col, row)
+    surf = pygame.surfarray.make_surface(np.ascontiguousarray(rgb.transpose(1, 0, 2)))
+    rows, cols = values.shape
+    scale = max(1, int(cellSize))
+    if scale > 1:
+        surf = pygame.transform.scale(surf, (cols * scale, rows * scale))
+    pygame.image.save(surf, path)
+
+
+class HeatmapAccumulator:
+    # Fields:
+    # - visits[r, c]           train steps taken from each cell
+    # - bySource[s, r, c]      same, split by SOURCES
+    # Methods:
+    # - record(state, source)  once per train step
+    # - endEpisode(episode, qTable)
+    # - export(episode, qTable)
+
+    def __init__(
+        self,
+        grid: Grid,
+        exportEvery: int = 0,
+        outDir: str = "./data/heatmaps",
+        renderPNG: bool = True,
+        cellSize: int = 4,
+    ) -> None:
+        self.rows: int = len(grid)
+        self.cols: int = len(grid[0]) if self.rows else 0
+
+        self.exportEvery: int = max(0, int(exportEvery))
+        self.outDir: str = outDir
+        self.renderPNG: bool = renderPNG
+        self.cellSize: int = cellSize
+
+        self.visits = np.zeros((self.rows, self.cols), dtype=np.int64)
+        self.bySource = np.zeros((len(SOURCES), self.rows, self.cols), dtype=np.int32)
+        self.wallMask = np.asarray(grid, dtype=np.uint8) != 0
+
+        self._sourceIndex: Dict[str, int] = {s: i for i, s in enumerate(SOURCES)}
+        self.exported: List[str] = []
+
+    def record(self, state: State, source: str) -> None:
+        r, c = state
+        self.visits[r, c] += 1
+        s = self._sourceIndex.get(source)
+        if s is not None:
+            self.bySource[s, r, c] += 1
+
+    def maxQ(self, qTable: Dict[State, List[float]]) -> np.ndarray:
+        out = np.full((self.rows, self.cols), np.nan, dtype=np.float32)
+        if qTable:
+            states = np.fromiter((v for s in qTable for v in s), dtype=np.int64, count=2 * len(qTable)).reshape(-1, 2)
+            values = np.fromiter((max(q) for q in qTable.values()), dtype=np.float32, count=len(qTable))
+            out[states[:, 0], states[:, 1]] = values
+        return out
+
+    def endEpisode(self, episode: int, qTable: Dict[State, List[float]]) -> Optional[str]:
+        if self.exportEvery and episode % self.exportEvery == 0:
+            return self.export(episode, qTable)
+        return None
+
+    def export(self, episode: int, qTable: Dict[State, List[float]]) -> str:
+        os.makedirs(self.outDir, exist_ok=True)
+        stem = os.path.join(self.outDir, f"heatmap_ep{episode:06d}")
+
+        maxQ = self.maxQ(qTable)
+        np.savez_compressed(
+            stem + ".npz",
+            episode=np.int64(episode),
+            visits=self.visits,
+            bySource=self.bySource,
+            sources=np.array(SOURCES),
+            maxQ=maxQ,
+            walls=self.wallMask,
+        )
+
+        if self.renderPNG:
+            visits = np.log1p(self.visits.astype(np.float64))
+            renderHeatmapPNG(visits, stem + "_visits.png", self.wallMask, self.cellSize)
+            renderHeatmapPNG(maxQ, stem + "_maxq.png", self.wallMask, self.cellSize)
+            astar = self.bySource[self._sourceIndex["astar"]].astype(np.float64)
+            share = np.divide(astar, self.visits, out=np.full(astar.shape, np.nan), where=self.visits > 0)
+            renderHeatmapPNG(share, stem + "_astar_share.png", self.wallMask, self.cellSize)
+
+        self.exported.append(stem + ".npz")
+        return stem + ".npz"
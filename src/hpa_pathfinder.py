@@ -0,0 +1,408 @@
+# =========================
+# file: src/hpa_pathfinder.py
+# =========================
+from __future__ import annotations
+
+from collections import deque
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+import heapq
+import time
+
+from .core_types import Grid, State
+from .pathfinder import Path, Pathfinder
+
+
+class _Abstraction:
+    # Cluster graph of one grid (HPA*):
+    # - the grid is cut into clusterSize x clusterSize clusters
+    # - every free run along a cluster border gets one transition (two for
+    #   long runs); each transition is a pair of abstract nodes, one on each
+    #   side, joined by a cost-1 inter edge
+    # - intra edges (BFS distances between the nodes of one cluster) are
+    #   computed the first time a search touches the cluster, then cached
+
+    def __init__(self, grid: Grid, clusterSize: int) -> None:
+        self.grid: Grid = grid
+        self.rows: int = len(grid)
+        self.cols: int = len(grid[0]) if self.rows else 0
+        self.k: int = max(2, int(clusterSize))
+        self.clusterCols: int = (self.cols + self.k - 1) // self.k
+
+        self.nodeCell: List[int] = []
+        self.nodeOf: Dict[int, int] = {}
+        self.inter: List[List[int]] = []
+        self.clusterNodes: Dict[int, List[int]] = {}
+
+        self.intra: Dict[int, List[Tuple[int, int]]] = {}
+        self._builtClusters: Set[int] = set()
+
+        self._buildEntrances()
+
+    def cluster(self, cell: int) -> int:
+        r, c = divmod(cell, self.cols)
+        return (r // self.k) * self.clusterCols + (c // self.k)
+
+    def bounds(self, cid: int) -> Tuple[int, int, int, int]:
+        ci, cj = divmod(cid, self.clusterCols)
+        r0 = ci * self.k
+        c0 = cj * self.k
+        return r0, min(r0 + self.k, self.rows), c0, min(c0 + self.k, self.cols)
+
+    def _node(self, cell: int) -> int:
+        n = self.nodeOf.get(cell)
+        if n is None:
+            n = len(self.nodeCell)
+            self.nodeOf[cell] = n
+            self.nodeCell.append(cell)
+            self.inter.append([])
+            self.clusterNodes.setdefault(self.cluster(cell), []).append(n)
+        return n
+
+    def _link(self, a: int, b: int) -> None:
+        na = self._node(a)
+        nb = self._node(b)
+        self.inter[na].append(nb)
+        self.inter[nb].append(na)
+
+    def _addRun(self, pairs: List[Tuple[int, int]]) -> None:
+        if len(pairs) < 6:
+            self._link(*pairs[len(pairs) // 2])
+        else:
+            self._link(*pairs[0])
+            self._link(*pairs[-1])
+
+    def _buildEntrances(self) -> None:
+        g = self.grid
+        cols = self.cols
+
+        # vertical borders: between columns x - 1 and x
+        for x in range(self.k, cols, self.k):
+            for r0 in range(0, self.rows, self.k):
+                run: List[Tuple[int, int]] = []
+                for r in range(r0, min(r0 + self.k, self.rows)):
+                    if g[r][x - 1] == 0 and g[r][x] == 0:
+                        run.append((r * cols + x - 1, r * cols + x))
+                    elif run:
+                        self._addRun(run)
+                        run = []
+                if run:
+                    self._addRun(run)
+
+        # horizontal borders: between rows y - 1 and y
+        for y in range(self.k, self.rows, self.k):
+            above = g[y - 1]
+            below = g[y]
+            for c0 in range(0, cols, self.k):
+                run = []
+                for c in range(c0, min(c0 + self.k, cols)):
+                    if above[c] == 0 and below[c] == 0:
+                        run.append(((y - 1) * cols + c, y * cols + c))
+                    elif run:
+                        self._addRun(run)
+                        run = []
+                if run:
+                    self._addRun(run)
+
+    # ------------------------
+    # Cluster-local BFS
+    # ------------------------
+    def bfs(self, src: int, cid: int, stopAt: Optional[int] = None) -> Tuple[Dict[int, int], Dict[int, int]]:
+        # distances and parents of cells reachable from src inside cluster cid
+        r0, r1, c0, c1 = self.bounds(cid)
+        g = self.grid
+        cols = self.cols
+
+        dist = {src: 0}
+        parent: Dict[int, int] = {}
+        q = deque([src])
+
+        while q:
+            cur = q.popleft()
+            if cur == stopAt:
+                break
+            r, c = divmod(cur, cols)
+            d = dist[cur] + 1
+
+            if r > r0 and g[r - 1][c] == 0 and cur - cols not in dist:
+                dist[cur - cols] = d
+                parent[cur - cols] = cur
+                q.append(cur - cols)
+            if r < r1 - 1 and g[r + 1][c] == 0 and cur + cols not in dist:
+                dist[cur + cols] = d
+                parent[cur + cols] = cur
+                q.append(cur + cols)
+            if c > c0 and g[r][c - 1] == 0 and cur - 1 not in dist:
+                dist[cur - 1] = d
+                parent[cur - 1] = cur
+                q.append(cur - 1)
+            if c < c1 - 1 and g[r][c + 1] == 0 and cur + 1 not in dist:
+                dist[cur + 1] = d
+                parent[cur + 1] = cur
+                q.append(cur + 1)
+
+        return dist, parent
+
+    def ensureCluster(self, cid: int) -> int:
+        # builds the intra edges of one cluster; returns BFS cells expanded
+        if cid in self._builtClusters:
+            return 0
+        self._builtClusters.add(cid)
+
+        expanded = 0
+        nodes = self.clusterNodes.get(cid, [])
+        for n in nodes:
+            dist, _ = self.bfs(self.nodeCell[n], cid)
+            expanded += len(dist)
+            self.intra[n] = [(m, dist[self.nodeCell[m]]) for m in nodes if m != n and self.nodeCell[m] in dist]
+        return expanded
+
+
+class HierarchicalPathfinder(Pathfinder):
+    # HPA*: search the cached cluster graph, then refine each abstract edge
+    # with a cluster-bounded BFS. Paths are near-optimal, not optimal.
+
+    def __init__(self, clusterSize: int = 16) -> None:
+        super().__init__()
+        self.clusterSize: int = clusterSize
+
+        self._abs: Optional[_Abstraction] = None
+
+        self.stats: Dict[str, float] = {
+            "queries": 0,
+            "abstract_expansions": 0,
+            "local_expansions": 0,
+            "build_s": 0.0,
+            "query_s": 0.0,
+        }
+
+    def abstraction(self, grid: Grid) -> _Abstraction:
+        a = self._abs
+        if a is None or a.grid is not grid:
+            t0 = time.perf_counter()
+            a = self._abs = _Abstraction(grid, self.clusterSize)
+            self.stats["build_s"] += time.perf_counter() - t0
+        return a
+
+    def invalidate(self) -> None:
+        # call after editing a cached grid in place
+        self._abs = None
+
+    # ------------------------
+    # Queries
+    # ------------------------
+    def getAStarPath(self, grid: Grid, start: State, goal: State) -> Optional[Path]:
+        cells = self._abstractPath(grid, start, goal)
+        if cells is None:
+            return None
+        return self._refine(cells, len(cells) - 1)
+
+    def nextMove(self, grid: Grid, start: State, goal: State) -> Optional[int]:
+        # refines only the first abstract edge
+        cells = self._abstractPath(grid, start, goal)
+        if cells is None:
+            return None
+        return self.nextMoveFromPath(self._refine(cells, 1))
+
+    def _abstractPath(self, grid: Grid, start: State, goal: State) -> Optional[List[int]]:
+        t0 = time.perf_counter()
+        before = self.stats["abstract_expansions"] + self.stats["local_expansions"]
+        try:
+            return self._search(grid, start, goal)
+        finally:
+            self.stats["queries"] += 1
+            self.stats["query_s"] += time.perf_counter() - t0
+
+            # the generic Pathfinder counters see abstract + local work
+            expansions = self.stats["abstract_expansions"] + self.stats["local_expansions"] - before
+            self.queries += 1
+            self.lastExpansions = expansions
+            self.totalExpansions += expansions
+
+    def _search(self, grid: Grid, start: State, goal: State) -> Optional[List[int]]:
+        a = self.abstraction(grid)
+        cols = a.cols
+        s = start[0] * cols + start[1]
+        g = goal[0] * cols + goal[1]
+
+        if s == g:
+            return [s]
+
+        sc = a.cluster(s)
+        gc = a.cluster(g)
+
+        startDist, _ = a.bfs(s, sc)
+        self.stats["local_expansions"] += len(startDist)
+        if sc == gc and g in startDist:
+            return [s, g]
+
+        goalDist, _ = a.bfs(g, gc)
+        self.stats["local_expansions"] += len(goalDist)
+
+        startEdges = [(n, startDist[a.nodeCell[n]]) for n in a.clusterNodes.get(sc, []) if a.nodeCell[n] in startDist]
+        goalEdges = {n: goalDist[a.nodeCell[n]] for n in a.clusterNodes.get(gc, []) if a.nodeCell[n] in goalDist}
+        if not startEdges or not goalEdges:
+            return None
+
+        gr, gcol = goal
+
+        def h(n: int) -> int:
+            r, c = divmod(a.nodeCell[n], cols)
+            return abs(r - gr) + abs(c - gcol)
+
+        # virtual nodes: -1 = start, -2 = goal
+        best: Dict[int, int] = {-1: 0}
+        parent: Dict[int, int] = {}
+        heap: List[Tuple[int, int, int]] = [(0, 0, -1)]
+        closed: Set[int] = set()
+        expansions = 0
+
+        while heap:
+            _, d, n = heapq.heappop(heap)
+            if n in closed:
+                continue
+            closed.add(n)
+            expansions += 1
+
+            if n == -2:
+                break
+
+            if n == -1:
+                edges: Iterable[Tuple[int, int]] = startEdges
+            else:
+                self.stats["local_expansions"] += a.ensureCluster(a.cluster(a.nodeCell[n]))
+                edges = [(m, 1) for m in a.inter[n]] + a.intra[n]
+                if n in goalEdges:
+                    edges.append((-2, goalEdges[n]))
+
+            for m, w in edges:
+                nd = d + w
+                if nd < best.get(m, nd + 1):
+                    best[m] = nd
+                    parent[m] = n
+                    heapq.heappush(heap, (nd + (0 if m == -2 else h(m)), nd, m))
+
+        self.stats["abstract_expansions"] += expansions
+
+        if -2 not in closed:
+            return None
+
+        chain = [g]
+        n = parent[-2]
+        while n != -1:
+            chain.append(a.nodeCell[n])
+            n = parent[n]
+        chain.append(s)
+        chain.reverse()
+
+        # drop zero-length hops where the start or goal is itself an entrance,
+        # so the first refined leg always moves
+        return [c for i, c in enumerate(chain) if i == 0 or c != chain[i - 1]]
+
+    def _refine(self, cells: List[int], legs: int) -> Path:
+        # expands the first `legs` abstract edges into grid cells
+        a = self._abs
+        cols = a.cols
+        path: Path = [divmod(cells[0], cols)]
+
+        for i in range(min(legs, len(cells) - 1)):
+            u, v = cells[i], cells[i + 1]
+            if u == v:
+                continue
+            ur, uc = divmod(u, cols)
+            vr, vc = divmod(v, cols)
+            if abs(ur - vr) + abs(uc - vc) == 1 and a.cluster(u) != a.cluster(v):
+                path.append((vr, vc))
+                continue
+
+            dist, parent = a.bfs(u, a.cluster(u), stopAt=v)
+            self.stats["local_expansions"] += len(dist)
+            leg = [v]
+            while leg[-1] != u:
+                leg.append(parent[leg[-1]])
+            leg.reverse()
+            path.extend(divmod(x, cols) for x in leg[1:])
+
+        return path
+
+
+def compareWithFlat(
+    grid: Grid,
+    queries: List[Tuple[State, State]],
+    clusterSize: int = 16,
+) -> Dict[str, Any]:
+    # expansions, latency and path quality of HPA* vs flat A* on the same queries
+    flat = Pathfinder()
+    hpa = HierarchicalPathfinder(clusterSize)
+    hpa.abstraction(grid)
+
+    out: Dict[str, Any] = {"queries": len(queries), "build_s": round(hpa.stats["build_s"], 4)}
+
+    flatLen = 0
+    hpaLen = 0
+    flatTime = 0.0
+    hpaTime = 0.0
+    flatExp = 0
+    solved = 0
+
+    for start, goal in queries:
+        t0 = time.perf_counter()
+        p1 = flat.getAStarPath(grid, start, goal)
+        flatTime += time.perf_counter() - t0
+        flatExp += flat.lastExpansions
+
+        t0 = time.perf_counter()
+        p2 = hpa.getAStarPath(grid, start, goal)
+        hpaTime += time.perf_counter() - t0
+
+        if p1 is not None and p2 is not None:
+            solved += 1
+            flatLen += len(p1)
+            hpaLen += len(p2)
+
+    n = max(1, len(queries))
+    out["flat"] = {"expansions": flatExp / n, "latency_ms": 1000.0 * flatTime / n}
+    out["hpa"] = {
+        "abstract_expansions": hpa.stats["abstract_expansions"] / n,
+        "local_expansions": hpa.stats["local_expansions"] / n,
+        "latency_ms": 1000.0 * hpaTime / n,
+    }
+    out["solved"] = solved
+    out["path_ratio"] = round(hpaLen / flatLen, 4) if flatLen else None
+    return out
+
+
+def main() -> None:
+    import argparse
+    import json
+    import random
+
+    from .core_types import MazeGenParams
+    from .maze_generator import MazeGenerator
+
+    p = argparse.ArgumentParser(description="HPA* vs flat A* on random queries")
+    p.add_argument("--rows", type=int, default=200)
+    p.add_argument("--cols", type=int, default=200)
+    p.add_argument("--wallDensity", type=float, default=0.25)
+    p.add_argument("--mazeAlgorithm", type=str, default="random")
+    p.add_argument("--clusterSize", type=int, default=16)
+    p.add_argument("--queries", type=int, default=100)
+    p.add_argument("--seed", type=int, default=42)
+    args = p.parse_args()
+
+    grid, _, _ = MazeGenerator().generate(MazeGenParams(
+        rows=args.rows,
+        cols=args.cols,
+        wallDensity=args.wallDensity,
+        seed=args.seed,
+        algorithm=args.mazeAlgorithm,
+    ))
+
+    rng = random.Random(args.seed)
+    free = [(r, c) for r in range(len(grid)) for c in range(len(grid[0])) if grid[r][c] == 0]
+    queries = [(rng.choice(free), rng.choice(free)) for _ in range(args.queries)]
+
+    print(json.dumps(compareWithFlat(grid, queries, args.clusterSize), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -3,7 +3,7 @@
 # =========================
 from __future__ import annotations
 
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Set, Tuple
 import random
 
 from .core_types import State,Action
@@ -32,6 +32,7 @@ class HybridAgent:
         epsilon: float,
         heuristicRate: float,
         seed: Optional[int] = None,
+        pathfinder: Optional[Pathfinder] = None,
     ) -> None:
         self.qTable: Dict[State, List[float]] = {}
 
@@ -40,12 +41,21 @@ class HybridAgent:
         self.epsilon: float = float(epsilon)
         self.heuristicRate: float = float(heuristicRate)
 
-        self.pathfinder: Pathfinder = Pathfinder()
+        self.pathfinder: Pathfinder = pathfinder if pathfinder is not None else Pathfinder()
         self._rng = random.Random(seed)
 
+        # states whose Q row was created or updated (None = not tracking):
+        # _changed for checkpoints, _dirty for the UI overlay
+        self._changed: Optional[Set[State]] = None
+        self._dirty: Optional[Set[State]] = None
+
     def _ensureState(self, state: State) -> None:
         if state not in self.qTable:
             self.qTable[state] = [0.0, 0.0, 0.0, 0.0]
+            if self._changed is not None:
+                self._changed.add(state)
+            if self._dirty is not None:
+                self._dirty.add(state)
 
     def _argmaxAction(self, state: State) -> int:
         q = self.qTable[state]
@@ -60,21 +70,18 @@ class HybridAgent:
 
         return bestA
 
-    def _validActions(self, env: Environment) -> List[int]:
-        return [a for a in Action.ALL if env.isValidMove(a)]
+    def _validActions(self, env: Environment) -> Tuple[int, ...]:
+        return env.validActions()
 
     def getActionWithSource(self, state: State, env: Environment) -> Tuple[int, str]:
         self._ensureState(state)
 
         if self._rng.random() < self.epsilon:
             if self._rng.random() < self.heuristicRate:
-                path = self.pathfinder.getAStarPath(env.gridMatrix, state, env.goalPos)
-
-                if path:
-                    a = self.pathfinder.nextMoveFromPath(path)
+                a = self.pathfinder.nextMove(env.gridMatrix, state, env.goalPos)
 
-                    if a is not None and env.isValidMove(a):
-                        return a, "astar"
+                if a is not None and env.isValidMove(a):
+                    return a, "astar"
 
             valid = self._validActions(env)
 
@@ -98,6 +105,26 @@ class HybridAgent:
         target = float(reward) + self.gamma * max(self.qTable[nextState])
         self.qTable[state][action] = old + self.alpha * (target - old)
 
+        if self._changed is not None:
+            self._changed.add(state)
+        if self._dirty is not None:
+            self._dirty.add(state)
+
+    def updateQOption(self, state: State, action: int, reward: float, nextState: State, duration: int) -> None:
+        # SMDP Q-learning for a corridor option started with `action`:
+        # reward is the discounted return of its `duration` primitive steps
+        self._ensureState(state)
+        self._ensureState(nextState)
+
+        old = self.qTable[state][action]
+        target = float(reward) + self.gamma ** duration * max(self.qTable[nextState])
+        self.qTable[state][action] = old + self.alpha * (target - old)
+
+        if self._changed is not None:
+            self._changed.add(state)
+        if self._dirty is not None:
+            self._dirty.add(state)
+
     # optional helpers
     def setEpsilon(self, epsilon: float) -> None:
         self.epsilon = float(epsilon)
@@ -105,5 +132,22 @@ class HybridAgent:
     def setHeuristicRate(self, heuristicRate: float) -> None:
         self.heuristicRate = float(heuristicRate)
 
+    def trackChanges(self) -> Set[State]:
+        # starts (or restarts) change tracking; returns the states changed
+        # since the previous call
+        changed = self._changed if self._changed is not None else set()
+        self._changed = set()
+        return changed
+
+    def takeDirty(self) -> Set[State]:
+        # same as trackChanges, for a second independent consumer (the UI
+        # overlay drains it once per frame)
+        dirty = self._dirty if self._dirty is not None else set()
+        self._dirty = set()
+        return dirty
+
+    def stopDirty(self) -> None:
+        self._dirty = None
+
     def resetQTable(self) -> None:
         self.qTable.clear()
@@ -0,0 +1,283 @@
+# =========================
+# file: src/log_analytics.py
+# =========================
+from __future__ import annotations
+
+from collections import Counter, deque
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+import argparse
+import csv
+import json
+import os
+
+from .logger import iterStepRows, logPaths
+
+# episode ids >= EVAL_OFFSET are evaluation runs (see MainController.runEvaluation)
+EVAL_OFFSET = 100000
+
+
+def iterCsvRows(path: str, chunkBytes: int = 1 << 20) -> Iterator[Dict[str, str]]:
+    # Streams rows as dicts; memory is bounded by chunkBytes, not file size.
+    with open(path, "r", newline="", encoding="utf-8", buffering=chunkBytes) as f:
+        yield from csv.DictReader(f)
+
+
+class LearningCurve:
+    # Fixed number of points regardless of episode count: when the curve is
+    # full, neighbouring buckets are merged and the bucket width doubles.
+
+    def __init__(self, maxPoints: int = 200) -> None:
+        self.maxPoints: int = max(2, int(maxPoints))
+        self.bucketSize: int = 1
+
+        # each bucket: [firstIndex, count, sumReward, sumSteps, successes]
+        # (indices are row ordinals: appended runs restart their episode ids)
+        self._buckets: List[List[float]] = []
+
+    def add(self, index: int, reward: float, steps: int, success: bool) -> None:
+        if self._buckets and self._buckets[-1][1] < self.bucketSize:
+            b = self._buckets[-1]
+        else:
+            if len(self._buckets) >= self.maxPoints:
+                self._compact()
+                return self.add(index, reward, steps, success)
+            b = [index, 0, 0.0, 0.0, 0]
+            self._buckets.append(b)
+
+        b[1] += 1
+        b[2] += reward
+        b[3] += steps
+        b[4] += 1 if success else 0
+
+    def _compact(self) -> None:
+        merged: List[List[float]] = []
+        for i in range(0, len(self._buckets), 2):
+            pair = self._buckets[i:i + 2]
+            merged.append([
+                pair[0][0],
+                sum(b[1] for b in pair),
+                sum(b[2] for b in pair),
+                sum(b[3] for b in pair),
+                sum(b[4] for b in pair),
+            ])
+        self._buckets = merged
+        self.bucketSize *= 2
+
+    def points(self) -> List[Dict[str, float]]:
+        out = []
+        for first, n, sr, ss, succ in self._buckets:
+            out.append({
+                "index": int(first),
+                "episodes": int(n),
+                "mean_reward": round(sr / n, 3),
+                "mean_steps": round(ss / n, 3),
+                "success_rate": round(succ / n, 4),
+            })
+        return out
+
+
+class EpisodeLogAnalyzer:
+    def __init__(self, window: int = 50, maxPoints: int = 200) -> None:
+        self.window: int = max(1, int(window))
+
+        self.curves: Dict[str, LearningCurve] = {
+            "train": LearningCurve(maxPoints),
+            "eval": LearningCurve(maxPoints),
+        }
+        self.counts: Counter = Counter()
+        self.successes: Counter = Counter()
+
+        self._recent: Dict[str, deque] = {m: deque(maxlen=self.window) for m in self.curves}
+        self._recentSum: Dict[str, int] = {m: 0 for m in self.curves}
+        self.bestRollingSR: Dict[str, Tuple[float, int]] = {m: (0.0, 0) for m in self.curves}
+
+    def add(self, row: Dict[str, str]) -> None:
+        episode = int(row["episode"])
+        mode = row.get("mode") or ("eval" if episode >= EVAL_OFFSET else "train")
+        if mode not in self.curves:
+            return
+
+        steps = int(row["steps"])
+        reward = float(row["total_reward"])
+        success = row["success"] in ("1", "True", "true")
+
+        self.counts[mode] += 1
+        self.successes[mode] += 1 if success else 0
+        self.curves[mode].add(self.counts[mode], reward, steps, success)
+
+        recent = self._recent[mode]
+        if len(recent) == recent.maxlen:
+            self._recentSum[mode] -= recent[0]
+        recent.append(1 if success else 0)
+        self._recentSum[mode] += recent[-1]
+
+        sr = self._recentSum[mode] / len(recent)
+        if len(recent) == recent.maxlen and sr > self.bestRollingSR[mode][0]:
+            self.bestRollingSR[mode] = (sr, episode)
+
+    def summary(self) -> Dict[str, Any]:
+        out: Dict[str, Any] = {}
+        for mode, curve in self.curves.items():
+            n = self.counts[mode]
+            if n == 0:
+                continue
+            recent = self._recent[mode]
+            best, bestEp = self.bestRollingSR[mode]
+            out[mode] = {
+                "episodes": n,
+                "success_rate": round(self.successes[mode] / n, 4),
+                "final_rolling_sr": round(self._recentSum[mode] / max(1, len(recent)), 4),
+                "best_rolling_sr": round(best, 4),
+                "best_rolling_sr_episode": bestEp,
+                "curve_bucket": curve.bucketSize,
+                "curve": curve.points(),
+            }
+        return out
+
+
+class StepLogAnalyzer:
+    def __init__(self) -> None:
+        self.stepCount: int = 0
+        self.sourceMix: Dict[str, Counter] = {}
+        self.visits: Counter = Counter()
+        self.rowsCount: int = 0
+        self.colsCount: int = 0
+
+    def add(self, row: Dict[str, str]) -> None:
+        self.stepCount += 1
+
+        mode = row.get("mode", "train")
+        mix = self.sourceMix.get(mode)
+        if mix is None:
+            mix = self.sourceMix[mode] = Counter()
+        mix[row.get("source", "")] += 1
+
+        if mode == "train":
+            r = int(row["state_r"])
+            c = int(row["state_c"])
+            self.visits[(r, c)] += 1
+            if r >= self.rowsCount:
+                self.rowsCount = r + 1
+            if c >= self.colsCount:
+                self.colsCount = c + 1
+
+    def visitGrid(self) -> List[List[int]]:
+        grid = [[0] * self.colsCount for _ in range(self.rowsCount)]
+        for (r, c), n in self.visits.items():
+            grid[r][c] = n
+        return grid
+
+    def summary(self, topCells: int = 10) -> Dict[str, Any]:
+        mix = {}
+        for mode, counter in self.sourceMix.items():
+            total = max(1, sum(counter.values()))
+            mix[mode] = {src: round(n / total, 4) for src, n in counter.most_common()}
+
+        return {
+            "steps": self.stepCount,
+            "source_mix": mix,
+            "visited_cells": len(self.visits),
+            "grid_extent": [self.rowsCount, self.colsCount],
+            "top_cells": [[r, c, n] for (r, c), n in self.visits.most_common(topCells)],
+        }
+
+
+def analyzeLogs(
+    episodesPath: Optional[str],
+    stepsPath: Optional[str],
+    window: int = 50,
+    maxPoints: int = 200,
+    logFile: Optional[str] = None,
+) -> Tuple[Dict[str, Any], Optional[StepLogAnalyzer]]:
+    # logFile: Logger base path; its rotated step segments are read in order
+    # (stepsPath, if given, names a single csv instead)
+    summary: Dict[str, Any] = {}
+
+    if episodesPath and os.path.exists(episodesPath):
+        ep = EpisodeLogAnalyzer(window=window, maxPoints=maxPoints)
+        for row in iterCsvRows(episodesPath):
+            ep.add(row)
+        summary["episodes"] = ep.summary()
+
+    stepRows = None
+    if stepsPath and os.path.exists(stepsPath):
+        stepRows = iterCsvRows(stepsPath)
+    elif logFile:
+        stepRows = iterStepRows(logFile)
+
+    steps = None
+    if stepRows is not None:
+        steps = StepLogAnalyzer()
+        for row in stepRows:
+            steps.add(row)
+        if steps.stepCount == 0:
+            steps = None
+        else:
+            summary["steps"] = steps.summary()
+
+    return summary, steps
+
+
+def plotSummary(summary: Dict[str, Any], steps: Optional[StepLogAnalyzer], outPath: str) -> None:
+    import matplotlib  # lazy import, optional dependency
+
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
+    fig, axes = plt.subplots(1, 3, figsize=(15, 4))
+
+    for mode, data in summary.get("episodes", {}).items():
+        xs = [p["index"] for p in data["curve"]]
+        axes[0].plot(xs, [p["mean_reward"] for p in data["curve"]], label=mode)
+        axes[1].plot(xs, [p["success_rate"] for p in data["curve"]], label=mode)
+    axes[0].set_title("mean reward")
+    axes[1].set_title("success rate")
+    axes[0].legend()
+    axes[1].legend()
+
+    if steps is not None and steps.visits:
+        axes[2].imshow(steps.visitGrid(), cmap="magma")
+    axes[2].set_title("train visits")
+
+    fig.tight_layout()
+    fig.savefig(outPath)
+    plt.close(fig)
+
+
+def _parseArgs() -> argparse.Namespace:
+    p = argparse.ArgumentParser(description="Streaming summary of Logger CSV output")
+    p.add_argument("--logFile", type=str, default="./data/training_logs.csv")
+    p.add_argument("--episodes", type=str, default="", help="override the episodes csv path")
+    p.add_argument("--steps", type=str, default="", help="override the steps csv path")
+    p.add_argument("--window", type=int, default=50)
+    p.add_argument("--points", type=int, default=200)
+    p.add_argument("--out", type=str, default="", help="write the JSON summary here instead of stdout")
+    p.add_argument("--plot", type=str, default="", help="write a PNG with curves and visit heatmap")
+    return p.parse_args()
+
+
+def main() -> None:
+    args = _parseArgs()
+
+    _, epPath = logPaths(args.logFile)
+    summary, steps = analyzeLogs(
+        args.episodes or epPath,
+        args.steps or None,
+        window=args.window,
+        maxPoints=args.points,
+        logFile=args.logFile,
+    )
+
+    text = json.dumps(summary, indent=2)
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            f.write(text)
+    else:
+        print(text)
+
+    if args.plot:
+        plotSummary(summary, steps, args.plot)
+
+
+if __name__ == "__main__":
+    main()
@@ -3,10 +3,86 @@
 # =========================
 from __future__ import annotations
 
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 import csv
+import glob
+import gzip
 import os
+import re
+import shutil
 import time
 
+from .telemetry import Telemetry
+
+STEP_HEADER = ["episode", "t", "state_r", "state_c", "action", "reward", "done", "mode", "source"]
+EPISODE_HEADER = ["episode", "steps", "total_reward", "success", "mode", "elapsed_s"]
+# streaming metrics appended to new episode logs (see MetricsEngine.episodeColumns)
+EPISODE_METRIC_COLUMNS = ["sr_window", "reward_ema", "steps_p95", "latency_ms"]
+
+_SEGMENT_RE = re.compile(r"_steps\.(\d+)\.csv(\.gz)?$")
+
+
+def logPaths(filePath: str) -> Tuple[str, str]:
+    # (steps csv, episodes csv) for a Logger base path
+    root, _ = os.path.splitext(filePath)
+    return f"{root}_steps.csv", f"{root}_episodes.csv"
+
+
+def segmentPath(filePath: str, index: int) -> str:
+    root, _ = os.path.splitext(filePath)
+    return f"{root}_steps.{index:06d}.csv"
+
+
+def stepSegments(filePath: str) -> List[str]:
+    # Closed segments in write order, then the active _steps.csv.
+    # A segment that exists both plain and gzipped (compression was
+    # interrupted before the plain file was removed) is listed once.
+    root, _ = os.path.splitext(filePath)
+    found: Dict[int, str] = {}
+
+    for path in glob.glob(glob.escape(root) + "_steps.*.csv*"):
+        m = _SEGMENT_RE.search(path)
+        if m is None:
+            continue
+        idx = int(m.group(1))
+        if idx not in found or not m.group(2):
+            found[idx] = path
+
+    out = [found[i] for i in sorted(found)]
+
+    active, _ = logPaths(filePath)
+    if os.path.exists(active):
+        out.append(active)
+    return out
+
+
+def segmentIndex(path: str) -> Optional[int]:
+    m = _SEGMENT_RE.search(path)
+    return int(m.group(1)) if m is not None else None
+
+
+def openSegment(path: str):
+    if path.endswith(".gz"):
+        return gzip.open(path, "rt", newline="", encoding="utf-8")
+    return open(path, "r", newline="", encoding="utf-8")
+
+
+def iterStepRows(filePath: str) -> Iterator[Dict[str, str]]:
+    # Step rows across all segments of a (possibly rotated) step log.
+    for path in stepSegments(filePath):
+        with openSegment(path) as f:
+            yield from csv.DictReader(f)
+
+
+def _compressSegment(path: str) -> str:
+    tmp = path + ".gz.tmp"
+    with open(path, "rb") as src, gzip.open(tmp, "wb", compresslevel=6) as dst:
+        shutil.copyfileobj(src, dst, 1 << 20)
+    os.replace(tmp, path + ".gz")
+    os.remove(path)
+    return path + ".gz"
+
 
 class Logger:
     # UML fields:
@@ -16,9 +92,24 @@ class Logger:
     # - logEpisode(...)
     # - flush()
 
-    def __init__(self, filePath: str, console: bool = True) -> None:
+    def __init__(
+        self,
+        filePath: str,
+        console: bool = True,
+        telemetry: Optional[Telemetry] = None,
+        rotateBytes: int = 0,
+        rotateEpisodes: int = 0,
+        compress: bool = True,
+    ) -> None:
         self.filePath: str = filePath
         self.console: bool = console
+        self.telemetry: Optional[Telemetry] = telemetry
+
+        # step log rotation (0 = off); checked at episode boundaries so an
+        # episode never spans two segments
+        self.rotateBytes: int = max(0, int(rotateBytes))
+        self.rotateEpisodes: int = max(0, int(rotateEpisodes))
+        self.compress: bool = compress
 
         self._stepFile = None
         self._episodeFile = None
@@ -26,43 +117,64 @@ class Logger:
         self._stepWriter = None
         self._episodeWriter = None
 
+        # False when appending to an episode log written with the legacy header
+        self._episodeMetrics: bool = True
+
+        self._segmentBytes: int = 0
+        self._segmentEpisodes: int = 0
+        self._lastStepEpisode: Optional[int] = None
+        self._compressor: Optional[ThreadPoolExecutor] = None
+        self._pending: List[Future] = []
+
         self._t0 = time.time()
 
         self._open()
 
-    def _withSuffix(self, base: str, suffix: str) -> str:
-        root, ext = os.path.splitext(base)
-        if not ext:
-            ext = ".csv"
-        return f"{root}{suffix}"
-
-    def _open(self) -> None:
-        stepPath = self._withSuffix(self.filePath, "_steps.csv")
-        epPath = self._withSuffix(self.filePath, "_episodes.csv")
+    def _openSteps(self) -> None:
+        stepPath, _ = logPaths(self.filePath)
 
         newSteps = not os.path.exists(stepPath)
-        newEps = not os.path.exists(epPath)
-
         self._stepFile = open(stepPath, "a", newline="", encoding="utf-8")
-        self._episodeFile = open(epPath, "a", newline="", encoding="utf-8")
-
         self._stepWriter = csv.writer(self._stepFile)
-        self._episodeWriter = csv.writer(self._episodeFile)
+
+        self._segmentBytes = os.path.getsize(stepPath)
+        self._segmentEpisodes = 0
+        self._lastStepEpisode = None
 
         if newSteps:
-            self._stepWriter.writerow(
-                ["episode", "t", "state_r", "state_c", "action", "reward", "done", "mode", "source"]
-            )
+            self._segmentBytes += self._stepWriter.writerow(STEP_HEADER)
+
+    def _open(self) -> None:
+        _, epPath = logPaths(self.filePath)
+
+        self._openSteps()
+
+        newEps = not os.path.exists(epPath) or os.path.getsize(epPath) == 0
+        if not newEps:
+            with open(epPath, "r", newline="", encoding="utf-8") as f:
+                header = next(csv.reader(f), [])
+            self._episodeMetrics = header[len(EPISODE_HEADER):] == EPISODE_METRIC_COLUMNS
+
+        self._episodeFile = open(epPath, "a", newline="", encoding="utf-8")
+        self._episodeWriter = csv.writer(self._episodeFile)
 
         if newEps:
-            self._episodeWriter.writerow(
-                ["episode", "steps", "total_reward", "success", "mode", "elapsed_s"]
-            )
+            self._episodeWriter.writerow(EPISODE_HEADER + EPISODE_METRIC_COLUMNS)
 
     def info(self, msg: str) -> None:
-        if self.console:
+        if not self.console:
+            return
+
+        # console lines go through telemetry only when it owns the console
+        if self.telemetry is not None and self.telemetry.console:
+            self.telemetry.info(msg)
+        else:
             print(msg, flush=True)
 
+    def metric(self, kind: str, **fields: Any) -> None:
+        if self.telemetry is not None:
+            self.telemetry.metric(kind, **fields)
+
     def logStep(
         self,
         episode: int,
@@ -75,7 +187,11 @@ class Logger:
         mode: str,
         source: str,
     ) -> None:
-        self._stepWriter.writerow(
+        if episode != self._lastStepEpisode:
+            self._lastStepEpisode = episode
+            self._segmentEpisodes += 1
+
+        self._segmentBytes += self._stepWriter.writerow(
             [episode, t, state_r, state_c, action, reward, int(done), mode, source]
         )
 
@@ -86,11 +202,96 @@ class Logger:
         total_reward: float,
         success: bool,
         mode: str,
+        metrics: Optional[Dict[str, Any]] = None,
     ) -> None:
         elapsed = time.time() - self._t0
-        self._episodeWriter.writerow(
-            [episode, steps, total_reward, int(success), mode, round(elapsed, 3)]
-        )
+        row = [episode, steps, total_reward, int(success), mode, round(elapsed, 3)]
+        if self._episodeMetrics:
+            metrics = metrics or {}
+            row.extend(metrics.get(col, "") for col in EPISODE_METRIC_COLUMNS)
+        self._episodeWriter.writerow(row)
+
+        if self._shouldRotate():
+            self.rotate()
+
+    def _shouldRotate(self) -> bool:
+        if self._segmentEpisodes == 0:
+            return False
+        if self.rotateBytes and self._segmentBytes >= self.rotateBytes:
+            return True
+        if self.rotateEpisodes and self._segmentEpisodes >= self.rotateEpisodes:
+            return True
+        return False
+
+    def rotate(self) -> None:
+        # close the active step file as the next numbered segment and start
+        # a fresh one; compression runs on a worker thread
+        stepPath, _ = logPaths(self.filePath)
+
+        self._stepFile.close()
+
+        closed = segmentPath(self.filePath, self._lastSegment() + 1)
+        os.replace(stepPath, closed)
+
+        if self.compress:
+            if self._compressor is None:
+                self._compressor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="logzip")
+            self._pending = [f for f in self._pending if not f.done()]
+            self._pending.append(self._compressor.submit(_compressSegment, closed))
+
+        self._openSteps()
+
+    def _lastSegment(self) -> int:
+        indices = [segmentIndex(p) for p in stepSegments(self.filePath)]
+        return max([i for i in indices if i is not None], default=0)
+
+    def positions(self) -> Dict[str, Any]:
+        # flushed write positions, for restorePositions() after a crash
+        self.flush()
+        stepPath, epPath = logPaths(self.filePath)
+        return {
+            "steps": os.path.getsize(stepPath),
+            "episodes": os.path.getsize(epPath),
+            "segment": self._lastSegment(),
+            "segmentEpisodes": self._segmentEpisodes,
+            "lastStepEpisode": self._lastStepEpisode,
+            "elapsed": time.time() - self._t0,
+        }
+
+    def restorePositions(self, pos: Dict[str, Any]) -> None:
+        # Cut both logs back to `pos`, dropping rows written after it. A
+        # step segment closed since then holds the old active file: it is
+        # moved back (decompressed if needed) and later segments are removed.
+        self.close(closeTelemetry=False)
+        stepPath, epPath = logPaths(self.filePath)
+        root, _ = os.path.splitext(self.filePath)
+
+        later: Dict[int, List[str]] = {}
+        for path in glob.glob(glob.escape(root) + "_steps.*.csv*"):
+            idx = segmentIndex(path)
+            if idx is not None and idx > pos["segment"]:
+                later.setdefault(idx, []).append(path)
+
+        if later:
+            first = sorted(later[min(later)])  # plain file sorts before .gz
+            if first[0].endswith(".gz"):
+                with gzip.open(first[0], "rb") as src, open(stepPath, "wb") as dst:
+                    shutil.copyfileobj(src, dst, 1 << 20)
+            else:
+                os.replace(first[0], stepPath)
+            for paths in later.values():
+                for path in paths:
+                    if os.path.exists(path):
+                        os.remove(path)
+
+        for path, size in ((stepPath, pos["steps"]), (epPath, pos["episodes"])):
+            with open(path, "r+b") as f:
+                f.truncate(size)
+
+        self._open()
+        self._segmentEpisodes = pos["segmentEpisodes"]
+        self._lastStepEpisode = pos["lastStepEpisode"]
+        self._t0 = time.time() - pos["elapsed"]
 
     def flush(self) -> None:
         if self._stepFile:
@@ -98,3 +299,24 @@ class Logger:
 
         if self._episodeFile:
             self._episodeFile.flush()
+
+    def close(self, closeTelemetry: bool = True) -> None:
+        self.flush()
+
+        if self._stepFile:
+            self._stepFile.close()
+            self._stepFile = None
+
+        if self._episodeFile:
+            self._episodeFile.close()
+            self._episodeFile = None
+
+        if self._compressor is not None:
+            self._compressor.shutdown(wait=True)
+            self._compressor = None
+            for f in self._pending:
+                f.result()
+            self._pending = []
+
+        if closeTelemetry and self.telemetry is not None:
+            self.telemetry.close()
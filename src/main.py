@@ -4,25 +4,33 @@
 from __future__ import annotations
 
 import argparse
+from dataclasses import replace
 
 from .core_types import MazeGenParams, TrainingConfig
 from .maze_generator import MazeGenerator
 from .environment import Environment
 from .hybrid_agent import HybridAgent
 from .logger import Logger
+from .telemetry import Telemetry
 from .maze_ui import MazeUI
 from .main_controller import MainController
+from .memory_profiler import MemoryProfiler
+from .planners import makePathfinder
+from .replay import EpisodeIndex, ReplayPlayer
 
 
 def _parseArgs() -> argparse.Namespace:
     p = argparse.ArgumentParser()
     p.add_argument("--episodes", type=int, default=300)
     p.add_argument("--evalEvery", type=int, default=50)
+    p.add_argument("--asyncEval", type=int, default=0)
+    p.add_argument("--evalMazes", type=int, default=0, help="extra mazes (seed+1..seed+N) for async evaluation")
 
     p.add_argument("--rows", type=int, default=15)
     p.add_argument("--cols", type=int, default=15)
     p.add_argument("--wallDensity", type=float, default=0.25)
     p.add_argument("--seed", type=int, default=42)
+    p.add_argument("--mazeAlgorithm", type=str, default="random", choices=["random", "backtracker", "kruskal", "wilson"])
 
     p.add_argument("--alpha", type=float, default=0.1)
     p.add_argument("--gamma", type=float, default=0.99)
@@ -30,6 +38,14 @@ def _parseArgs() -> argparse.Namespace:
     p.add_argument("--heuristicRate", type=float, default=0.30)
 
     p.add_argument("--maxSteps", type=int, default=600)
+    p.add_argument("--planner", type=str, default="astar", choices=["astar", "hpa", "alt", "corridor"])
+    p.add_argument("--clusterSize", type=int, default=16)
+    p.add_argument("--pathService", type=str, default="", help="Unix socket of a running path service")
+    p.add_argument("--landmarks", type=int, default=8)
+
+    p.add_argument("--actors", type=int, default=1)
+    p.add_argument("--actorRefreshEvery", type=int, default=5)
+    p.add_argument("--publishEvery", type=int, default=10)
 
     p.add_argument("--visual", type=int, default=0)
     p.add_argument("--interactive", type=int, default=1)
@@ -37,6 +53,39 @@ def _parseArgs() -> argparse.Namespace:
     p.add_argument("--fps", type=int, default=60)
 
     p.add_argument("--logFile", type=str, default="./data/training_logs.csv")
+
+    # replay a previous run's step log (same maze args as the original run)
+    p.add_argument("--replay", type=int, default=0)
+    p.add_argument("--replayEpisode", type=int, default=-1)
+    p.add_argument("--replaySpeed", type=int, default=1, help="logged steps advanced per frame")
+    p.add_argument("--rotateMB", type=float, default=0.0)
+    p.add_argument("--rotateEpisodes", type=int, default=0)
+    p.add_argument("--compressLogs", type=int, default=1)
+    p.add_argument("--heatmapEvery", type=int, default=0)
+    p.add_argument("--heatmapDir", type=str, default="./data/heatmaps")
+    p.add_argument("--asyncConsole", type=int, default=0)
+    p.add_argument("--consoleInterval", type=float, default=0.5)
+    p.add_argument("--metricsOut", type=str, default="")
+    p.add_argument("--profileMemory", type=int, default=0, help="tracemalloc snapshot every N episodes (0 = off)")
+    p.add_argument("--profileDir", type=str, default="./data/memory")
+    p.add_argument("--options", type=int, default=0, help="follow corridors as macro-actions (1 = on)")
+    p.add_argument("--replayCapacity", type=int, default=0)
+    p.add_argument("--replayBatch", type=int, default=64)
+    p.add_argument("--replayBatches", type=int, default=4)
+    p.add_argument("--replayPrioritized", type=int, default=0)
+    p.add_argument("--checkpointEvery", type=int, default=0)
+    p.add_argument("--checkpointDir", type=str, default="./data/checkpoints")
+    p.add_argument("--resume", type=int, default=0)
+    p.add_argument("--epsilonSchedule", type=str, default="constant", choices=["constant", "linear", "exp", "cosine"])
+    p.add_argument("--epsilonEnd", type=float, default=0.05)
+    p.add_argument("--heuristicSchedule", type=str, default="constant", choices=["constant", "linear", "exp", "cosine"])
+    p.add_argument("--heuristicRateEnd", type=float, default=0.0)
+    p.add_argument("--scheduleEpisodes", type=int, default=0)
+    p.add_argument("--adaptiveExploration", type=int, default=0)
+    p.add_argument("--adaptiveTargetSR", type=float, default=0.8)
+    p.add_argument("--metricsWindows", type=str, default="50", help="comma separated rolling window lengths")
+    p.add_argument("--metricsSummary", type=str, default="")
+    p.add_argument("--metricsSummaryEvery", type=int, default=50)
     return p.parse_args()
 
 
@@ -48,23 +97,66 @@ def main() -> None:
         cols=args.cols,
         wallDensity=args.wallDensity,
         seed=args.seed,
+        algorithm=args.mazeAlgorithm,
     )
 
     cfg = TrainingConfig(
         episodes=args.episodes,
         evalEvery=args.evalEvery,
+        asyncEval=bool(args.asyncEval),
         alpha=args.alpha,
         gamma=args.gamma,
         epsilon=args.epsilon,
         heuristicRate=args.heuristicRate,
+        epsilonSchedule=args.epsilonSchedule,
+        epsilonEnd=args.epsilonEnd,
+        heuristicSchedule=args.heuristicSchedule,
+        heuristicRateEnd=args.heuristicRateEnd,
+        scheduleEpisodes=args.scheduleEpisodes,
+        adaptiveExploration=bool(args.adaptiveExploration),
+        adaptiveTargetSR=args.adaptiveTargetSR,
         maxStepsPerEpisode=args.maxSteps,
+        options=bool(args.options),
+        replayCapacity=args.replayCapacity,
+        replayBatch=args.replayBatch,
+        replayBatches=args.replayBatches,
+        replayPrioritized=bool(args.replayPrioritized),
+        planner=args.planner,
+        clusterSize=args.clusterSize,
+        pathService=args.pathService,
+        landmarks=args.landmarks,
+        actors=args.actors,
+        actorRefreshEvery=args.actorRefreshEvery,
+        publishEvery=args.publishEvery,
         visual=bool(args.visual),
         interactive=bool(args.interactive),
         cellSize=args.cellSize,
         fps=args.fps,
         logFilePath=args.logFile,
+        profileMemory=args.profileMemory,
+        profileDir=args.profileDir,
+        checkpointEvery=args.checkpointEvery,
+        checkpointDir=args.checkpointDir,
+        resume=bool(args.resume),
+        rotateBytes=int(args.rotateMB * 1024 * 1024),
+        rotateEpisodes=args.rotateEpisodes,
+        compressLogs=bool(args.compressLogs),
+        heatmapEvery=args.heatmapEvery,
+        heatmapDir=args.heatmapDir,
+        asyncConsole=bool(args.asyncConsole),
+        consoleInterval=args.consoleInterval,
+        metricsPath=args.metricsOut,
+        metricsWindows=tuple(int(w) for w in args.metricsWindows.split(",") if w.strip()),
+        metricsSummaryPath=args.metricsSummary,
+        metricsSummaryEvery=args.metricsSummaryEvery,
     )
 
+    # started before the maze exists so grids, masks and the agent are traced too
+    memProfiler = None
+    if cfg.profileMemory > 0:
+        memProfiler = MemoryProfiler(every=cfg.profileMemory, outDir=cfg.profileDir)
+        memProfiler.start()
+
     mazeGen = MazeGenerator()
     grid, start, goal = mazeGen.generate(genParams)
 
@@ -75,15 +167,43 @@ def main() -> None:
         maxSteps=cfg.maxStepsPerEpisode,
     )
 
+    if args.replay:
+        index = EpisodeIndex(cfg.logFilePath).refresh()
+        player = ReplayPlayer(
+            index,
+            env,
+            MazeUI(cellSize=cfg.cellSize, fps=cfg.fps),
+            stepsPerFrame=args.replaySpeed,
+            pauseWaitMs=cfg.pauseWaitMs,
+        )
+        player.play(args.replayEpisode if args.replayEpisode >= 0 else None)
+        return
+
     agent = HybridAgent(
         alpha=cfg.alpha,
         gamma=cfg.gamma,
         epsilon=cfg.epsilon,
         heuristicRate=cfg.heuristicRate,
         seed=args.seed,
+        pathfinder=makePathfinder(cfg),
     )
 
-    logger = Logger(cfg.logFilePath, console=True)
+    telemetry = None
+    if cfg.asyncConsole or cfg.metricsPath:
+        telemetry = Telemetry(
+            consoleInterval=cfg.consoleInterval,
+            metricsPath=cfg.metricsPath,
+            console=cfg.asyncConsole,
+        )
+
+    logger = Logger(
+        cfg.logFilePath,
+        console=True,
+        telemetry=telemetry,
+        rotateBytes=cfg.rotateBytes,
+        rotateEpisodes=cfg.rotateEpisodes,
+        compress=cfg.compressLogs,
+    )
 
     ui = MazeUI(cellSize=cfg.cellSize, fps=cfg.fps) if cfg.visual else None
 
@@ -95,7 +215,16 @@ def main() -> None:
         mazeGen=mazeGen,
     )
 
-    controller.startTraining(cfg)
+    controller.memProfiler = memProfiler
+
+    for i in range(args.evalMazes):
+        extra = replace(genParams, seed=None if args.seed is None else args.seed + 1 + i)
+        controller.evalMazes.append(mazeGen.generate(extra))
+
+    try:
+        controller.startTraining(cfg)
+    finally:
+        logger.close()
 
 
 if __name__ == "__main__":
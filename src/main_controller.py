@@ -3,16 +3,27 @@
 # =========================
 from __future__ import annotations
 
-from collections import deque
-from typing import Any, Dict, Optional
+from dataclasses import replace
+import time
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
+from .async_evaluator import AsyncEvaluator, Maze
+from .checkpoint import CheckpointManager
 from .environment import Environment
 from .hybrid_agent import HybridAgent
 from .logger import Logger
 from .maze_generator import MazeGenerator
 from .maze_ui import MazeUI
+from .metrics import MetricsEngine
+from .move_masks import CORRIDOR_NEXT
+from .schedules import ExplorationSchedule, makeExplorationSchedule
 from .core_types import TrainingConfig
 
+if TYPE_CHECKING:
+    from .experience_replay import ReplayBuffer
+    from .heatmaps import HeatmapAccumulator
+    from .memory_profiler import MemoryProfiler
+
 
 class MainController:
     # UML fields:
@@ -35,30 +46,87 @@ class MainController:
         self.ui: Optional[MazeUI] = ui
         self.logger: Optional[Logger] = logger
         self.mazeGen: Optional[MazeGenerator] = mazeGen
+        if ui is not None:
+            ui.setAgent(agent)
 
         self._episodeId: int = 0
         self._episodesTarget: int = 0
+        # primitive train steps taken by runEpisode (all episodes)
+        self.envSteps: int = 0
 
         self._stopRequested: bool = False
         self._paused: bool = False
 
-        # rolling stats
-        self._recentSuccess = deque(maxlen=50)
-        self._recentRewards = deque(maxlen=50)
-        self._recentSteps = deque(maxlen=50)
+        # rolling stats (reconfigured from TrainingConfig by startTraining)
+        self.metrics: MetricsEngine = MetricsEngine()
+
+        # epsilon / heuristicRate schedule (None = constant)
+        self.schedule: Optional[ExplorationSchedule] = None
+        self._evalSeen: int = 0
+
+        # experience replay memory (created by startTraining when config.replayCapacity > 0)
+        self.replay: Optional["ReplayBuffer"] = None
+
+        # memory timeline (config.profileMemory > 0); main.py starts it early
+        self.memProfiler: Optional["MemoryProfiler"] = None
+
+        # incremental checkpoints (config.checkpointEvery > 0)
+        self.checkpoints: Optional[CheckpointManager] = None
+
+        # per-cell accumulators (created by startTraining when config.heatmapEvery > 0)
+        self.heatmaps: Optional["HeatmapAccumulator"] = None
+
+        # background evaluation (config.asyncEval); evalMazes are extra mazes
+        # evaluated next to the training maze
+        self.evalMazes: List[Maze] = []
+        self._asyncEval: Optional[AsyncEvaluator] = None
 
         # ui one-shot flags
         self._restartEpisodeFlag: bool = False
         self._stepOnceFlag: bool = False
         self._nextEpisodeGate: bool = False
+        self._nextPollAt: float = 0.0
 
     # UML methods:
     # - startTraining(config)
     # - runEpisode()
     # - runEvaluation()
     def startTraining(self, config: TrainingConfig) -> None:
+        self._configureMetrics(config)
+        self.schedule = makeExplorationSchedule(config)
+
+        if config.profileMemory > 0 and self.memProfiler is None:
+            from .memory_profiler import MemoryProfiler
+
+            self.memProfiler = MemoryProfiler(every=config.profileMemory, outDir=config.profileDir)
+            self.memProfiler.start()
+
+        if config.actors > 1:
+            self._startParallelTraining(config)
+            self._finishMemoryProfile()
+            return
+
         self._episodesTarget = max(1, int(config.episodes))
 
+        if config.replayCapacity > 0 and config.options and self.logger:
+            self.logger.info("[SYSTEM] experience replay is not supported with options -> disabled")
+
+        if config.replayCapacity > 0 and not config.options and self.replay is None:
+            from .experience_replay import ReplayBuffer  # lazy import (numpy)
+
+            self.replay = ReplayBuffer(
+                config.replayCapacity,
+                prioritized=config.replayPrioritized,
+                seed=self.agent._rng.randrange(2 ** 31),
+            )
+
+        ep = 0
+        if config.checkpointEvery > 0:
+            self.checkpoints = CheckpointManager(config.checkpointDir)
+            self.agent.trackChanges()
+            if config.resume:
+                ep = self._restoreCheckpoint()
+
         if self.logger:
             self.logger.info(
                 f"[SYSTEM] startTraining: episodes={self._episodesTarget}, evalEvery={config.evalEvery}, "
@@ -66,67 +134,154 @@ class MainController:
                 f"heuristicRate={config.heuristicRate}, visual={config.visual}, interactive={config.interactive}"
             )
 
-        ep = 0
+        if config.heatmapEvery > 0 and self.heatmaps is None:
+            from .heatmaps import HeatmapAccumulator  # lazy import (numpy)
+
+            self.heatmaps = HeatmapAccumulator(
+                self.env.gridMatrix,
+                exportEvery=config.heatmapEvery,
+                outDir=config.heatmapDir,
+            )
+
+        if config.asyncEval and config.evalEvery > 0:
+            self._asyncEval = AsyncEvaluator(
+                [(self.env.gridMatrix, self.env._startPos, self.env.goalPos)] + list(self.evalMazes),
+                maxSteps=config.maxStepsPerEpisode,
+                mode=config.evalMode,
+                options=config.options,
+            )
+
         while ep < self._episodesTarget and not self._stopRequested:
             self._episodeId = ep + 1
+            self._applySchedule(ep)
 
             res = self.runEpisode(config)
 
-            self._recentSuccess.append(1 if res["success"] else 0)
-            self._recentRewards.append(res["total_reward"])
-            self._recentSteps.append(res["steps"])
+            if self.replay is not None and not self._stopRequested:
+                from .experience_replay import replayInto
+
+                cols = len(self.env.gridMatrix[0])
+                for _ in range(config.replayBatches):
+                    replayInto(self.agent, self.replay, config.replayBatch, cols)
+
+            if self.heatmaps is not None:
+                self.heatmaps.endEpisode(self._episodeId, self.agent.qTable)
+
+            self._maybeWriteSummary(config, self._episodeId)
+
+            if self.memProfiler is not None:
+                self.memProfiler.sample(self._episodeId, self)
 
             if self.logger:
-                sr = int(round(100.0 * (sum(self._recentSuccess) / max(1, len(self._recentSuccess)))))
+                sr = self._successPercent()
                 self.logger.info(
                     f"[TRAIN] ep={res['episode']}/{self._episodesTarget} steps={res['steps']} "
                     f"reward={res['total_reward']:.1f} success={res['success']} recentSR={sr}%"
+                    + (f" decisions={res['decisions']}" if config.options else "")
+                    + self._scheduleText()
                 )
+                self.logger.metric(
+                    "train",
+                    episode=res["episode"],
+                    steps=res["steps"],
+                    reward=res["total_reward"],
+                    success=bool(res["success"]),
+                    recentSR=sr,
+                    epsilon=self.agent.epsilon,
+                    heuristicRate=self.agent.heuristicRate,
+                    rewardEma=self.metrics.value("train", "reward", "ema"),
+                    stepsP95=self.metrics.value("train", "steps", "p95"),
+                    latencyP95Ms=self.metrics.value("train", "latency_ms", "p95"),
+                )
+
+            if self._asyncEval is not None:
+                self._reportAsyncEval(self._asyncEval.poll())
 
-            if config.evalEvery > 0 and (self._episodeId % config.evalEvery == 0) and not self._stopRequested:
+                if self._episodeId % config.evalEvery == 0 and not self._asyncEval.submit(self._episodeId, self.agent.qTable):
+                    if self.logger:
+                        self.logger.info(f"[EVAL ] ep={self._episodeId} skipped (evaluations still running)")
+
+            elif config.evalEvery > 0 and (self._episodeId % config.evalEvery == 0) and not self._stopRequested:
                 ev = self.runEvaluation(config)
                 if self.logger:
                     self.logger.info(
                         f"[EVAL ] ep={ev['episode']} steps={ev['steps']} "
                         f"reward={ev['total_reward']:.1f} success={ev['success']}"
                     )
+                    self.logger.metric(
+                        "eval",
+                        episode=ev["episode"],
+                        steps=ev["steps"],
+                        reward=ev["total_reward"],
+                        success=bool(ev["success"]),
+                    )
 
             ep += 1
 
+            if self.checkpoints is not None and ep % config.checkpointEvery == 0 and not self._stopRequested:
+                self._saveCheckpoint(ep)
+
             # if interactive + paused, allow "next episode" gating
             if config.visual and config.interactive and self.ui:
-                while self._paused and not self._stopRequested:
-                    self._handleUIControls(config, mode="train", episode=self._episodeId, t=0, totalReward=0.0)
+                if self._paused and not self._stopRequested:
+                    self._redraw(config, mode="train", episode=self._episodeId, t=0, totalReward=0.0)
 
-                    self._renderHUD(config, mode="train", episode=self._episodeId, t=0, totalReward=0.0)
-                    self.ui.drawGrid(self.env)
-                    self.ui.drawAgent(self.env.agentPos)
-                    self.ui.updateScreen()
+                while self._paused and not self._stopRequested:
+                    # sleeps on the event queue; redraws only after input
+                    changed = self._handleUIControls(
+                        config, mode="train", episode=self._episodeId, t=0, totalReward=0.0, wait=True
+                    )
 
                     if self._nextEpisodeGate:
                         self._nextEpisodeGate = False
                         break
 
+                    if changed:
+                        self._redraw(config, mode="train", episode=self._episodeId, t=0, totalReward=0.0)
+
+        if self._asyncEval is not None:
+            self._reportAsyncEval(self._asyncEval.close())
+            self._asyncEval = None
+
+        if self.checkpoints is not None:
+            self.checkpoints.close()
+
+        self._finishMemoryProfile()
+
+        if config.metricsSummaryPath:
+            self.metrics.writeSummary(config.metricsSummaryPath)
+
         if self.logger:
             self.logger.info("[SYSTEM] training finished -> flushing logs...")
             self.logger.flush()
 
     def runEpisode(self, config: TrainingConfig) -> Dict[str, Any]:
         mode = "train"
+        t0 = time.perf_counter()
         state = self.env.reset()
         totalReward = 0.0
         steps = 0
 
+        # corridor options: follow >= 0 is the next primitive action of the
+        # running option, opt its [start state, first action, discounted
+        # return, primitive steps]
+        decisions = 0
+        follow = -1
+        opt: List[Any] = []
+
         # FIX: ensure window is created and visible BEFORE pollControls()
         if config.visual and self.ui:
-            self._renderHUD(config, mode=mode, episode=self._episodeId, t=0, totalReward=0.0)
-            self.ui.drawGrid(self.env)
-            self.ui.drawAgent(self.env.agentPos)
-            self.ui.updateScreen()
+            self._redraw(config, mode=mode, episode=self._episodeId, t=0, totalReward=0.0)
 
         while True:
             if config.visual and config.interactive and self.ui:
-                self._handleUIControls(config, mode=mode, episode=self._episodeId, t=steps, totalReward=totalReward)
+                # paused: block on input; running: poll every uiPollInterval
+                waiting = self._paused and not self._stepOnceFlag
+                changed = False
+                if waiting or self._pollDue(config):
+                    changed = self._handleUIControls(
+                        config, mode=mode, episode=self._episodeId, t=steps, totalReward=totalReward, wait=waiting
+                    )
 
                 if self._stopRequested:
                     return {
@@ -134,6 +289,7 @@ class MainController:
                         "steps": steps,
                         "total_reward": totalReward,
                         "success": False,
+                        "decisions": decisions,
                     }
 
                 if self._restartEpisodeFlag:
@@ -141,27 +297,51 @@ class MainController:
                     state = self.env.reset()
                     totalReward = 0.0
                     steps = 0
+                    decisions = 0
+                    follow = -1
 
                 if self._paused and not self._stepOnceFlag:
-                    self._renderHUD(config, mode=mode, episode=self._episodeId, t=steps, totalReward=totalReward)
-                    self.ui.drawGrid(self.env)
-                    self.ui.drawAgent(self.env.agentPos)
-                    self.ui.updateScreen()
+                    if changed:
+                        self._redraw(config, mode=mode, episode=self._episodeId, t=steps, totalReward=totalReward)
                     continue
 
             if self.ui:
-                self._renderHUD(config, mode=mode, episode=self._episodeId, t=steps, totalReward=totalReward)
-                self.ui.drawGrid(self.env)
-                self.ui.drawAgent(self.env.agentPos)
-                self.ui.updateScreen()
+                self._redraw(config, mode=mode, episode=self._episodeId, t=steps, totalReward=totalReward)
 
-            action, source = self.agent.getActionWithSource(state, self.env)
+            if follow >= 0:
+                action, source = follow, "option"
+            else:
+                action, source = self.agent.getActionWithSource(state, self.env)
+                decisions += 1
             nextState, reward, done = self.env.step(action)
 
-            self.agent.updateQ(state, action, reward, nextState)
+            if not config.options:
+                self.agent.updateQ(state, action, reward, nextState)
+            else:
+                if follow < 0:
+                    opt = [state, action, 0.0, 0]
+                opt[2] += self.agent.gamma ** opt[3] * reward
+                opt[3] += 1
+                follow = -1 if done or nextState == state else CORRIDOR_NEXT[self.env.moveMask()][action]
+                if follow < 0:
+                    self.agent.updateQOption(opt[0], opt[1], opt[2], nextState, opt[3])
+
+            if self.replay is not None:
+                cols = len(self.env.gridMatrix[0])
+                self.replay.add(
+                    state[0] * cols + state[1],
+                    action,
+                    reward,
+                    nextState[0] * cols + nextState[1],
+                    done and nextState == self.env.goalPos,
+                )
+
+            if self.heatmaps is not None:
+                self.heatmaps.record(state, source)
 
             totalReward += reward
             steps += 1
+            self.envSteps += 1
 
             if self.logger:
                 self.logger.logStep(
@@ -180,9 +360,14 @@ class MainController:
 
             if self._stepOnceFlag:
                 self._stepOnceFlag = False
+                # the next paused iteration blocks without redrawing: show the
+                # post-step state now
+                if self.ui and self._paused:
+                    self._redraw(config, mode=mode, episode=self._episodeId, t=steps, totalReward=totalReward)
 
             if done:
                 success = (self.env.agentPos == self.env.goalPos)
+                self.metrics.record(mode, steps, totalReward, success, time.perf_counter() - t0)
                 if self.logger:
                     self.logger.logEpisode(
                         episode=self._episodeId,
@@ -190,12 +375,14 @@ class MainController:
                         total_reward=totalReward,
                         success=success,
                         mode=mode,
+                        metrics=self.metrics.episodeColumns(mode),
                     )
                 return {
                     "episode": self._episodeId,
                     "steps": steps,
                     "total_reward": totalReward,
                     "success": success,
+                    "decisions": decisions,
                 }
 
     def runEvaluation(self, config: TrainingConfig) -> Dict[str, Any]:
@@ -207,19 +394,18 @@ class MainController:
         self.agent.epsilon = 0.0
         self.agent.heuristicRate = 0.0
 
+        t0 = time.perf_counter()
         state = self.env.reset()
         totalReward = 0.0
         steps = 0
+        follow = -1
 
         if config.visual and self.ui:
-            self._renderHUD(config, mode=mode, episode=100000 + self._episodeId, t=0, totalReward=0.0)
-            self.ui.drawGrid(self.env)
-            self.ui.drawAgent(self.env.agentPos)
-            self.ui.updateScreen()
+            self._redraw(config, mode=mode, episode=100000 + self._episodeId, t=0, totalReward=0.0)
 
         while True:
             if config.visual and self.ui:
-                if config.interactive:
+                if config.interactive and self._pollDue(config):
                     self._handleUIControls(
                         config,
                         mode=mode,
@@ -230,13 +416,15 @@ class MainController:
                     if self._stopRequested:
                         break
 
-                self._renderHUD(config, mode=mode, episode=100000 + self._episodeId, t=steps, totalReward=totalReward)
-                self.ui.drawGrid(self.env)
-                self.ui.drawAgent(self.env.agentPos)
-                self.ui.updateScreen()
+                self._redraw(config, mode=mode, episode=100000 + self._episodeId, t=steps, totalReward=totalReward)
 
-            action, _ = self.agent.getActionWithSource(state, self.env)
+            if follow >= 0:
+                action = follow
+            else:
+                action, _ = self.agent.getActionWithSource(state, self.env)
             nextState, reward, done = self.env.step(action)
+            if config.options:
+                follow = -1 if done or nextState == state else CORRIDOR_NEXT[self.env.moveMask()][action]
 
             totalReward += reward
             steps += 1
@@ -246,6 +434,7 @@ class MainController:
                 break
 
         success = (self.env.agentPos == self.env.goalPos)
+        self.metrics.record(mode, steps, totalReward, success, time.perf_counter() - t0)
 
         if self.logger:
             self.logger.logEpisode(
@@ -254,6 +443,7 @@ class MainController:
                 total_reward=totalReward,
                 success=success,
                 mode=mode,
+                metrics=self.metrics.episodeColumns(mode),
             )
 
         self.agent.epsilon = oldEps
@@ -266,21 +456,256 @@ class MainController:
             "success": success,
         }
 
+    def _startParallelTraining(self, config: TrainingConfig) -> None:
+        from .parallel_training import ParallelTrainer
+
+        self._episodesTarget = max(1, int(config.episodes))
+
+        # mirrors the actors' (non-adaptive) schedule for the HUD / logs
+        self.schedule = makeExplorationSchedule(config, adaptive=False)
+
+        if self.logger:
+            unsupported = (
+                (config.checkpointEvery > 0, "checkpointing is not supported with actors > 1 -> disabled"),
+                (config.resume, "resume is not supported with actors > 1 -> starting fresh"),
+                (config.options, "options are not supported with actors > 1 -> disabled"),
+                (config.replayCapacity > 0, "experience replay is not supported with actors > 1 -> disabled"),
+                (config.heatmapEvery > 0, "heatmaps are not supported with actors > 1 -> disabled"),
+                (config.asyncEval, "async evaluation is not supported with actors > 1 -> evaluating in line"),
+            )
+            for active, msg in unsupported:
+                if active:
+                    self.logger.info(f"[SYSTEM] {msg}")
+        config = replace(
+            config,
+            checkpointEvery=0,
+            resume=False,
+            options=False,
+            replayCapacity=0,
+            heatmapEvery=0,
+            asyncEval=False,
+        )
+
+        if self.logger:
+            self.logger.info(
+                f"[SYSTEM] startParallelTraining: actors={config.actors}, episodes={self._episodesTarget}, "
+                f"evalEvery={config.evalEvery}, publishEvery={config.publishEvery}, "
+                f"actorRefreshEvery={config.actorRefreshEvery}"
+            )
+
+        def onEpisode(res: Dict[str, Any], qTableProvider) -> None:
+            self._episodeId = res["episode"]
+            # same convention as the sequential loop: episodes done before this one
+            self._applySchedule(res["episode"] - 1)
+            self._maybeWriteSummary(config, self._episodeId)
+            if self.memProfiler is not None:
+                self.memProfiler.sample(self._episodeId, self)
+
+            if self.logger:
+                sr = self._successPercent()
+                self.logger.info(
+                    f"[TRAIN] ep={res['episode']}/{self._episodesTarget} actor={res['actor']} steps={res['steps']} "
+                    f"reward={res['total_reward']:.1f} success={res['success']} recentSR={sr}%"
+                    + self._scheduleText()
+                )
+
+            if config.evalEvery > 0 and self._episodeId % config.evalEvery == 0:
+                self.agent.qTable = qTableProvider()
+                evalConfig = replace(config, visual=False)
+                ev = self.runEvaluation(evalConfig)
+                if self.logger:
+                    self.logger.info(
+                        f"[EVAL ] ep={ev['episode']} steps={ev['steps']} "
+                        f"reward={ev['total_reward']:.1f} success={ev['success']}"
+                    )
+
+        trainer = ParallelTrainer(
+            self.env.gridMatrix,
+            self.env._startPos,
+            self.env.goalPos,
+            config,
+            logger=self.logger,
+            seed=self.agent._rng.randrange(2 ** 31),
+            metrics=self.metrics,
+        )
+        self.agent.qTable = trainer.run(self.agent.qTable, onEpisode=onEpisode)
+
+        if self.logger:
+            self.logger.info(
+                f"[SYSTEM] parallel training finished: episodes={trainer.episodesDone}, "
+                f"transitions={trainer.transitions}, publishes={trainer.publishes} -> flushing logs..."
+            )
+            self.logger.flush()
+
+        if config.metricsSummaryPath:
+            self.metrics.writeSummary(config.metricsSummaryPath)
+
     # ------------------------
     # Internal helpers
     # ------------------------
-    def _handleUIControls(self, config: TrainingConfig, mode: str, episode: int, t: int, totalReward: float) -> None:
-        if not self.ui:
+    def _configureMetrics(self, config: TrainingConfig) -> None:
+        windows = tuple(config.metricsWindows) or (50,)
+        if self.metrics.windows != windows or self.metrics.emaAlpha != config.metricsEmaAlpha:
+            self.metrics = MetricsEngine(windows=windows, emaAlpha=config.metricsEmaAlpha)
+
+    def _finishMemoryProfile(self) -> None:
+        if self.memProfiler is None:
             return
 
-        cmd = self.ui.pollControls()
+        self.memProfiler.sample(self._episodeId, self, force=True)
+        path = self.memProfiler.finish()
+        if self.logger and path:
+            self.logger.info(f"[SYSTEM] memory profile: {self.memProfiler.samples} snapshots -> {path}")
+        self.memProfiler = None
+
+    def _saveCheckpoint(self, episode: int) -> None:
+        # episode = episodes completed; everything needed to continue the
+        # run exactly as if it had not stopped
+        state = {
+            "episode": episode,
+            "rng": self.agent._rng.getstate(),
+            "epsilon": self.agent.epsilon,
+            "heuristicRate": self.agent.heuristicRate,
+            "metrics": self.metrics,
+            "schedule": self.schedule,
+            "evalSeen": self._evalSeen,
+            "replay": self.replay,
+            "logger": self.logger.positions() if self.logger else None,
+        }
+        self.checkpoints.save(self.agent.qTable, self.agent.trackChanges(), state)
+
+    def _restoreCheckpoint(self) -> int:
+        loaded = self.checkpoints.load()
+        if loaded is None:
+            if self.logger:
+                self.logger.info(f"[SYSTEM] no checkpoint in {self.checkpoints.directory} -> starting fresh")
+            return 0
+
+        qTable, state = loaded
+        self.agent.qTable = qTable
+        self.agent._rng.setstate(state["rng"])
+        self.agent.setEpsilon(state["epsilon"])
+        self.agent.setHeuristicRate(state["heuristicRate"])
+        self.agent.trackChanges()
+
+        self.metrics = state["metrics"]
+        # the decay itself follows the current config; only the adaptive
+        # controller carries state
+        if self.schedule is not None and state["schedule"] is not None:
+            self.schedule.adaptive = state["schedule"].adaptive or self.schedule.adaptive
+        self._evalSeen = state["evalSeen"]
+        if self.replay is not None and state.get("replay") is not None:
+            self.replay = state["replay"]
+
+        if self.logger and state["logger"] is not None:
+            self.logger.restorePositions(state["logger"])
+            self.logger.info(f"[SYSTEM] resumed from checkpoint after episode {state['episode']}")
+
+        return state["episode"]
+
+    def _applySchedule(self, episode: int) -> None:
+        if self.schedule is None:
+            return
+
+        # feed each new eval result (sync or async) to the adaptive controller
+        evals = self.metrics.count("eval")
+        if evals != self._evalSeen:
+            self._evalSeen = evals
+            self.schedule.observe(self.metrics.successRate("eval"))
+
+        self.schedule.apply(self.agent, episode)
+
+    def _scheduleText(self) -> str:
+        if self.schedule is None:
+            return ""
+        return f" eps={self.agent.epsilon:.3f} hr={self.agent.heuristicRate:.3f} sched={self.schedule.describe()}"
+
+    def _successPercent(self, mode: str = "train") -> int:
+        return int(round(100.0 * self.metrics.successRate(mode)))
+
+    def _maybeWriteSummary(self, config: TrainingConfig, episode: int) -> None:
+        if config.metricsSummaryPath and config.metricsSummaryEvery > 0 and episode % config.metricsSummaryEvery == 0:
+            self.metrics.writeSummary(config.metricsSummaryPath)
+
+    def _reportAsyncEval(self, results: List[Dict[str, Any]]) -> None:
+        for res in results:
+            if not res["runs"]:
+                if self.logger:
+                    self.logger.info(f"[EVAL ] ep={100000 + res['episode']} failed: {res.get('error', '?')}")
+                continue
+
+            # the training maze is always the first run
+            ev = res["runs"][0]
+            self.metrics.record("eval", ev["steps"], ev["total_reward"], ev["success"], ev.get("elapsed_s", 0.0))
+            if not self.logger:
+                continue
+
+            self.logger.logEpisode(
+                episode=100000 + res["episode"],
+                steps=ev["steps"],
+                total_reward=ev["total_reward"],
+                success=ev["success"],
+                mode="eval",
+                metrics=self.metrics.episodeColumns("eval"),
+            )
+            self.logger.info(
+                f"[EVAL ] ep={100000 + res['episode']} steps={ev['steps']} "
+                f"reward={ev['total_reward']:.1f} success={ev['success']} "
+                f"mazesSR={int(round(100.0 * res['success_rate']))}% (snapshot of ep {res['episode']})"
+            )
+            self.logger.metric(
+                "eval",
+                episode=100000 + res["episode"],
+                steps=ev["steps"],
+                reward=ev["total_reward"],
+                success=bool(ev["success"]),
+                mazesSR=res["success_rate"],
+            )
+
+    def _pollDue(self, config: TrainingConfig) -> bool:
+        now = time.monotonic()
+        if now < self._nextPollAt:
+            return False
+        self._nextPollAt = now + config.uiPollInterval
+        return True
+
+    def _redraw(self, config: TrainingConfig, mode: str, episode: int, t: int, totalReward: float) -> None:
+        self._renderHUD(config, mode=mode, episode=episode, t=t, totalReward=totalReward)
+        self.ui.drawGrid(self.env)
+        self.ui.drawAgent(self.env.agentPos)
+        self.ui.updateScreen()
+
+    def _handleUIControls(
+        self,
+        config: TrainingConfig,
+        mode: str,
+        episode: int,
+        t: int,
+        totalReward: float,
+        wait: bool = False,
+    ) -> bool:
+        # returns True when the command changed anything shown on screen
+        if not self.ui:
+            return False
+
+        cmd = self.ui.waitControls(config.pauseWaitMs) if wait else self.ui.pollControls()
+
+        changed = (
+            bool(cmd["paused"]) != self._paused
+            or bool(cmd["stop"])
+            or bool(cmd.get("redraw"))
+            or int(cmd["fps_delta"]) != 0
+            or int(cmd["episodes_delta"]) != 0
+            or bool(cmd["restart_episode"])
+            or bool(cmd["step_once"])
+        )
 
         self._paused = bool(cmd["paused"])
         self._stopRequested = bool(cmd["stop"])
 
         fps_delta = int(cmd["fps_delta"])
         if fps_delta != 0:
-            self.ui._fps = max(10, min(240, self.ui._fps + fps_delta))
+            self.ui.adjustFps(fps_delta)
 
         eps_delta = int(cmd["episodes_delta"])
         if eps_delta != 0:
@@ -297,11 +722,13 @@ class MainController:
         if cmd["next_episode"]:
             self._nextEpisodeGate = True
 
+        return changed
+
     def _renderHUD(self, config: TrainingConfig, mode: str, episode: int, t: int, totalReward: float) -> None:
         if not self.ui:
             return
 
-        sr = int(round(100.0 * (sum(self._recentSuccess) / max(1, len(self._recentSuccess))))) if self._recentSuccess else 0
+        sr = self._successPercent()
 
         hud = {
             "mode": mode,
@@ -316,5 +743,8 @@ class MainController:
             "heuristicRate": f"{self.agent.heuristicRate:.3f}",
             "paused": self._paused,
         }
+        hud.update(self.metrics.hudFields("train"))
+        if self.schedule is not None:
+            hud["schedule"] = self.schedule.describe()
 
         self.ui.setHud(hud)
@@ -3,7 +3,7 @@
 # =========================
 from __future__ import annotations
 
-from typing import Tuple
+from typing import Callable, Dict, List, Tuple
 import random
 
 from .core_types import Grid, MazeGenParams, State
@@ -15,12 +15,17 @@ class MazeGenerator:
     # - generate(params): Grid
     # - ensureSolvable(grid, start, goal): bool
 
+    PERFECT_ALGORITHMS = ("backtracker", "kruskal", "wilson")
+
     def __init__(self) -> None:
         self._pathfinder = Pathfinder()
 
     def generate(self, params: MazeGenParams) -> Tuple[Grid, State, State]:
         rng = random.Random(params.seed)
 
+        if params.algorithm != "random":
+            return self._generatePerfect(params, rng)
+
         start: State = (0, 0)
         goal: State = (params.rows - 1, params.cols - 1)
 
@@ -44,3 +49,157 @@ class MazeGenerator:
     def ensureSolvable(self, grid: Grid, start: State, goal: State) -> bool:
         path = self._pathfinder.getAStarPath(grid, start, goal)
         return path is not None
+
+    # ------------------------
+    # Perfect mazes
+    # ------------------------
+    # Maze cells sit on even (row, col) coordinates, walls and passages on the
+    # odd ones in between. Cells are numbered i * w + j on the (h x w) cell
+    # lattice; the grid rows are bytearrays (1 byte per cell). Every cell is
+    # reachable from every other through exactly one path, so ensureSolvable
+    # is not needed. With an even row/col count the last grid row/col stays
+    # wall and the goal is the last lattice cell.
+
+    def _generatePerfect(self, params: MazeGenParams, rng: random.Random) -> Tuple[Grid, State, State]:
+        builders: Dict[str, Callable[[int, int, random.Random, Callable[[int, int], None]], None]] = {
+            "backtracker": self._backtracker,
+            "kruskal": self._kruskal,
+            "wilson": self._wilson,
+        }
+        build = builders.get(params.algorithm)
+        if build is None:
+            raise ValueError(f"Unknown maze algorithm: {params.algorithm}")
+
+        rows = max(1, params.rows)
+        cols = max(1, params.cols)
+        h = (rows + 1) // 2
+        w = (cols + 1) // 2
+
+        grid: List[bytearray] = [bytearray(b"\x01" * cols) for _ in range(rows)]
+        for i in range(h):
+            row = grid[2 * i]
+            row[0:2 * w:2] = bytes(w)
+
+        def carve(a: int, b: int) -> None:
+            # open the wall between neighbouring lattice cells a and b
+            ai, aj = divmod(a, w)
+            bi, bj = divmod(b, w)
+            grid[ai + bi][aj + bj] = 0
+
+        build(h, w, rng, carve)
+
+        start: State = (0, 0)
+        goal: State = (2 * (h - 1), 2 * (w - 1))
+        return grid, start, goal
+
+    def _backtracker(self, h: int, w: int, rng: random.Random, carve: Callable[[int, int], None]) -> None:
+        # recursive backtracker on an explicit stack
+        n = h * w
+        visited = bytearray(n)
+        rand = rng.random
+
+        cur = 0
+        visited[cur] = 1
+        stack = [cur]
+        options = [0, 0, 0, 0]
+
+        while stack:
+            cur = stack[-1]
+            i, j = divmod(cur, w)
+
+            k = 0
+            if i > 0 and not visited[cur - w]:
+                options[k] = cur - w
+                k += 1
+            if i < h - 1 and not visited[cur + w]:
+                options[k] = cur + w
+                k += 1
+            if j > 0 and not visited[cur - 1]:
+                options[k] = cur - 1
+                k += 1
+            if j < w - 1 and not visited[cur + 1]:
+                options[k] = cur + 1
+                k += 1
+
+            if k == 0:
+                stack.pop()
+                continue
+
+            nxt = options[int(rand() * k)]
+            visited[nxt] = 1
+            carve(cur, nxt)
+            stack.append(nxt)
+
+    def _kruskal(self, h: int, w: int, rng: random.Random, carve: Callable[[int, int], None]) -> None:
+        # randomized Kruskal; edges encoded as cell * 2 + (0 = right, 1 = down)
+        n = h * w
+        parent = list(range(n))
+
+        edges = [2 * c for c in range(n) if c % w != w - 1]
+        edges += [2 * c + 1 for c in range(n - w)]
+        rng.shuffle(edges)
+
+        joined = 0
+        for e in edges:
+            a = e >> 1
+            b = a + (w if e & 1 else 1)
+
+            # find with path halving
+            while parent[a] != a:
+                parent[a] = parent[parent[a]]
+                a = parent[a]
+            while parent[b] != b:
+                parent[b] = parent[parent[b]]
+                b = parent[b]
+
+            if a == b:
+                continue
+
+            parent[b] = a
+            a = e >> 1
+            carve(a, a + (w if e & 1 else 1))
+
+            joined += 1
+            if joined == n - 1:
+                return
+
+    def _wilson(self, h: int, w: int, rng: random.Random, carve: Callable[[int, int], None]) -> None:
+        # Wilson's algorithm: loop-erased random walks (uniform spanning tree)
+        n = h * w
+        inTree = bytearray(n)
+        nextCell = [0] * n
+        rand = rng.random
+
+        inTree[int(rand() * n)] = 1
+        options = [0, 0, 0, 0]
+
+        for s in range(n):
+            if inTree[s]:
+                continue
+
+            # walk until the tree is hit; overwriting nextCell erases loops
+            cur = s
+            while not inTree[cur]:
+                i, j = divmod(cur, w)
+                k = 0
+                if i > 0:
+                    options[k] = cur - w
+                    k += 1
+                if i < h - 1:
+                    options[k] = cur + w
+                    k += 1
+                if j > 0:
+                    options[k] = cur - 1
+                    k += 1
+                if j < w - 1:
+                    options[k] = cur + 1
+                    k += 1
+                nxt = options[int(rand() * k)]
+                nextCell[cur] = nxt
+                cur = nxt
+
+            cur = s
+            while not inTree[cur]:
+                inTree[cur] = 1
+                carve(cur, nextCell[cur])
+                cur = nextCell[cur]
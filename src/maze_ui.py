@@ -3,10 +3,33 @@
 # =========================
 from __future__ import annotations
 
-from typing import Any, Dict, Optional
-
-from .core_types import Grid, MazeGenParams, State
-
+from typing import Any, Dict, List, Optional, Tuple
+import math
+
+from .core_types import Action, Grid, MazeGenParams, State
+
+_FLOOR = (30, 30, 30)
+_WALL = (60, 60, 60)
+_LINES = (15, 15, 15)
+_HUD_H = 90
+_MINIMAP = 160        # max minimap side in pixels
+_MIN_ZOOM = 1.0 / 64  # pixels per cell
+_MAX_ZOOM = 64.0
+_ARROW_ZOOM = 8       # arrows only from this many pixels per cell
+
+
+def _qPalette() -> List[Tuple[int, int, int]]:
+    # index 0 = no Q row (transparent), 1..255 = max-Q from -scale (red)
+    # through 0 (dark) to +scale (green). Drawn opaque: per-surface alpha
+    # on a full-view blit costs several times the rest of the frame.
+    pal = [(0, 0, 0)]
+    for i in range(1, 256):
+        t = (i - 128) / 127.0
+        if t < 0:
+            pal.append((int(40 - 215 * t), 40, 40))
+        else:
+            pal.append((40, int(40 + 215 * t), int(40 + 80 * t)))
+    return pal
 
 
 class MazeUI:
@@ -15,10 +38,26 @@ class MazeUI:
     # - drawAgent(pos)
     # - updateScreen()
 
-    def __init__(self, cellSize: int = 28, fps: int = 60) -> None:
+    def __init__(self, cellSize: int = 28, fps: int = 60, maxWindow: Tuple[int, int] = (1280, 800)) -> None:
         self._cellSize = cellSize
         self._fps = fps
 
+        # Camera: the maze view is maxWindow at most; cells outside it are
+        # never touched. _zoom is pixels per cell (starts at cellSize),
+        # _camR/_camC the top-left visible cell.
+        self._maxWindow: Tuple[int, int] = maxWindow
+        self._viewW: int = 0
+        self._viewH: int = 0
+        self._zoom: float = float(cellSize)
+        self._camR: int = 0
+        self._camC: int = 0
+        self._showMinimap: bool = True
+
+        # per-grid surfaces: _levels[L] has one pixel per 2**L x 2**L cells
+        self._levelsFor: Optional[Grid] = None
+        self._levels: List[Any] = []
+        self._minimap = None
+
         self._pygame = None
         self._screen = None
         self._clock = None
@@ -36,9 +75,24 @@ class MazeUI:
         self._nextEpisode: bool = False
         self._fpsDelta: int = 0
         self._episodesDelta: int = 0
+        self._exposed: bool = False
 
         self._lastHud: Dict[str, Any] = {}
 
+        # Q overlay (V key): max-Q colour per cell and greedy-action arrows.
+        # Both layers are updated from the agent's dirty set each frame;
+        # they are rebuilt only when the Q table object, the colour scale
+        # or (arrows) the camera changes.
+        self._qAgent = None
+        self._showQ: bool = False
+        self._qTable: Optional[Dict[State, List[float]]] = None
+        self._qScale: float = 1.0
+        self._qData: Optional[bytearray] = None
+        self._qCells = None
+        self._qArrows = None
+        self._qArrowKey: Optional[Tuple[Any, ...]] = None
+        self._glyphs: Dict[Tuple[int, int], Any] = {}
+
     def _ensureInit(self, widthCells: int, heightCells: int) -> None:
         if self._pygame is not None:
             return
@@ -48,10 +102,10 @@ class MazeUI:
         self._pygame = pygame
         pygame.init()
 
-        w = max(320, int(widthCells * self._cellSize))
-        h = max(240, int(heightCells * self._cellSize + 90))  # HUD area
+        self._viewW = max(320, min(self._maxWindow[0], int(widthCells * self._cellSize)))
+        self._viewH = max(150, min(self._maxWindow[1], int(heightCells * self._cellSize)))
 
-        self._screen = pygame.display.set_mode((w, h))
+        self._screen = pygame.display.set_mode((self._viewW, self._viewH + _HUD_H))  # + HUD area
         pygame.display.set_caption("AI-Driven Maze Game")
 
         self._clock = pygame.time.Clock()
@@ -78,59 +132,102 @@ class MazeUI:
           -/_   : decrease FPS
           ]     : +10 episodes target
           [     : -10 episodes target (min 1)
+          Z / X : zoom in / out (large mazes)
+          M     : toggle minimap
+          V     : toggle Q-value / policy overlay
         """
         # If controller calls this before init (before drawGrid), do not crash
         if self._pygame is None:
-            return {
-                "paused": self._paused,
-                "stop": self._stopRequested,
-                "restart_episode": False,
-                "step_once": False,
-                "next_episode": False,
-                "fps_delta": 0,
-                "episodes_delta": 0,
-            }
+            return self._controls()
+
+        self._resetOneShots()
+
+        for event in self._pygame.event.get():
+            self._handleEvent(event)
+
+        return self._controls()
+
+    def waitControls(self, timeoutMs: int = 250) -> Dict[str, Any]:
+        """
+        Same as pollControls(), but sleeps until an event arrives or
+        timeoutMs passes instead of returning immediately (used while paused).
+        """
+        if self._pygame is None:
+            return self._controls()
+
+        self._resetOneShots()
+
+        event = self._pygame.event.wait(int(timeoutMs))
+        if event.type != self._pygame.NOEVENT:
+            self._handleEvent(event)
+
+        for event in self._pygame.event.get():
+            self._handleEvent(event)
+
+        return self._controls()
 
+    def _resetOneShots(self) -> None:
         self._restartEpisode = False
         self._stepOnce = False
         self._nextEpisode = False
         self._fpsDelta = 0
         self._episodesDelta = 0
+        self._exposed = False
 
-        for event in self._pygame.event.get():
-            if event.type == self._pygame.QUIT:
+    def _handleEvent(self, event) -> None:
+        if event.type == self._pygame.QUIT:
+            self._stopRequested = True
+
+        if event.type in (self._pygame.VIDEOEXPOSE, self._pygame.WINDOWEXPOSED):
+            self._exposed = True
+
+        if event.type == self._pygame.KEYDOWN:
+            k = event.key
+
+            if k in (self._pygame.K_q, self._pygame.K_ESCAPE):
                 self._stopRequested = True
 
-            if event.type == self._pygame.KEYDOWN:
-                k = event.key
+            elif k == self._pygame.K_SPACE:
+                self._paused = not self._paused
+
+            elif k == self._pygame.K_RIGHT:
+                self._stepOnce = True
 
-                if k in (self._pygame.K_q, self._pygame.K_ESCAPE):
-                    self._stopRequested = True
+            elif k == self._pygame.K_n:
+                self._nextEpisode = True
 
-                elif k == self._pygame.K_SPACE:
-                    self._paused = not self._paused
+            elif k == self._pygame.K_r:
+                self._restartEpisode = True
 
-                elif k == self._pygame.K_RIGHT:
-                    self._stepOnce = True
+            elif k in (self._pygame.K_PLUS, self._pygame.K_EQUALS, self._pygame.K_KP_PLUS):
+                self._fpsDelta = +10
 
-                elif k == self._pygame.K_n:
-                    self._nextEpisode = True
+            elif k in (self._pygame.K_MINUS, self._pygame.K_UNDERSCORE, self._pygame.K_KP_MINUS):
+                self._fpsDelta = -10
 
-                elif k == self._pygame.K_r:
-                    self._restartEpisode = True
+            elif k == self._pygame.K_RIGHTBRACKET:
+                self._episodesDelta = +10
 
-                elif k in (self._pygame.K_PLUS, self._pygame.K_EQUALS, self._pygame.K_KP_PLUS):
-                    self._fpsDelta = +10
+            elif k == self._pygame.K_LEFTBRACKET:
+                self._episodesDelta = -10
 
-                elif k in (self._pygame.K_MINUS, self._pygame.K_UNDERSCORE, self._pygame.K_KP_MINUS):
-                    self._fpsDelta = -10
+            elif k == self._pygame.K_z:
+                self.setZoom(self._zoom * 2)
+                self._exposed = True
 
-                elif k == self._pygame.K_RIGHTBRACKET:
-                    self._episodesDelta = +10
+            elif k == self._pygame.K_x:
+                self.setZoom(self._zoom / 2)
+                self._exposed = True
 
-                elif k == self._pygame.K_LEFTBRACKET:
-                    self._episodesDelta = -10
+            elif k == self._pygame.K_m:
+                self._showMinimap = not self._showMinimap
+                self._exposed = True
 
+            elif k == self._pygame.K_v:
+                self.setQOverlay(not self._showQ)
+                self._exposed = True
+
+    def _controls(self) -> Dict[str, Any]:
         return {
             "paused": self._paused,
             "stop": self._stopRequested,
@@ -139,11 +236,32 @@ class MazeUI:
             "next_episode": self._nextEpisode,
             "fps_delta": self._fpsDelta,
             "episodes_delta": self._episodesDelta,
+            "redraw": self._exposed,
         }
 
     def setHud(self, stats: Dict[str, Any]) -> None:
         self._lastHud = stats
 
+    def adjustFps(self, delta: int) -> int:
+        # +/- keys: frame cap clamped to 10..240
+        self._fps = max(10, min(240, self._fps + int(delta)))
+        return self._fps
+
+    def setAgent(self, agent) -> None:
+        # agent whose Q table the overlay shows
+        self._qAgent = agent
+        if self._showQ:
+            self.setQOverlay(True)
+
+    def setQOverlay(self, on: bool) -> None:
+        self._showQ = bool(on)
+        self._qTable = None  # full rebuild on the next frame
+        if self._qAgent is not None:
+            if self._showQ:
+                self._qAgent.takeDirty()
+            else:
+                self._qAgent.stopDirty()
+
     # ------------------------
     # UML rendering
     # ------------------------
@@ -157,33 +275,248 @@ class MazeUI:
         self._grid = grid
         self._goal = env.goalPos
 
-        self._screen.fill((20, 20, 20))
-
-        for r in range(rows):
-            for c in range(cols):
-                x = c * self._cellSize
-                y = r * self._cellSize
+        if self._levelsFor is not grid:
+            self._buildLevels(grid, rows, cols)
 
-                color = (60, 60, 60) if grid[r][c] == 1 else (30, 30, 30)
+        self._follow(env.agentPos, rows, cols)
 
-                self._pygame.draw.rect(self._screen, color, (x, y, self._cellSize, self._cellSize))
-                self._pygame.draw.rect(self._screen, (15, 15, 15), (x, y, self._cellSize, self._cellSize), 1)
+        self._screen.fill((20, 20, 20))
+        self._blitView(rows, cols)
+
+        z = self._zoom
+        if z >= 8:
+            # cell borders, visible cells only
+            vr, vc = self._visibleCells(rows, cols)
+            h = int(vr * z)
+            w = int(vc * z)
+            for i in range(vr + 1):
+                self._pygame.draw.line(self._screen, _LINES, (0, int(i * z)), (w, int(i * z)))
+            for j in range(vc + 1):
+                self._pygame.draw.line(self._screen, _LINES, (int(j * z), 0), (int(j * z), h))
+
+        if self._showQ and self._qAgent is not None:
+            self._drawQOverlay(rows, cols)
 
         if self._goal is not None:
-            gr, gc = self._goal
-            gx = gc * self._cellSize
-            gy = gr * self._cellSize
-            self._pygame.draw.rect(self._screen, (0, 120, 0), (gx, gy, self._cellSize, self._cellSize))
+            self._drawCell(self._goal, (0, 120, 0))
 
         self._drawHudArea()
 
     def drawAgent(self, pos: State) -> None:
         self._agent = pos
+        self._drawCell(pos, (120, 50, 0))
+
+        if self._showMinimap and self._minimap is not None:
+            self._drawMinimap()
+
+    # ------------------------
+    # Camera / viewport
+    # ------------------------
+    def setZoom(self, zoom: float) -> None:
+        self._zoom = min(_MAX_ZOOM, max(_MIN_ZOOM, float(zoom)))
+
+    def _visibleCells(self, rows: int, cols: int) -> Tuple[int, int]:
+        vr = min(rows - self._camR, int(math.ceil(self._viewH / self._zoom)))
+        vc = min(cols - self._camC, int(math.ceil(self._viewW / self._zoom)))
+        return max(0, vr), max(0, vc)
+
+    def _follow(self, pos: Optional[State], rows: int, cols: int) -> None:
+        # recentre when the agent leaves the middle 60% of the view
+        spanR = self._viewH / self._zoom
+        spanC = self._viewW / self._zoom
+
+        if pos is not None:
+            r, c = pos
+            if not (self._camR + 0.2 * spanR <= r < self._camR + 0.8 * spanR):
+                self._camR = int(r - spanR / 2)
+            if not (self._camC + 0.2 * spanC <= c < self._camC + 0.8 * spanC):
+                self._camC = int(c - spanC / 2)
+
+        self._camR = max(0, min(self._camR, rows - int(spanR))) if spanR < rows else 0
+        self._camC = max(0, min(self._camC, cols - int(spanC))) if spanC < cols else 0
+
+    def _buildLevels(self, grid: Grid, rows: int, cols: int) -> None:
+        # level 0: one 8-bit pixel per cell; each further level halves both
+        # sides (smoothscale averages walls and floor into greys)
+        pg = self._pygame
+        data = bytearray()
+        for row in grid:
+            data += bytes(1 if v else 0 for v in row)
+
+        base = pg.image.frombuffer(data, (cols, rows), "P")
+        base.set_palette([_FLOOR, _WALL] + [(0, 0, 0)] * 254)
+        levels = [base.convert()]
+        while max(levels[-1].get_size()) > 1 and 2 ** len(levels) < 1 / _MIN_ZOOM:
+            w, h = levels[-1].get_size()
+            levels.append(pg.transform.smoothscale(levels[-1], (max(1, (w + 1) // 2), max(1, (h + 1) // 2))))
+
+        self._levels = levels
+        self._levelsFor = grid
+
+        # minimap: only needed when the maze does not fit the window
+        self._minimap = None
+        if rows * self._cellSize > self._viewH or cols * self._cellSize > self._viewW:
+            level = next((lv for lv in levels if max(lv.get_size()) <= 2 * _MINIMAP), levels[-1])
+            k = _MINIMAP / max(rows, cols)
+            self._minimap = pg.transform.smoothscale(level, (max(1, int(cols * k)), max(1, int(rows * k))))
+
+    def _blitView(self, rows: int, cols: int) -> None:
+        # scale only the visible part of the finest level that still has at
+        # least one pixel per screen pixel
+        z = self._zoom
+        L = 0 if z >= 1 else min(len(self._levels) - 1, int(math.ceil(math.log2(1 / z) - 1e-9)))
+        level = self._levels[L]
+        step = 2 ** L
+
+        vr, vc = self._visibleCells(rows, cols)
+        lw, lh = level.get_size()
+        x0 = self._camC // step
+        y0 = self._camR // step
+        w = min(lw - x0, (vc + step - 1) // step + 1)
+        h = min(lh - y0, (vr + step - 1) // step + 1)
+        if w <= 0 or h <= 0:
+            return
+
+        sub = level.subsurface((x0, y0, w, h))
+        size = (max(1, int(round(w * step * z))), max(1, int(round(h * step * z))))
+        view = self._pygame.transform.scale(sub, size)
+        ox = -int((self._camC - x0 * step) * z)
+        oy = -int((self._camR - y0 * step) * z)
+        self._screen.blit(view, (ox, oy), (0, 0, self._viewW - ox, self._viewH - oy))
 
+    def _drawCell(self, pos: State, color: Tuple[int, int, int]) -> None:
         r, c = pos
-        x = c * self._cellSize
-        y = r * self._cellSize
-        self._pygame.draw.rect(self._screen, (120, 50, 0), (x, y, self._cellSize, self._cellSize))
+        z = self._zoom
+        x = (c - self._camC) * z
+        y = (r - self._camR) * z
+        if -z < x < self._viewW and -z < y < self._viewH:
+            size = max(4, int(math.ceil(z)))  # stays visible when zoomed out
+            self._pygame.draw.rect(self._screen, color, (int(x), int(y), size, size))
+
+    def _drawMinimap(self) -> None:
+        mm = self._minimap
+        rows = len(self._grid)
+        cols = len(self._grid[0])
+        mw, mh = mm.get_size()
+        x0 = self._viewW - mw - 8
+        y0 = 8
+        k = mw / cols
+
+        self._screen.blit(mm, (x0, y0))
+        self._pygame.draw.rect(self._screen, (200, 200, 200), (x0 - 1, y0 - 1, mw + 2, mh + 2), 1)
+
+        vr, vc = self._visibleCells(rows, cols)
+        self._pygame.draw.rect(
+            self._screen,
+            (230, 200, 40),
+            (x0 + int(self._camC * k), y0 + int(self._camR * k), max(2, int(vc * k)), max(2, int(vr * k))),
+            1,
+        )
+        if self._agent is not None:
+            ar, ac = self._agent
+            self._pygame.draw.circle(self._screen, (255, 80, 40), (x0 + int(ac * k), y0 + int(ar * k)), 2)
+
+    # ------------------------
+    # Q overlay
+    # ------------------------
+    def _qIndex(self, row: Optional[List[float]]) -> int:
+        if row is None:
+            return 0
+        t = max(row) / self._qScale
+        return 128 + int(round(127 * max(-1.0, min(1.0, t))))
+
+    def _rebuildQCells(self, table: Dict[State, List[float]], rows: int, cols: int) -> None:
+        peak = max((abs(max(q)) for q in table.values()), default=0.0)
+        while self._qScale < peak:
+            self._qScale *= 2
+
+        data = bytearray(rows * cols)
+        for (r, c), q in table.items():
+            if 0 <= r < rows and 0 <= c < cols:
+                data[r * cols + c] = self._qIndex(q)
+
+        # the surface shares data, so dirty cells are plain byte writes
+        surf = self._pygame.image.frombuffer(data, (cols, rows), "P")
+        surf.set_palette(_qPalette())
+        self._qData = data
+        self._qCells = surf
+        self._qTable = table
+        self._qArrowKey = None
+
+    def _glyph(self, action: int, size: int):
+        key = (action, size)
+        g = self._glyphs.get(key)
+        if g is None:
+            pg = self._pygame
+            g = pg.Surface((size, size), pg.SRCALPHA)
+            h = size / 2.0
+            a = size * 0.32
+            # arrow pointing right, then rotated to the action's direction
+            pts = [(h - a, h - a * 0.25), (h, h - a * 0.25), (h, h - a * 0.7), (h + a, h),
+                   (h, h + a * 0.7), (h, h + a * 0.25), (h - a, h + a * 0.25)]
+            dr, dc = Action.delta(action)
+            pts = [(h + (x - h) * dc - (y - h) * dr, h + (x - h) * dr + (y - h) * dc) for x, y in pts]
+            pg.draw.polygon(g, (235, 235, 235, 220), pts)
+            self._glyphs[key] = g
+        return g
+
+    def _drawArrow(self, table: Dict[State, List[float]], r: int, c: int, size: int) -> None:
+        x = int((c - self._camC) * self._zoom)
+        y = int((r - self._camR) * self._zoom)
+        self._qArrows.fill((0, 0, 0, 0), (x, y, size, size))
+        q = table.get((r, c))
+        if q is None or max(q) == min(q):
+            return
+        best = q.index(max(q))
+        self._qArrows.blit(self._glyph(best, size), (x, y))
+
+    def _drawQOverlay(self, rows: int, cols: int) -> None:
+        table = self._qAgent.qTable
+        dirty = self._qAgent.takeDirty()
+
+        if table is not self._qTable or self._qData is None or len(self._qData) != rows * cols:
+            self._rebuildQCells(table, rows, cols)
+            dirty = set()
+        else:
+            data = self._qData
+            for (r, c) in dirty:
+                q = table.get((r, c))
+                if q is not None and abs(max(q)) > self._qScale:
+                    self._rebuildQCells(table, rows, cols)
+                    dirty = set()
+                    break
+                data[r * cols + c] = self._qIndex(q)
+
+        # colours: scaled visible part of the per-cell layer, as _blitView
+        vr, vc = self._visibleCells(rows, cols)
+        if vr <= 0 or vc <= 0:
+            return
+        z = self._zoom
+        sub = self._qCells.subsurface((self._camC, self._camR, vc, vr))
+        view = self._pygame.transform.scale(sub, (max(1, int(round(vc * z))), max(1, int(round(vr * z)))))
+        view.set_colorkey(0)
+        self._screen.blit(view, (0, 0))
+
+        if z < _ARROW_ZOOM:
+            return
+
+        size = int(z)
+        key = (self._camR, self._camC, z, vr, vc)
+        if key != self._qArrowKey:
+            if self._qArrows is None:
+                self._qArrows = self._pygame.Surface((self._viewW, self._viewH), self._pygame.SRCALPHA)
+            self._qArrows.fill((0, 0, 0, 0))
+            for r in range(self._camR, self._camR + vr):
+                for c in range(self._camC, self._camC + vc):
+                    if (r, c) in table:
+                        self._drawArrow(table, r, c, size)
+            self._qArrowKey = key
+        else:
+            for (r, c) in dirty:
+                if self._camR <= r < self._camR + vr and self._camC <= c < self._camC + vc:
+                    self._drawArrow(table, r, c, size)
+
+        self._screen.blit(self._qArrows, (0, 0))
 
     def updateScreen(self) -> None:
         # Keep window responsive (especially on WSL/Wayland)
@@ -198,20 +531,22 @@ class MazeUI:
         if self._grid is None:
             return
 
-        rows = len(self._grid)
-        y0 = rows * self._cellSize
+        y0 = self._viewH
 
-        self._pygame.draw.rect(self._screen, (10, 10, 10), (0, y0, self._screen.get_width(), 90))
+        self._pygame.draw.rect(self._screen, (10, 10, 10), (0, y0, self._screen.get_width(), _HUD_H))
         self._pygame.draw.line(self._screen, (30, 30, 30), (0, y0), (self._screen.get_width(), y0), 2)
 
         hud = self._lastHud or {}
 
         lines = [
             f"mode={hud.get('mode','?')}  ep={hud.get('episode','?')}/{hud.get('episodes_target','?')}  "
-            f"t={hud.get('t','?')}  totalR={hud.get('total_reward','?')}  success={hud.get('success_rate','?')}%",
+            f"t={hud.get('t','?')}  totalR={hud.get('total_reward','?')}  success={hud.get('success_rate','?')}%  "
+            f"emaR={hud.get('reward_ema','?')}  p95steps={hud.get('steps_p95','?')}",
             f"alpha={hud.get('alpha','?')}  gamma={hud.get('gamma','?')}  eps={hud.get('epsilon','?')}  "
-            f"heurRate={hud.get('heuristicRate','?')}  fps={self._fps}  paused={hud.get('paused', False)}",
-            "keys: SPACE pause | RIGHT step | N next ep | R restart ep | +/- fps | [/] eps target | Q/ESC stop",
+            f"heurRate={hud.get('heuristicRate','?')}  sched={hud.get('schedule','const')}  "
+            f"fps={self._fps}  paused={hud.get('paused', False)}",
+            "keys: SPACE pause | RIGHT step | N next ep | R restart ep | +/- fps | [/] eps target | "
+            f"Z/X zoom ({self._zoom:g}px) | M minimap | V q-overlay | Q/ESC stop",
         ]
 
         for i, txt in enumerate(lines):
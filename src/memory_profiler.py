@@ -0,0 +1,164 @@
+# =========================
+# file: src/memory_profiler.py
+# =========================
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Dict, Optional
+import csv
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+if TYPE_CHECKING:
+    from .main_controller import MainController
+
+# innermost-frame source file -> category
+CATEGORIES: Dict[str, str] = {
+    "hybrid_agent.py": "qtable",
+    "checkpoint.py": "qtable",
+    "experience_replay.py": "replay",
+    "pathfinder.py": "pathfinder",
+    "alt_pathfinder.py": "pathfinder",
+    "hpa_pathfinder.py": "pathfinder",
+    "corridor_pathfinder.py": "pathfinder",
+    "move_masks.py": "pathfinder",
+    "logger.py": "logger",
+    "telemetry.py": "logger",
+    "maze_ui.py": "ui",
+    "heatmaps.py": "ui",
+    "environment.py": "environment",
+}
+CATEGORY_NAMES = ("qtable", "replay", "pathfinder", "logger", "ui", "environment", "other")
+
+
+def currentRSS() -> Optional[int]:
+    # resident set size in bytes (Linux /proc), None elsewhere
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError, AttributeError):
+        return None
+
+
+def peakRSS() -> Optional[int]:
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # kilobytes on Linux, bytes on macOS
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def surfaceBytes(ui: Any) -> int:
+    # pygame pixel buffers live in SDL's allocator, invisible to tracemalloc
+    if ui is None:
+        return 0
+    total = 0
+    for surf in [getattr(ui, "_screen", None), getattr(ui, "_minimap", None)] + list(getattr(ui, "_levels", [])):
+        if surf is not None:
+            w, h = surf.get_size()
+            total += w * h * surf.get_bytesize()
+    return total
+
+
+class MemoryProfiler:
+    # tracemalloc snapshots every `every` episodes:
+    # - <outDir>/memory_timeline.csv   one row per snapshot: traced / peak /
+    #   RSS bytes, bytes per category, Q-table states, UI surface bytes
+    # - <outDir>/memory_top.json       top allocation sites of the last
+    #   snapshot and the largest growth since the first one
+    # Categories come from the innermost frame's source file (CATEGORIES).
+
+    def __init__(self, every: int = 1, outDir: str = "./data/memory", topN: int = 20) -> None:
+        self.every: int = max(1, int(every))
+        self.outDir: str = outDir
+        self.topN: int = topN
+
+        self.samples: int = 0
+        self.lastEpisode: Optional[int] = None
+        self._first: Optional[tracemalloc.Snapshot] = None
+        self._last: Optional[tracemalloc.Snapshot] = None
+        self._t0: float = 0.0
+        self._file = None
+        self._writer = None
+        self._started: bool = False
+
+    def start(self) -> None:
+        os.makedirs(self.outDir, exist_ok=True)
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(1)
+            self._started = True
+        self._t0 = time.time()
+
+        self._file = open(os.path.join(self.outDir, "memory_timeline.csv"), "w", newline="", encoding="utf-8")
+        self._writer = csv.writer(self._file)
+        self._writer.writerow(
+            ["episode", "elapsed_s", "traced", "traced_peak", "rss"]
+            + list(CATEGORY_NAMES)
+            + ["qtable_states", "ui_surfaces"]
+        )
+
+    def _categorize(self, snapshot: tracemalloc.Snapshot) -> Dict[str, int]:
+        out = {name: 0 for name in CATEGORY_NAMES}
+        for stat in snapshot.statistics("filename"):
+            name = os.path.basename(stat.traceback[0].filename)
+            out[CATEGORIES.get(name, "other")] += stat.size
+        return out
+
+    def sample(self, episode: int, controller: "MainController", force: bool = False) -> Optional[Dict[str, Any]]:
+        if self._writer is None or episode == self.lastEpisode or (not force and episode % self.every != 0):
+            return None
+        self.lastEpisode = episode
+
+        snapshot = tracemalloc.take_snapshot().filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, __file__),
+        ))
+        if self._first is None:
+            self._first = snapshot
+        self._last = snapshot
+
+        traced, peak = tracemalloc.get_traced_memory()
+        cats = self._categorize(snapshot)
+        row = {
+            "episode": episode,
+            "elapsed_s": round(time.time() - self._t0, 3),
+            "traced": traced,
+            "traced_peak": peak,
+            "rss": currentRSS(),
+            **cats,
+            "qtable_states": len(controller.agent.qTable),
+            "ui_surfaces": surfaceBytes(controller.ui),
+        }
+        self._writer.writerow(list(row.values()))
+        self._file.flush()
+        self.samples += 1
+        return row
+
+    def finish(self) -> Optional[str]:
+        if self._writer is None:
+            return None
+
+        report: Dict[str, Any] = {"samples": self.samples, "top": [], "growth": []}
+        if self._last is not None:
+            for stat in self._last.statistics("lineno")[:self.topN]:
+                frame = stat.traceback[0]
+                report["top"].append({"site": f"{frame.filename}:{frame.lineno}", "bytes": stat.size, "blocks": stat.count})
+            for diff in self._last.compare_to(self._first, "lineno")[:self.topN]:
+                frame = diff.traceback[0]
+                report["growth"].append({"site": f"{frame.filename}:{frame.lineno}", "bytes": diff.size_diff, "blocks": diff.count_diff})
+
+        path = os.path.join(self.outDir, "memory_top.json")
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+
+        self._file.close()
+        self._file = None
+        self._writer = None
+        if self._started:
+            tracemalloc.stop()
+            self._started = False
+        return path
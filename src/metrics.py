@@ -0,0 +1,228 @@
+# =========================
+# file: src/metrics.py
+# =========================
+from __future__ import annotations
+
+from collections import deque
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+import json
+import os
+
+
+class RollingWindow:
+    # mean of the last `length` values with a running sum (O(1) per update)
+
+    def __init__(self, length: int) -> None:
+        self.length: int = max(1, int(length))
+        self._values: deque = deque(maxlen=self.length)
+        self._sum: float = 0.0
+
+    def add(self, x: float) -> None:
+        if len(self._values) == self.length:
+            self._sum -= self._values[0]
+        self._values.append(x)
+        self._sum += x
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def mean(self) -> float:
+        return self._sum / len(self._values) if self._values else 0.0
+
+
+class Ema:
+    def __init__(self, alpha: float = 0.05) -> None:
+        self.alpha: float = float(alpha)
+        self.value: Optional[float] = None
+
+    def add(self, x: float) -> None:
+        if self.value is None:
+            self.value = float(x)
+        else:
+            self.value += self.alpha * (x - self.value)
+
+
+class P2Quantile:
+    # P-square streaming quantile estimate (Jain & Chlamtac, 1985): five
+    # markers, O(1) memory and time per update, no stored samples.
+
+    def __init__(self, p: float) -> None:
+        self.p: float = float(p)
+        self.n: int = 0
+        self._q: List[float] = []
+        self._pos: List[float] = [1.0, 2.0, 3.0, 4.0, 5.0]
+        self._des: List[float] = [1.0, 1.0 + 2 * p, 1.0 + 4 * p, 3.0 + 2 * p, 5.0]
+        self._inc: Tuple[float, ...] = (0.0, p / 2, p, (1.0 + p) / 2, 1.0)
+
+    def add(self, x: float) -> None:
+        self.n += 1
+        q = self._q
+
+        if self.n <= 5:
+            q.append(float(x))
+            q.sort()
+            return
+
+        pos = self._pos
+        if x < q[0]:
+            q[0] = x
+            k = 0
+        elif x >= q[4]:
+            q[4] = x
+            k = 3
+        else:
+            k = 0
+            while x >= q[k + 1]:
+                k += 1
+
+        for i in range(k + 1, 5):
+            pos[i] += 1
+        for i in range(5):
+            self._des[i] += self._inc[i]
+
+        for i in (1, 2, 3):
+            d = self._des[i] - pos[i]
+            if (d >= 1 and pos[i + 1] - pos[i] > 1) or (d <= -1 and pos[i - 1] - pos[i] < -1):
+                s = 1 if d > 0 else -1
+                qp = q[i] + s / (pos[i + 1] - pos[i - 1]) * (
+                    (pos[i] - pos[i - 1] + s) * (q[i + 1] - q[i]) / (pos[i + 1] - pos[i])
+                    + (pos[i + 1] - pos[i] - s) * (q[i] - q[i - 1]) / (pos[i] - pos[i - 1])
+                )
+                if not q[i - 1] < qp < q[i + 1]:
+                    qp = q[i] + s * (q[i + s] - q[i]) / (pos[i + s] - pos[i])
+                q[i] = qp
+                pos[i] += s
+
+    def value(self) -> float:
+        if not self._q:
+            return 0.0
+        if self.n <= 5:
+            idx = min(len(self._q) - 1, int(round(self.p * (len(self._q) - 1))))
+            return self._q[idx]
+        return self._q[2]
+
+
+class SeriesMetrics:
+    # rolling means, EMA and (optionally) quantiles for one value stream
+
+    def __init__(self, windows: Sequence[int], emaAlpha: float, quantiles: Sequence[float]) -> None:
+        self.windows: Dict[int, RollingWindow] = {w: RollingWindow(w) for w in windows}
+        self.ema: Ema = Ema(emaAlpha)
+        self.quantiles: Dict[float, P2Quantile] = {p: P2Quantile(p) for p in quantiles}
+        self.count: int = 0
+        self.last: float = 0.0
+
+    def add(self, x: float) -> None:
+        self.count += 1
+        self.last = x
+        for w in self.windows.values():
+            w.add(x)
+        self.ema.add(x)
+        for q in self.quantiles.values():
+            q.add(x)
+
+    def snapshot(self) -> Dict[str, Any]:
+        out: Dict[str, Any] = {"count": self.count, "last": self.last}
+        for length, w in self.windows.items():
+            out[f"w{length}"] = w.mean()
+        out["ema"] = self.ema.value
+        for p, q in self.quantiles.items():
+            out[f"p{int(round(p * 100))}"] = q.value()
+        return out
+
+
+class MetricsEngine:
+    # Streaming train/eval metrics: success, steps, reward and episode
+    # latency, all updated in O(1) per episode.
+    # Methods:
+    # - record(mode, steps, reward, success, latencyS)
+    # - successRate(mode)        mean over the first (primary) window
+    # - snapshot() / hudFields() / episodeColumns(mode)
+    # - writeSummary(path)
+
+    SERIES = ("success", "steps", "reward", "latency_ms")
+
+    def __init__(
+        self,
+        windows: Sequence[int] = (50,),
+        emaAlpha: float = 0.05,
+        quantiles: Sequence[float] = (0.5, 0.95, 0.99),
+    ) -> None:
+        self.windows: Tuple[int, ...] = tuple(int(w) for w in windows) or (50,)
+        self.emaAlpha: float = emaAlpha
+        self.quantileLevels: Tuple[float, ...] = tuple(quantiles)
+
+        self._modes: Dict[str, Dict[str, SeriesMetrics]] = {}
+
+    def _mode(self, mode: str) -> Dict[str, SeriesMetrics]:
+        m = self._modes.get(mode)
+        if m is None:
+            m = self._modes[mode] = {
+                name: SeriesMetrics(
+                    self.windows,
+                    self.emaAlpha,
+                    () if name == "success" else self.quantileLevels,
+                )
+                for name in self.SERIES
+            }
+        return m
+
+    def record(self, mode: str, steps: int, reward: float, success: bool, latencyS: float = 0.0) -> None:
+        m = self._mode(mode)
+        m["success"].add(1.0 if success else 0.0)
+        m["steps"].add(float(steps))
+        m["reward"].add(float(reward))
+        m["latency_ms"].add(1000.0 * float(latencyS))
+
+    def count(self, mode: str) -> int:
+        m = self._modes.get(mode)
+        return m["success"].count if m else 0
+
+    def successRate(self, mode: str = "train", window: Optional[int] = None) -> float:
+        m = self._modes.get(mode)
+        if m is None:
+            return 0.0
+        return m["success"].windows[window or self.windows[0]].mean()
+
+    def value(self, mode: str, series: str, stat: str) -> Optional[float]:
+        m = self._modes.get(mode)
+        if m is None:
+            return None
+        return m[series].snapshot().get(stat)
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            mode: {name: s.snapshot() for name, s in series.items()}
+            for mode, series in self._modes.items()
+        }
+
+    def episodeColumns(self, mode: str) -> Dict[str, Any]:
+        # extra columns for Logger.logEpisode (see EPISODE_METRIC_COLUMNS)
+        m = self._modes.get(mode)
+        if m is None:
+            return {}
+        w = self.windows[0]
+        return {
+            "sr_window": round(m["success"].windows[w].mean(), 4),
+            "reward_ema": round(m["reward"].ema.value or 0.0, 3),
+            "steps_p95": round(m["steps"].quantiles[0.95].value(), 1) if 0.95 in m["steps"].quantiles else "",
+            "latency_ms": round(m["latency_ms"].last, 3),
+        }
+
+    def hudFields(self, mode: str = "train") -> Dict[str, Any]:
+        m = self._modes.get(mode)
+        if m is None:
+            return {}
+        out: Dict[str, Any] = {"reward_ema": f"{m['reward'].ema.value or 0.0:.1f}"}
+        if 0.95 in m["steps"].quantiles:
+            out["steps_p95"] = f"{m['steps'].quantiles[0.95].value():.0f}"
+        return out
+
+    def writeSummary(self, path: str) -> None:
+        folder = os.path.dirname(path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        tmp = path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(self.snapshot(), f, indent=2)
+        os.replace(tmp, path)
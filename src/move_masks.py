@@ -0,0 +1,112 @@
+# =========================
+# file: src/move_masks.py
+# =========================
+from __future__ import annotations
+
+from typing import Dict, List, Tuple
+import threading
+
+from .core_types import Action, Grid
+
+# per-action row/col deltas, indexed by Action value (same as Action.delta)
+DELTA_R = (-1, 1, 0, 0)
+DELTA_C = (0, 0, -1, 1)
+
+# legal actions for each 4-bit mask (bit a set <=> action a is legal)
+VALID_ACTIONS: Tuple[Tuple[int, ...], ...] = tuple(
+    tuple(a for a in Action.ALL if m >> a & 1) for m in range(16)
+)
+
+# number of legal moves for each mask
+DEGREE: Tuple[int, ...] = tuple(len(v) for v in VALID_ACTIONS)
+
+# CORRIDOR_NEXT[mask][a]: after entering a cell with action a, the only
+# action that continues along the corridor; -1 unless the cell has exactly
+# two moves and one of them leads back (opposite actions differ in bit 0)
+CORRIDOR_NEXT: Tuple[Tuple[int, ...], ...] = tuple(
+    tuple(
+        next(b for b in VALID_ACTIONS[m] if b != a ^ 1)
+        if DEGREE[m] == 2 and (a ^ 1) in VALID_ACTIONS[m] else -1
+        for a in Action.ALL
+    )
+    for m in range(16)
+)
+
+
+class MoveMasks:
+    # One byte per cell (flat id r * cols + c): bit a is set when moving
+    # with action a from that cell stays on the grid and lands on a free
+    # cell. Computed once per grid; callers that edit a grid in place must
+    # call invalidateMoves(grid).
+
+    def __init__(self, grid: Grid) -> None:
+        self.grid: Grid = grid
+        self.rows: int = len(grid)
+        self.cols: int = len(grid[0]) if self.rows else 0
+
+        # flat-id offset of each action
+        self.offsets: Tuple[int, int, int, int] = (-self.cols, self.cols, -1, 1)
+
+        self.masks: bytearray = bytearray(self.rows * self.cols)
+        self._build()
+
+    def _build(self) -> None:
+        rows, cols = self.rows, self.cols
+        if cols == 0:
+            return
+
+        free: List[List[int]] = [[1 if v == 0 else 0 for v in row] for row in self.grid]
+        none = [0] * cols
+
+        for r in range(rows):
+            up = free[r - 1] if r > 0 else none
+            down = free[r + 1] if r < rows - 1 else none
+            left = [0] + free[r][:-1]
+            right = free[r][1:] + [0]
+            self.masks[r * cols:(r + 1) * cols] = bytes(
+                u | d << 1 | lf << 2 | rt << 3 for u, d, lf, rt in zip(up, down, left, right)
+            )
+
+    def mask(self, r: int, c: int) -> int:
+        return self.masks[r * self.cols + c]
+
+    def validActions(self, r: int, c: int) -> Tuple[int, ...]:
+        return VALID_ACTIONS[self.masks[r * self.cols + c]]
+
+
+_CACHE_SIZE = 8
+_cache: Dict[int, MoveMasks] = {}  # least recently used first
+_cacheLock = threading.Lock()      # shared with async-eval / path-service threads
+
+
+def movesFor(grid: Grid) -> MoveMasks:
+    # cached by grid identity; entries hold a reference to their grid, so an
+    # id cannot be reused while it is cached
+    key = id(grid)
+    m = _cache.get(key)
+    if m is not None and m.grid is grid and next(reversed(_cache)) == key:
+        return m  # already most recent: nothing to reorder (hot path)
+
+    with _cacheLock:
+        m = _cache.pop(key, None)
+        if m is not None and m.grid is grid:
+            _cache[key] = m  # hit: move to the back
+            return m
+
+    m = MoveMasks(grid)
+    with _cacheLock:
+        _cache.pop(key, None)
+        _cache[key] = m
+        while len(_cache) > _CACHE_SIZE:
+            _cache.pop(next(iter(_cache)), None)
+    return m
+
+
+def isCached(masks: MoveMasks) -> bool:
+    # False once the masks were invalidated or evicted (lock-free read)
+    return _cache.get(id(masks.grid)) is masks
+
+
+def invalidateMoves(grid: Grid) -> None:
+    with _cacheLock:
+        _cache.pop(id(grid), None)
@@ -0,0 +1,303 @@
+# =========================
+# file: src/parallel_training.py
+# =========================
+from __future__ import annotations
+
+from array import array
+from typing import Any, Dict, List, Optional, Tuple
+import multiprocessing as mp
+import queue
+import time
+
+from .core_types import Grid, State, TrainingConfig
+from .environment import Environment
+from .hybrid_agent import HybridAgent
+from .logger import Logger
+from .metrics import MetricsEngine
+from .planners import makePathfinder
+from .schedules import makeExplorationSchedule
+
+# action sources as small ints on the wire (see HybridAgent.getActionWithSource)
+SOURCE_CODES = ("greedy", "astar", "random_valid", "random")
+_SOURCE_ID = {s: i for i, s in enumerate(SOURCE_CODES)}
+
+
+class SharedQTable:
+    # Dense Q array (cells * 4 doubles) in shared memory, published by the
+    # learner and copied by actors. A sequence counter (odd while a write is
+    # in progress) lets readers detect torn copies without a lock.
+
+    def __init__(self, rows: int, cols: int, ctx: Any) -> None:
+        self.rows: int = rows
+        self.cols: int = cols
+        self.values = ctx.RawArray("d", rows * cols * 4)
+        self.seq = ctx.RawValue("Q", 0)
+
+    def publish(self, dense: array) -> None:
+        self.seq.value += 1
+        memoryview(self.values).cast("B").cast("d")[:] = dense
+        self.seq.value += 1
+
+    def snapshot(self) -> Tuple[int, array]:
+        while True:
+            before = self.seq.value
+            if before % 2 == 0:
+                out = array("d", memoryview(self.values).cast("B").cast("d"))
+                if self.seq.value == before:
+                    return before, out
+            time.sleep(0)
+
+
+def denseToQTable(dense: array, cols: int) -> Dict[State, List[float]]:
+    out: Dict[State, List[float]] = {}
+    for cell in range(len(dense) // 4):
+        row = dense[4 * cell:4 * cell + 4]
+        if row[0] or row[1] or row[2] or row[3]:
+            out[divmod(cell, cols)] = list(row)
+    return out
+
+
+def qTableToDense(qTable: Dict[State, List[float]], rows: int, cols: int) -> array:
+    dense = array("d", bytes(8 * rows * cols * 4))
+    for (r, c), q in qTable.items():
+        if 0 <= r < rows and 0 <= c < cols:
+            dense[4 * (r * cols + c):4 * (r * cols + c) + 4] = array("d", q)
+    return dense
+
+
+def _actorMain(
+    actorId: int,
+    grid: Grid,
+    start: State,
+    goal: State,
+    config: TrainingConfig,
+    shared: SharedQTable,
+    stop: Any,
+    out: Any,
+    seed: Optional[int],
+    refreshEvery: int,
+) -> None:
+    cols = len(grid[0])
+    env = Environment(grid, start, goal, maxSteps=config.maxStepsPerEpisode)
+    agent = HybridAgent(
+        alpha=config.alpha,
+        gamma=config.gamma,
+        epsilon=config.epsilon,
+        heuristicRate=config.heuristicRate,
+        seed=None if seed is None else seed + 7919 * (actorId + 1),
+        pathfinder=makePathfinder(config),
+    )
+
+    # actors follow the schedule on their share of the global episode count;
+    # the adaptive controller needs eval results and stays with the learner
+    schedule = makeExplorationSchedule(config, adaptive=False)
+    actors = max(1, config.actors)
+
+    seen = -1
+    episodes = 0
+    while not stop.is_set():
+        if schedule is not None:
+            schedule.apply(agent, episodes * actors)
+
+        if episodes % refreshEvery == 0:
+            version, dense = shared.snapshot()
+            if version != seen:
+                agent.qTable = denseToQTable(dense, cols)
+                seen = version
+
+        ints = array("i")
+        rewards = array("d")
+        t0 = time.perf_counter()
+        state = env.reset()
+        totalReward = 0.0
+
+        while True:
+            action, source = agent.getActionWithSource(state, env)
+            nextState, reward, done = env.step(action)
+
+            # local update keeps the actor's policy moving between refreshes;
+            # the learner's table stays authoritative
+            agent.updateQ(state, action, reward, nextState)
+
+            ints.extend((
+                state[0] * cols + state[1],
+                action,
+                nextState[0] * cols + nextState[1],
+                int(done),
+                _SOURCE_ID.get(source, 0),
+            ))
+            rewards.append(reward)
+            totalReward += reward
+            state = nextState
+
+            if done:
+                break
+
+        episodes += 1
+        elapsed = time.perf_counter() - t0
+        out.put((actorId, ints.tobytes(), rewards.tobytes(), env.agentPos == env.goalPos, totalReward, elapsed))
+
+    out.put((actorId, None, None, False, 0.0, 0.0))
+
+
+class ParallelTrainer:
+    # Actor-learner training on one machine:
+    # - N actor processes each run their own Environment with a recent
+    #   snapshot of the Q-table and stream packed transitions back
+    # - the learner (calling process) applies Q updates to a dense table and
+    #   republishes it to shared memory every publishEvery episodes
+
+    def __init__(
+        self,
+        grid: Grid,
+        start: State,
+        goal: State,
+        config: TrainingConfig,
+        logger: Optional[Logger] = None,
+        seed: Optional[int] = None,
+        metrics: Optional[MetricsEngine] = None,
+    ) -> None:
+        self.grid: Grid = grid
+        self.start: State = start
+        self.goal: State = goal
+        self.config: TrainingConfig = config
+        self.logger: Optional[Logger] = logger
+        self.seed: Optional[int] = seed
+        self.metrics: Optional[MetricsEngine] = metrics
+
+        self.rows: int = len(grid)
+        self.cols: int = len(grid[0])
+
+        self.episodesDone: int = 0
+        self.transitions: int = 0
+        self.publishes: int = 0
+
+    def run(
+        self,
+        qTable: Optional[Dict[State, List[float]]] = None,
+        onEpisode: Optional[Any] = None,
+    ) -> Dict[State, List[float]]:
+        # onEpisode(result, qTableProvider) is called on the learner for every
+        # finished actor episode; returns the learned Q-table
+        cfg = self.config
+        ctx = mp.get_context()
+
+        dense = qTableToDense(qTable or {}, self.rows, self.cols)
+        shared = SharedQTable(self.rows, self.cols, ctx)
+        shared.publish(dense)
+
+        stop = ctx.Event()
+        out = ctx.Queue(maxsize=max(4, 8 * cfg.actors))
+
+        procs = [
+            ctx.Process(
+                target=_actorMain,
+                args=(i, self.grid, self.start, self.goal, cfg, shared, stop, out, self.seed, cfg.actorRefreshEvery),
+                daemon=True,
+            )
+            for i in range(cfg.actors)
+        ]
+        for p in procs:
+            p.start()
+
+        alpha = cfg.alpha
+        gamma = cfg.gamma
+        target = max(1, int(cfg.episodes))
+        running = len(procs)
+        sincePublish = 0
+
+        try:
+            while running:
+                try:
+                    actorId, ints, rewards, success, totalReward, elapsed = out.get(timeout=1.0)
+                except queue.Empty:
+                    if not any(p.is_alive() for p in procs):
+                        break
+                    continue
+
+                if ints is None:
+                    running -= 1
+                    continue
+
+                if self.episodesDone >= target:
+                    continue  # actors are finishing their last episode
+
+                tr = array("i")
+                tr.frombytes(ints)
+                rw = array("d")
+                rw.frombytes(rewards)
+
+                self.episodesDone += 1
+                episode = self.episodesDone
+
+                for k in range(len(rw)):
+                    s, a, ns, done, src = tr[5 * k:5 * k + 5]
+                    i = 4 * s + a
+                    j = 4 * ns
+                    best = max(dense[j], dense[j + 1], dense[j + 2], dense[j + 3])
+                    dense[i] += alpha * (rw[k] + gamma * best - dense[i])
+
+                    if self.logger:
+                        r, c = divmod(s, self.cols)
+                        self.logger.logStep(
+                            episode=episode,
+                            t=k + 1,
+                            state_r=r,
+                            state_c=c,
+                            action=a,
+                            reward=rw[k],
+                            done=bool(done),
+                            mode="train",
+                            source=SOURCE_CODES[src],
+                        )
+                self.transitions += len(rw)
+
+                # latency is the actor's wall time for the episode
+                if self.metrics is not None:
+                    self.metrics.record("train", len(rw), totalReward, bool(success), elapsed)
+
+                if self.logger:
+                    self.logger.logEpisode(
+                        episode=episode,
+                        steps=len(rw),
+                        total_reward=totalReward,
+                        success=bool(success),
+                        mode="train",
+                        metrics=self.metrics.episodeColumns("train") if self.metrics is not None else None,
+                    )
+
+                sincePublish += 1
+                if sincePublish >= cfg.publishEvery:
+                    shared.publish(dense)
+                    self.publishes += 1
+                    sincePublish = 0
+
+                if onEpisode is not None:
+                    onEpisode(
+                        {
+                            "episode": episode,
+                            "actor": actorId,
+                            "steps": len(rw),
+                            "total_reward": totalReward,
+                            "success": bool(success),
+                        },
+                        lambda: denseToQTable(dense, self.cols),
+                    )
+
+                if self.episodesDone >= target:
+                    stop.set()
+        finally:
+            stop.set()
+            # drain so actors blocked on a full queue can exit
+            deadline = time.time() + 10.0
+            while any(p.is_alive() for p in procs) and time.time() < deadline:
+                try:
+                    out.get(timeout=0.1)
+                except queue.Empty:
+                    pass
+            for p in procs:
+                p.join(timeout=1.0)
+                if p.is_alive():
+                    p.terminate()
+
+        return denseToQTable(dense, self.cols)
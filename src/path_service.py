@@ -0,0 +1,551 @@
+# =========================
+# file: src/path_service.py
+# =========================
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+import hashlib
+import os
+import pickle
+import queue
+import socket
+import stat
+import struct
+import tempfile
+import threading
+import time
+
+from .alt_pathfinder import bfsDistances
+from .core_types import Grid, State
+from .metrics import SeriesMetrics
+from .move_masks import VALID_ACTIONS, MoveMasks, movesFor
+from .pathfinder import Path, Pathfinder
+
+_LEN = struct.Struct("<I")
+
+UNKNOWN_MAZE = "unknown-maze"
+
+
+def sendFrame(sock: socket.socket, obj: Any) -> None:
+    data = pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL)
+    sock.sendall(_LEN.pack(len(data)) + data)
+
+
+def _recvExact(sock: socket.socket, n: int) -> Optional[bytes]:
+    buf = bytearray()
+    while len(buf) < n:
+        chunk = sock.recv(n - len(buf))
+        if not chunk:
+            return None
+        buf += chunk
+    return bytes(buf)
+
+
+def recvFrame(sock: socket.socket) -> Any:
+    # None when the peer closed the connection
+    head = _recvExact(sock, _LEN.size)
+    if head is None:
+        return None
+    body = _recvExact(sock, _LEN.unpack(head)[0])
+    return None if body is None else pickle.loads(body)
+
+
+def mazeKey(rows: int, cols: int, cells: bytes) -> str:
+    # content hash: every process sending the same maze shares one cache entry
+    return hashlib.blake2b(struct.pack("<II", rows, cols) + cells, digest_size=16).hexdigest()
+
+
+def packGrid(grid: Grid) -> Tuple[int, int, bytes]:
+    rows = len(grid)
+    cols = len(grid[0]) if rows else 0
+    return rows, cols, b"".join(bytes(1 if v else 0 for v in row) for row in grid)
+
+
+def fieldStep(masks: MoveMasks, dist: Any, cell: int) -> int:
+    # first action that lowers the distance-to-goal field, -1 if none
+    d = dist[cell]
+    if d <= 0:
+        return -1
+    offsets = masks.offsets
+    for a in VALID_ACTIONS[masks.masks[cell]]:
+        if dist[cell + offsets[a]] == d - 1:
+            return a
+    return -1
+
+
+class _MazeEntry:
+    # server-side cache for one maze: the grid, a planner instance (keeps
+    # its own per-grid structures such as landmarks) and BFS
+    # distance-to-goal fields for recently queried goals
+
+    def __init__(self, grid: Grid, planner: Pathfinder, maxFields: int) -> None:
+        self.grid: Grid = grid
+        self.masks: MoveMasks = movesFor(grid)
+        self.planner: Pathfinder = planner
+        self.maxFields: int = maxFields
+        self.fields: "OrderedDict[int, Any]" = OrderedDict()
+        self.goalCounts: Dict[int, int] = {}
+
+    def countGoal(self, goalId: int, n: int) -> int:
+        if len(self.goalCounts) > 4096:
+            self.goalCounts.clear()
+        c = self.goalCounts[goalId] = self.goalCounts.get(goalId, 0) + n
+        return c
+
+    def field(self, goalId: int) -> Optional[Any]:
+        f = self.fields.get(goalId)
+        if f is not None:
+            self.fields.move_to_end(goalId)
+        return f
+
+    def buildField(self, goalId: int) -> Any:
+        f = self.fields[goalId] = bfsDistances(self.masks, goalId)
+        while len(self.fields) > self.maxFields:
+            self.fields.popitem(last=False)
+        return f
+
+
+class PathService:
+    # Local path / next-move server on a Unix socket.
+    # Protocol: length-prefixed pickle frames (the socket is created 0600;
+    # only trusted local processes may connect):
+    #   ("maze", key, rows, cols, cells)           register a maze (idempotent)
+    #   ("query", [(id, kind, key, start, goal)])  kind "path" or "next"
+    #   ("stats",)
+    # Replies to queries are ("answers", [(id, result)]), one frame per
+    # connection and batch.
+    # Queries from all connections go through one queue; the worker takes
+    # everything queued, up to maxBatch (optionally waiting batchWindowMs
+    # for more), and groups it by (maze, goal). Once a goal has been asked
+    # fieldThreshold times it gets a BFS distance field, which answers
+    # every later query for it in O(1) per next move; rarer goals use the
+    # planner's own search.
+
+    def __init__(
+        self,
+        socketPath: str,
+        planner: str = "astar",
+        batchWindowMs: float = 0.0,
+        maxBatch: int = 512,
+        maxMazes: int = 8,
+        maxFields: int = 16,
+        fieldThreshold: int = 2,
+    ) -> None:
+        self.socketPath: str = socketPath
+        self.planner: str = planner
+        self.batchWindow: float = max(0.0, batchWindowMs) / 1000.0
+        self.maxBatch: int = max(1, int(maxBatch))
+        self.maxMazes: int = max(1, int(maxMazes))
+        self.maxFields: int = max(1, int(maxFields))
+        self.fieldThreshold: int = max(1, int(fieldThreshold))
+
+        self._mazes: "OrderedDict[str, _MazeEntry]" = OrderedDict()
+        self._mazeLock = threading.Lock()
+        self._queue: "queue.Queue[Any]" = queue.Queue()
+        self._sendLocks: Dict[int, threading.Lock] = {}
+
+        self._listener: Optional[socket.socket] = None
+        self._threads: List[threading.Thread] = []
+        self._conns: List[socket.socket] = []
+        self._closed = threading.Event()
+
+        # stats
+        self._t0: float = time.time()
+        self.requests: int = 0
+        self.batches: int = 0
+        self.fieldBuilds: int = 0
+        self.fieldAnswers: int = 0
+        self.searches: int = 0
+        self._latency = SeriesMetrics((1000,), 0.05, (0.5, 0.95, 0.99))
+        self._batchSize = SeriesMetrics((1000,), 0.05, ())
+
+    # ------------------------
+    # Lifecycle
+    # ------------------------
+    def start(self) -> "PathService":
+        self._removeStaleSocket()
+
+        # peers send pickles, so the socket must never be reachable with
+        # wider permissions than 0600: bind it inside a private (0700)
+        # directory, restrict it, then link it into place (fails instead of
+        # replacing anything that appeared at the path meanwhile)
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        privateDir = tempfile.mkdtemp(prefix=".ps", dir=os.path.dirname(os.path.abspath(self.socketPath)))
+        tmpPath = os.path.join(privateDir, "s")
+        try:
+            sock.bind(tmpPath)
+            os.chmod(tmpPath, 0o600)
+            os.link(tmpPath, self.socketPath)
+        except OSError:
+            sock.close()
+            raise
+        finally:
+            if os.path.exists(tmpPath):
+                os.remove(tmpPath)
+            os.rmdir(privateDir)
+        sock.listen(64)
+        self._listener = sock
+        self._t0 = time.time()
+
+        for target, name in ((self._acceptLoop, "path-accept"), (self._workLoop, "path-worker")):
+            t = threading.Thread(target=target, name=name, daemon=True)
+            t.start()
+            self._threads.append(t)
+        return self
+
+    def _removeStaleSocket(self) -> None:
+        # only a socket nobody listens on is removed
+        try:
+            mode = os.stat(self.socketPath).st_mode
+        except FileNotFoundError:
+            return
+        if not stat.S_ISSOCK(mode):
+            raise RuntimeError(f"{self.socketPath} exists and is not a socket")
+
+        probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            probe.connect(self.socketPath)
+        except (ConnectionRefusedError, FileNotFoundError):
+            os.remove(self.socketPath)
+            return
+        finally:
+            probe.close()
+        raise RuntimeError(f"a path service is already listening on {self.socketPath}")
+
+    def serveForever(self, statsEvery: float = 0.0) -> None:
+        try:
+            while not self._closed.wait(statsEvery if statsEvery > 0 else 3600):
+                if statsEvery > 0:
+                    print(f"[PATHS] {self.stats()}", flush=True)
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self.close()
+
+    def close(self) -> None:
+        if self._closed.is_set():
+            return
+        self._closed.set()
+        self._queue.put(None)
+        if self._listener is not None:
+            try:
+                self._listener.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+            self._listener.close()
+        for c in list(self._conns):
+            try:
+                c.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+            c.close()
+        for t in self._threads:
+            t.join(timeout=1.0)
+        try:
+            os.remove(self.socketPath)
+        except FileNotFoundError:
+            pass
+
+    # ------------------------
+    # Connections
+    # ------------------------
+    def _acceptLoop(self) -> None:
+        while not self._closed.is_set():
+            try:
+                conn, _ = self._listener.accept()
+            except OSError:
+                return
+            self._conns.append(conn)
+            self._sendLocks[id(conn)] = threading.Lock()
+            t = threading.Thread(target=self._readLoop, args=(conn,), name="path-conn", daemon=True)
+            t.start()
+
+    def _readLoop(self, conn: socket.socket) -> None:
+        try:
+            while True:
+                msg = recvFrame(conn)
+                if msg is None:
+                    break
+                kind = msg[0]
+                if kind == "query":
+                    now = time.perf_counter()
+                    for q in msg[1]:
+                        self._queue.put((conn, now) + tuple(q))
+                elif kind == "maze":
+                    self._register(*msg[1:])
+                elif kind == "stats":
+                    self._send(conn, ("stats", self.stats()))
+        except OSError:
+            pass
+        finally:
+            if conn in self._conns:
+                self._conns.remove(conn)
+            self._sendLocks.pop(id(conn), None)
+            conn.close()
+
+    def _send(self, conn: socket.socket, msg: Any) -> None:
+        lock = self._sendLocks.get(id(conn))
+        if lock is None:
+            return
+        try:
+            with lock:
+                sendFrame(conn, msg)
+        except OSError:
+            pass
+
+    def _register(self, key: str, rows: int, cols: int, cells: bytes) -> None:
+        from .core_types import TrainingConfig
+        from .planners import makePathfinder  # lazy: planners imports this module
+
+        with self._mazeLock:
+            if key in self._mazes:
+                self._mazes.move_to_end(key)
+                return
+        grid = [list(cells[r * cols:(r + 1) * cols]) for r in range(rows)]
+        entry = _MazeEntry(grid, makePathfinder(TrainingConfig(planner=self.planner)), self.maxFields)
+        with self._mazeLock:
+            self._mazes[key] = entry
+            while len(self._mazes) > self.maxMazes:
+                self._mazes.popitem(last=False)
+
+    # ------------------------
+    # Batching
+    # ------------------------
+    def _workLoop(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            batch = [item]
+            deadline = time.perf_counter() + self.batchWindow
+            while len(batch) < self.maxBatch:
+                try:
+                    wait = deadline - time.perf_counter()
+                    item = self._queue.get(timeout=wait) if wait > 0 else self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is None:
+                    self._answer(batch)
+                    return
+                batch.append(item)
+            self._answer(batch)
+
+    def _answer(self, batch: List[Tuple[Any, ...]]) -> None:
+        # batch items: (conn, tRecv, id, kind, key, start, goal)
+        groups: Dict[Tuple[str, State], List[Tuple[Any, ...]]] = {}
+        for item in batch:
+            groups.setdefault((item[4], item[6]), []).append(item)
+
+        replies: Dict[int, Tuple[socket.socket, List[Tuple[int, Any]]]] = {}
+        for (key, goal), items in groups.items():
+            with self._mazeLock:
+                entry = self._mazes.get(key)
+            for item, result in zip(items, self._solve(entry, goal, items)):
+                replies.setdefault(id(item[0]), (item[0], []))[1].append((item[2], result))
+
+        # counted before replying so a client's next stats request sees them
+        now = time.perf_counter()
+        for item in batch:
+            self._latency.add(1000.0 * (now - item[1]))
+        self.requests += len(batch)
+        self.batches += 1
+        self._batchSize.add(len(batch))
+
+        for conn, answers in replies.values():
+            self._send(conn, ("answers", answers))
+
+    def _solve(self, entry: Optional[_MazeEntry], goal: State, items: List[Tuple[Any, ...]]) -> List[Any]:
+        if entry is None:
+            return [UNKNOWN_MAZE] * len(items)
+
+        masks = entry.masks
+        cols = masks.cols
+        goalId = goal[0] * cols + goal[1]
+        dist = entry.field(goalId)
+        if dist is None and entry.countGoal(goalId, len(items)) >= self.fieldThreshold:
+            dist = entry.buildField(goalId)
+            self.fieldBuilds += 1
+
+        out: List[Any] = []
+        for item in items:
+            kind, start = item[3], item[5]
+            if dist is None:
+                self.searches += 1
+                if kind == "next":
+                    out.append(entry.planner.nextMove(entry.grid, start, goal))
+                else:
+                    out.append(entry.planner.getAStarPath(entry.grid, start, goal))
+                continue
+
+            self.fieldAnswers += 1
+            cell = start[0] * cols + start[1]
+            if kind == "next":
+                a = fieldStep(masks, dist, cell)
+                out.append(a if a >= 0 else None)
+                continue
+
+            if start == goal:
+                out.append([start])
+                continue
+            if dist[cell] < 0:
+                out.append(None)
+                continue
+            path: Path = [start]
+            while cell != goalId:
+                cell += masks.offsets[fieldStep(masks, dist, cell)]
+                path.append(divmod(cell, cols))
+            out.append(path)
+        return out
+
+    def stats(self) -> Dict[str, Any]:
+        up = max(1e-9, time.time() - self._t0)
+        lat = self._latency.snapshot()
+        return {
+            "uptime_s": round(up, 3),
+            "requests": self.requests,
+            "throughput_rps": round(self.requests / up, 1),
+            "batches": self.batches,
+            "batch_mean": round(self._batchSize.snapshot()["w1000"], 2),
+            "field_builds": self.fieldBuilds,
+            "field_answers": self.fieldAnswers,
+            "searches": self.searches,
+            "mazes": len(self._mazes),
+            "latency_ms": {k: round(lat[k], 3) for k in ("p50", "p95", "p99")},
+        }
+
+
+class PathServiceClient(Pathfinder):
+    # Pathfinder interface backed by a PathService. Connects lazily (and
+    # again after a fork) and registers each grid once per connection.
+    # nextMoves() sends many queries in one frame.
+
+    def __init__(self, socketPath: str, timeout: float = 30.0) -> None:
+        super().__init__()
+        self.socketPath: str = socketPath
+        self.timeout: float = timeout
+
+        self._sock: Optional[socket.socket] = None
+        self._pid: int = 0
+        self._nextId: int = 0
+        self._known: Dict[int, Tuple[Grid, str, Tuple[int, int, bytes]]] = {}
+        self._registered: set = set()
+
+        self._rtt = SeriesMetrics((1000,), 0.05, (0.5, 0.95))
+
+    def _connect(self) -> socket.socket:
+        if self._sock is None or self._pid != os.getpid():
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            sock.settimeout(self.timeout)
+            sock.connect(self.socketPath)
+            self._sock = sock
+            self._pid = os.getpid()
+            self._registered = set()
+        return self._sock
+
+    def _key(self, grid: Grid) -> str:
+        # cached by grid identity (same rule as movesFor)
+        known = self._known.get(id(grid))
+        if known is None or known[0] is not grid:
+            packed = packGrid(grid)
+            known = (grid, mazeKey(*packed), packed)
+            if len(self._known) >= 8:
+                self._known.pop(next(iter(self._known)))
+            self._known[id(grid)] = known
+        sock = self._connect()
+        if known[1] not in self._registered:
+            sendFrame(sock, ("maze", known[1]) + known[2])
+            self._registered.add(known[1])
+        return known[1]
+
+    def _request(self, grid: Grid, queries: List[Tuple[str, State, State]]) -> List[Any]:
+        for attempt in (0, 1):
+            key = self._key(grid)
+            sock = self._connect()
+            first = self._nextId
+            self._nextId += len(queries)
+
+            t0 = time.perf_counter()
+            sendFrame(sock, ("query", [(first + i, kind, key, s, g) for i, (kind, s, g) in enumerate(queries)]))
+            results: Dict[int, Any] = {}
+            while len(results) < len(queries):
+                msg = recvFrame(sock)
+                if msg is None:
+                    raise ConnectionError("path service closed the connection")
+                if msg[0] == "answers":
+                    results.update(msg[1])
+            self._rtt.add(1000.0 * (time.perf_counter() - t0))
+            self.queries += len(queries)
+
+            out = [results[first + i] for i in range(len(queries))]
+            if attempt == 0 and any(isinstance(r, str) and r == UNKNOWN_MAZE for r in out):
+                self._registered.discard(key)  # evicted on the server: send it again
+                continue
+            return out
+        raise RuntimeError("path service does not keep the maze")
+
+    def getAStarPath(self, grid: Grid, start: State, goal: State) -> Optional[Path]:
+        if start == goal:
+            return [start]
+        return self._request(grid, [("path", start, goal)])[0]
+
+    def nextMove(self, grid: Grid, start: State, goal: State) -> Optional[int]:
+        return self._request(grid, [("next", start, goal)])[0]
+
+    def nextMoves(self, grid: Grid, queries: List[Tuple[State, State]]) -> List[Optional[int]]:
+        return self._request(grid, [("next", s, g) for s, g in queries])
+
+    def stats(self) -> Dict[str, Any]:
+        # server stats plus this client's round trips
+        sock = self._connect()
+        sendFrame(sock, ("stats",))
+        while True:
+            msg = recvFrame(sock)
+            if msg is None:
+                raise ConnectionError("path service closed the connection")
+            if msg[0] == "stats":
+                break
+        rtt = self._rtt.snapshot()
+        out = dict(msg[1])
+        out["client"] = {"requests": self.queries, "rtt_ms_p50": rtt["p50"], "rtt_ms_p95": rtt["p95"]}
+        return out
+
+    def close(self) -> None:
+        if self._sock is not None:
+            self._sock.close()
+            self._sock = None
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # picklable for actor processes: connections are per process
+        state = dict(self.__dict__)
+        state["_sock"] = None
+        state["_known"] = {}
+        state["_registered"] = set()
+        return state
+
+
+def main() -> None:
+    import argparse
+
+    p = argparse.ArgumentParser(description="Local pathfinding service (Unix socket)")
+    p.add_argument("--socket", type=str, default="/tmp/maze_paths.sock")
+    p.add_argument("--planner", type=str, default="astar", choices=["astar", "hpa", "alt", "corridor"])
+    p.add_argument("--batchWindowMs", type=float, default=0.0)
+    p.add_argument("--maxBatch", type=int, default=512)
+    p.add_argument("--maxMazes", type=int, default=8)
+    p.add_argument("--statsEvery", type=float, default=10.0, help="seconds between stats lines (0 = off)")
+    args = p.parse_args()
+
+    service = PathService(
+        args.socket,
+        planner=args.planner,
+        batchWindowMs=args.batchWindowMs,
+        maxBatch=args.maxBatch,
+        maxMazes=args.maxMazes,
+    ).start()
+    print(f"[PATHS] serving on {args.socket} (planner={args.planner})", flush=True)
+    service.serveForever(args.statsEvery)
+
+
+if __name__ == "__main__":
+    main()
@@ -3,13 +3,50 @@
 # =========================
 from __future__ import annotations
 
-from typing import Dict, List, Optional, Tuple
+from array import array
+from typing import Callable, List, Optional, Tuple
 import heapq
 
 from .core_types import Grid, MazeGenParams, State,Action
+from .move_masks import DELTA_C, DELTA_R, VALID_ACTIONS, MoveMasks, movesFor
 Path = List[State]
 
+_MAX_GENERATION = 0xFFFFFFFF
+
+
+class _SearchScratch:
+    # Per-cell search state reused across queries on grids with the same
+    # cell count. A cell's g / parent are only meaningful when its stamp
+    # equals the current generation, so nothing is cleared between calls.
+
+    def __init__(self, size: int) -> None:
+        self.size: int = size
+        self.g = array("l", bytes(array("l").itemsize * size))
+        self.parent = array("l", bytes(array("l").itemsize * size))
+        self.seen = array("L", bytes(array("L").itemsize * size))
+        self.closed = array("L", bytes(array("L").itemsize * size))
+        self.generation: int = 0
+
+    def nextGeneration(self) -> int:
+        if self.generation >= _MAX_GENERATION:
+            zero = bytes(self.seen.itemsize * self.size)
+            self.seen = array("L", zero)
+            self.closed = array("L", zero)
+            self.generation = 0
+        self.generation += 1
+        return self.generation
+
+
 class Pathfinder:
+    def __init__(self) -> None:
+        # search statistics (nodes popped by the last query / all queries)
+        self.lastExpansions: int = 0
+        self.totalExpansions: int = 0
+        self.queries: int = 0
+
+        # reusable search arrays (see _SearchScratch)
+        self._scratch: Optional[_SearchScratch] = None
+
     def _inBounds(self, grid: Grid, s: State) -> bool:
         r, c = s
         return 0 <= r < len(grid) and 0 <= c < len(grid[0])
@@ -19,15 +56,10 @@ class Pathfinder:
         return grid[r][c] == 0
 
     def _neighbors(self, grid: Grid, s: State) -> List[Tuple[State, int]]:
-        out: List[Tuple[State, int]] = []
-
-        for a in Action.ALL:
-            dr, dc = Action.delta(a)
-            ns = (s[0] + dr, s[1] + dc)
-            if self._inBounds(grid, ns) and self._isFree(grid, ns):
-                out.append((ns, a))
-
-        return out
+        return [
+            ((s[0] + DELTA_R[a], s[1] + DELTA_C[a]), a)
+            for a in movesFor(grid).validActions(s[0], s[1])
+        ]
 
     def _manhattan(self, a: State, b: State) -> int:
         return abs(a[0] - b[0]) + abs(a[1] - b[1])
@@ -39,41 +71,103 @@ class Pathfinder:
         if start == goal:
             return [start]
 
-        openHeap: List[Tuple[int, int, State]] = []
-        heapq.heappush(openHeap, (0, 0, start))
-
-        cameFrom: Dict[State, State] = {}
-        gScore: Dict[State, int] = {start: 0}
-        closed = set()
-
-        while openHeap:
-            # IMPORTANT: heappop takes exactly one argument
-            _, g, cur = heapq.heappop(openHeap)
-
-            if cur in closed:
-                continue
-            closed.add(cur)
-
-            if cur == goal:
-                return self._reconstruct(cameFrom, cur)
+        masks = movesFor(grid)
+        cols = masks.cols
+        found = self.searchIds(masks, start[0] * cols + start[1], goal[0] * cols + goal[1])
+        if found < 0:
+            return None
 
-            for ns, _ in self._neighbors(grid, cur):
-                ng = g + 1
-                if ns not in gScore or ng < gScore[ns]:
-                    gScore[ns] = ng
-                    cameFrom[ns] = cur
-                    f = ng + self._manhattan(ns, goal)
-                    heapq.heappush(openHeap, (f, ng, ns))
+        parent = self._scratch.parent
+        path: Path = []
+        cur = found
+        while True:
+            path.append(divmod(cur, cols))
+            if cur == parent[cur]:
+                break
+            cur = parent[cur]
+        path.reverse()
+        return path
 
+    def heuristicFor(self, masks: MoveMasks, goalId: int) -> Optional[Callable[[int], int]]:
+        # h(cellId) for a search towards goalId; None selects the inlined
+        # Manhattan distance. Subclasses hook better admissible bounds in here.
         return None
 
-    def _reconstruct(self, cameFrom: Dict[State, State], cur: State) -> Path:
-        path: Path = [cur]
-        while cur in cameFrom:
-            cur = cameFrom[cur]
-            path.append(cur)
-        path.reverse()
-        return path
+    def searchIds(self, masks: MoveMasks, startId: int, goalId: int) -> int:
+        # A* over flat cell ids (r * cols + c) with the per-cell move masks.
+        # Returns goalId when reached (parents are then valid in
+        # self._scratch.parent; the start is its own parent) or -1.
+        n = masks.rows * masks.cols
+        scratch = self._scratch
+        if scratch is None or scratch.size != n:
+            scratch = self._scratch = _SearchScratch(n)
+        gen = scratch.nextGeneration()
+
+        g = scratch.g
+        parent = scratch.parent
+        seen = scratch.seen
+        closed = scratch.closed
+        cellMasks = masks.masks
+        offsets = masks.offsets
+        cols = masks.cols
+
+        h = self.heuristicFor(masks, goalId)
+        gr, gc = divmod(goalId, cols)
+
+        # heap keys pack (f, larger g first, cell) into one int:
+        # key = (f * n + (n - 1 - g)) * n + cell
+        sr, sc = divmod(startId, cols)
+        f0 = h(startId) if h is not None else abs(sr - gr) + abs(sc - gc)
+        g[startId] = 0
+        parent[startId] = startId
+        seen[startId] = gen
+        openHeap = [(f0 * n + n - 1) * n + startId]
+
+        heappop = heapq.heappop
+        heappush = heapq.heappush
+
+        self.queries += 1
+        expansions = 0
+
+        while openHeap:
+            key = heappop(openHeap)
+            rest, cur = divmod(key, n)
+            cg = n - 1 - rest % n
+
+            if closed[cur] == gen or cg != g[cur]:
+                continue  # stale entry
+            closed[cur] = gen
+            expansions += 1
+
+            if cur == goalId:
+                self.lastExpansions = expansions
+                self.totalExpansions += expansions
+                return cur
+
+            ng = cg + 1
+            m = cellMasks[cur]
+            if h is None:
+                r, c = divmod(cur, cols)
+            for a in VALID_ACTIONS[m]:
+                nxt = cur + offsets[a]
+                if seen[nxt] == gen and g[nxt] <= ng:
+                    continue
+                seen[nxt] = gen
+                g[nxt] = ng
+                parent[nxt] = cur
+                if h is None:
+                    hv = abs(r + DELTA_R[a] - gr) + abs(c + DELTA_C[a] - gc)
+                else:
+                    hv = h(nxt)
+                heappush(openHeap, ((ng + hv) * n + n - 1 - ng) * n + nxt)
+
+        self.lastExpansions = expansions
+        self.totalExpansions += expansions
+        return -1
+
+    def nextMove(self, grid: Grid, start: State, goal: State) -> Optional[int]:
+        # first action of a shortest path (subclasses may avoid building the full path)
+        return self.nextMoveFromPath(self.getAStarPath(grid, start, goal))
 
     def nextMoveFromPath(self, path: Optional[Path]) -> Optional[int]:
         if not path or len(path) < 2:
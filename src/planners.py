@@ -0,0 +1,29 @@
+# =========================
+# file: src/planners.py
+# =========================
+from __future__ import annotations
+
+from .alt_pathfinder import ALTPathfinder
+from .core_types import TrainingConfig
+from .corridor_pathfinder import CorridorPathfinder
+from .hpa_pathfinder import HierarchicalPathfinder
+from .path_service import PathServiceClient
+from .pathfinder import Pathfinder
+
+
+def makePathfinder(config: TrainingConfig) -> Pathfinder:
+    # planner used by HybridAgent for A* guided exploration; with
+    # pathService set, queries go to that PathService (which runs its own
+    # planner) instead
+    if config.pathService:
+        return PathServiceClient(config.pathService)
+    if config.planner == "astar":
+        return Pathfinder()
+    if config.planner == "hpa":
+        return HierarchicalPathfinder(clusterSize=config.clusterSize)
+    if config.planner == "alt":
+        return ALTPathfinder(landmarks=config.landmarks)
+    if config.planner == "corridor":
+        return CorridorPathfinder()
+
+    raise ValueError(f"Unknown planner: {config.planner}")
@@ -0,0 +1,299 @@
+# =========================
+# file: src/replay.py
+# =========================
+from __future__ import annotations
+
+from array import array
+from typing import Any, Dict, List, Optional, Tuple
+import gzip
+import json
+import os
+
+from .core_types import Action
+from .environment import Environment
+from .logger import stepSegments
+from .maze_ui import MazeUI
+
+# one replayed step: (t, state_r, state_c, action, reward, done, source)
+StepRow = Tuple[int, int, int, int, float, bool, str]
+
+
+def _openBinary(path: str):
+    if path.endswith(".gz"):
+        return gzip.open(path, "rb")
+    return open(path, "rb")
+
+
+class EpisodeIndex:
+    # Sidecar index of the step log: for every episode, the segment it lives
+    # in and the byte offset of its first row (offsets in gzipped segments
+    # are into the decompressed stream).
+    #
+    # Sidecar layout: one JSON header line describing the scanned segments,
+    # then int64 triples (episode, segmentNo, offset).
+
+    def __init__(self, logFile: str) -> None:
+        self.logFile: str = logFile
+        root, _ = os.path.splitext(logFile)
+        self.indexPath: str = f"{root}_steps.idx"
+
+        self._segments: List[Dict[str, Any]] = []
+        self._entries = array("q")
+
+    def __len__(self) -> int:
+        return len(self._entries) // 3
+
+    # ------------------------
+    # Build / persist
+    # ------------------------
+    def refresh(self) -> "EpisodeIndex":
+        # Reuses the sidecar for segments that did not change; only new or
+        # grown segments are scanned.
+        self._load()
+
+        current = stepSegments(self.logFile)
+        segments: List[Dict[str, Any]] = []
+        entries = array("q")
+        spans = self._segmentSpans()
+
+        for segNo, path in enumerate(current):
+            name = os.path.basename(path)
+            size = os.path.getsize(path)
+            old = self._segments[segNo] if segNo < len(self._segments) else None
+
+            if old is not None and old["name"] == name and old["size"] == size:
+                entries.extend(self._entries[slice(*spans.get(segNo, (0, 0)))])
+                segments.append(old)
+                continue
+
+            resume = None
+            if old is not None and old["name"] == name and not name.endswith(".gz") and old["size"] < size:
+                # the active file only ever grows: continue where we stopped
+                entries.extend(self._entries[slice(*spans.get(segNo, (0, 0)))])
+                resume = (old["scanned"], old["lastEpisode"])
+
+            scanned, lastEpisode = self._scan(path, segNo, entries, resume)
+            segments.append({"name": name, "size": size, "scanned": scanned, "lastEpisode": lastEpisode})
+
+        self._segments = segments
+        self._entries = entries
+        self._save()
+        return self
+
+    def _segmentSpans(self) -> Dict[int, Tuple[int, int]]:
+        # entries are stored in segment order: segNo -> [start, end) slice
+        spans: Dict[int, Tuple[int, int]] = {}
+        e = self._entries
+        for i in range(0, len(e), 3):
+            start, _ = spans.get(e[i + 1], (i, i))
+            spans[e[i + 1]] = (start, i + 3)
+        return spans
+
+    def _scan(self, path: str, segNo: int, entries: array, resume: Optional[Tuple[int, int]]) -> Tuple[int, int]:
+        with _openBinary(path) as f:
+            if resume is None:
+                header = f.readline()
+                offset = len(header)
+                lastEpisode = -1
+            else:
+                offset, lastEpisode = resume
+                f.seek(offset)
+
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break  # partially written row; pick it up next refresh
+                comma = line.find(b",")
+                if comma > 0:
+                    ep = int(line[:comma])
+                    if ep != lastEpisode:
+                        entries.extend((ep, segNo, offset))
+                        lastEpisode = ep
+                offset += len(line)
+
+        return offset, lastEpisode
+
+    def _load(self) -> None:
+        if self._segments or not os.path.exists(self.indexPath):
+            return
+        try:
+            with open(self.indexPath, "rb") as f:
+                meta = json.loads(f.readline())
+                entries = array("q")
+                entries.frombytes(f.read())
+        except (OSError, ValueError):
+            return
+        self._segments = meta["segments"]
+        self._entries = entries
+
+    def _save(self) -> None:
+        tmp = self.indexPath + ".tmp"
+        with open(tmp, "wb") as f:
+            f.write(json.dumps({"segments": self._segments}).encode("utf-8") + b"\n")
+            self._entries.tofile(f)
+        os.replace(tmp, self.indexPath)
+
+    # ------------------------
+    # Queries
+    # ------------------------
+    def episodes(self) -> List[int]:
+        return list(self._entries[0::3])
+
+    def lastEpisode(self) -> Optional[int]:
+        return self._entries[-3] if self._entries else None
+
+    def position(self, episode: int) -> Optional[int]:
+        # position of the latest occurrence (appended runs restart their ids)
+        e = self._entries
+        for i in range(len(e) - 3, -1, -3):
+            if e[i] == episode:
+                return i // 3
+        return None
+
+    def readAt(self, position: int) -> Tuple[int, List[StepRow]]:
+        e = self._entries
+        episode, segNo, offset = e[3 * position], e[3 * position + 1], e[3 * position + 2]
+        path = os.path.join(os.path.dirname(self.logFile) or ".", self._segments[segNo]["name"])
+
+        rows: List[StepRow] = []
+        with _openBinary(path) as f:
+            f.seek(offset)
+            for line in f:
+                parts = line.decode("utf-8").rstrip("\r\n").split(",")
+                if int(parts[0]) != episode:
+                    break
+                rows.append((
+                    int(parts[1]),
+                    int(parts[2]),
+                    int(parts[3]),
+                    int(parts[4]),
+                    float(parts[5]),
+                    parts[6] == "1",
+                    parts[8],
+                ))
+        return episode, rows
+
+    def readEpisode(self, episode: int) -> List[StepRow]:
+        pos = self.position(episode)
+        if pos is None:
+            return []
+        return self.readAt(pos)[1]
+
+
+class ReplayPlayer:
+    # Drives MazeUI from the step log. Uses the same keys as training:
+    #   SPACE pause | RIGHT step | N next ep | R restart ep
+    #   +/- fps | ]/[ jump 10 episodes | Q/ESC stop
+
+    def __init__(
+        self,
+        index: EpisodeIndex,
+        env: Environment,
+        ui: MazeUI,
+        stepsPerFrame: int = 1,
+        pauseWaitMs: int = 250,
+    ) -> None:
+        self.index: EpisodeIndex = index
+        self.env: Environment = env
+        self.ui: MazeUI = ui
+        self.stepsPerFrame: int = max(1, int(stepsPerFrame))
+        self.pauseWaitMs: int = pauseWaitMs
+
+    def play(self, startEpisode: Optional[int] = None) -> None:
+        if len(self.index) == 0:
+            return
+
+        pos = self.index.position(startEpisode) if startEpisode is not None else 0
+        if pos is None:
+            pos = 0
+
+        while pos < len(self.index):
+            jump = self._playEpisode(pos)
+            if jump is None:
+                return
+            if jump == 1:
+                pos += 1
+            else:
+                pos = max(0, min(len(self.index) - 1, pos + jump))
+
+    def _playEpisode(self, position: int) -> Optional[int]:
+        # returns how many episodes to move forward (None = stop)
+        episode, rows = self.index.readAt(position)
+
+        i = 0
+        totalReward = 0.0
+        paused = False
+        drawn = False
+        while i <= len(rows):
+            # paused with the current frame on screen: block until input
+            waiting = paused and drawn
+            cmd = self.ui.waitControls(self.pauseWaitMs) if waiting else self.ui.pollControls()
+
+            if cmd["stop"]:
+                return None
+            if cmd["fps_delta"]:
+                self.ui.adjustFps(int(cmd["fps_delta"]))
+            if cmd["episodes_delta"]:
+                return int(cmd["episodes_delta"])
+            if cmd["next_episode"]:
+                return 1
+            if cmd["restart_episode"]:
+                i = 0
+                totalReward = 0.0
+
+            changed = (
+                bool(cmd["paused"]) != paused
+                or bool(cmd["step_once"])
+                or bool(cmd["restart_episode"])
+                or bool(cmd["fps_delta"])
+                or bool(cmd.get("redraw"))
+            )
+            paused = bool(cmd["paused"])
+            if waiting and not changed:
+                continue
+
+            if i < len(rows):
+                t, r, c, action, reward, done, source = rows[i]
+                pos = (r, c)
+            else:
+                t, pos, source = len(rows), self._finalPos(rows), "-"
+
+            self._draw(episode, t, totalReward, source, pos, paused)
+            drawn = True
+
+            if paused and not cmd["step_once"]:
+                continue
+
+            n = 1 if paused else self.stepsPerFrame
+            for row in rows[i:i + n]:
+                totalReward += row[4]
+            i += n
+            # a single step is drawn on the next (non-blocking) pass
+            drawn = not paused
+
+        return 1
+
+    def _finalPos(self, rows: List[StepRow]) -> Tuple[int, int]:
+        if not rows:
+            return self.env.agentPos
+        # the logged last move is applied from the row's cell without
+        # stepping (or un-finishing) the environment
+        _, r, c, action, _, _, _ = rows[-1]
+        if self.env.moves().mask(r, c) >> action & 1:
+            dr, dc = Action.delta(action)
+            return (r + dr, c + dc)
+        return (r, c)
+
+    def _draw(self, episode: int, t: int, totalReward: float, source: str, pos: Tuple[int, int], paused: bool) -> None:
+        self.env.agentPos = pos
+        self.ui.setHud({
+            "mode": f"replay:{source}",
+            "episode": episode,
+            "episodes_target": self.index.lastEpisode(),
+            "t": t,
+            "total_reward": f"{totalReward:.1f}",
+            "success_rate": "-",
+            "paused": paused,
+        })
+        self.ui.drawGrid(self.env)
+        self.ui.drawAgent(pos)
+        self.ui.updateScreen()
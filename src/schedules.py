@@ -0,0 +1,151 @@
+# =========================
+# file: src/schedules.py
+# =========================
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Optional, Tuple
+import math
+
+from .core_types import TrainingConfig
+
+if TYPE_CHECKING:
+    from .hybrid_agent import HybridAgent
+
+SCHEDULE_KINDS = ("constant", "linear", "exp", "cosine")
+
+# exp decay leaves this fraction of (start - end) after `episodes`
+_EXP_RESIDUAL = 0.01
+
+
+class Schedule:
+    # value(episode) moving from start (episode 0) to end (episode >= episodes)
+
+    def __init__(self, start: float, end: float, episodes: int) -> None:
+        self.start: float = float(start)
+        self.end: float = float(end)
+        self.episodes: int = max(1, int(episodes))
+
+    def _progress(self, episode: int) -> float:
+        return min(1.0, max(0.0, episode / self.episodes))
+
+    def _shape(self, x: float) -> float:
+        # fraction of (start - end) still remaining at progress x
+        return 1.0 - x
+
+    def value(self, episode: int) -> float:
+        return self.end + (self.start - self.end) * self._shape(self._progress(episode))
+
+
+class ConstantSchedule(Schedule):
+    def __init__(self, value: float) -> None:
+        super().__init__(value, value, 1)
+
+    def value(self, episode: int) -> float:
+        return self.start
+
+
+class LinearSchedule(Schedule):
+    pass
+
+
+class ExponentialSchedule(Schedule):
+    def _shape(self, x: float) -> float:
+        return _EXP_RESIDUAL ** x
+
+
+class CosineSchedule(Schedule):
+    def _shape(self, x: float) -> float:
+        return 0.5 * (1.0 + math.cos(math.pi * x))
+
+
+def makeSchedule(kind: str, start: float, end: float, episodes: int) -> Schedule:
+    if kind == "constant":
+        return ConstantSchedule(start)
+    if kind == "linear":
+        return LinearSchedule(start, end, episodes)
+    if kind == "exp":
+        return ExponentialSchedule(start, end, episodes)
+    if kind == "cosine":
+        return CosineSchedule(start, end, episodes)
+
+    raise ValueError(f"Unknown schedule: {kind}")
+
+
+class AdaptiveController:
+    # Multiplicative scale on the scheduled values, steered by the rolling
+    # eval success rate: below targetSR it grows (more exploration and A*
+    # guidance), above it shrinks. gain is the log-scale step per unit of
+    # success-rate error and eval result.
+
+    def __init__(self, targetSR: float = 0.8, gain: float = 0.5, minScale: float = 0.1, maxScale: float = 2.0) -> None:
+        self.targetSR: float = float(targetSR)
+        self.gain: float = float(gain)
+        self.minScale: float = float(minScale)
+        self.maxScale: float = float(maxScale)
+
+        self.scale: float = 1.0
+        self.lastSR: Optional[float] = None
+
+    def observe(self, successRate: float) -> float:
+        self.lastSR = successRate
+        self.scale *= math.exp(self.gain * (self.targetSR - successRate))
+        self.scale = min(self.maxScale, max(self.minScale, self.scale))
+        return self.scale
+
+
+class ExplorationSchedule:
+    # Drives HybridAgent.epsilon / heuristicRate once per episode.
+
+    def __init__(self, epsilon: Schedule, heuristicRate: Schedule, adaptive: Optional[AdaptiveController] = None) -> None:
+        self.epsilon: Schedule = epsilon
+        self.heuristicRate: Schedule = heuristicRate
+        self.adaptive: Optional[AdaptiveController] = adaptive
+
+        self.current: Tuple[float, float] = (epsilon.value(0), heuristicRate.value(0))
+
+    def observe(self, evalSuccessRate: float) -> None:
+        if self.adaptive is not None:
+            self.adaptive.observe(evalSuccessRate)
+
+    def values(self, episode: int) -> Tuple[float, float]:
+        eps = self.epsilon.value(episode)
+        hr = self.heuristicRate.value(episode)
+        if self.adaptive is not None:
+            eps *= self.adaptive.scale
+            hr *= self.adaptive.scale
+        return min(1.0, max(0.0, eps)), min(1.0, max(0.0, hr))
+
+    def apply(self, agent: "HybridAgent", episode: int) -> Tuple[float, float]:
+        self.current = self.values(episode)
+        agent.setEpsilon(self.current[0])
+        agent.setHeuristicRate(self.current[1])
+        return self.current
+
+    def describe(self) -> str:
+        kinds = {
+            ConstantSchedule: "const",
+            LinearSchedule: "lin",
+            ExponentialSchedule: "exp",
+            CosineSchedule: "cos",
+        }
+        out = f"{kinds.get(type(self.epsilon), '?')}/{kinds.get(type(self.heuristicRate), '?')}"
+        if self.adaptive is not None:
+            out += f" x{self.adaptive.scale:.2f}"
+        return out
+
+
+def makeExplorationSchedule(config: TrainingConfig, adaptive: bool = True) -> Optional[ExplorationSchedule]:
+    # None when epsilon / heuristicRate stay constant for the whole run
+    if config.epsilonSchedule == "constant" and config.heuristicSchedule == "constant" and not config.adaptiveExploration:
+        return None
+
+    episodes = config.scheduleEpisodes if config.scheduleEpisodes > 0 else config.episodes
+    controller = None
+    if adaptive and config.adaptiveExploration:
+        controller = AdaptiveController(targetSR=config.adaptiveTargetSR, gain=config.adaptiveGain)
+
+    return ExplorationSchedule(
+        makeSchedule(config.epsilonSchedule, config.epsilon, config.epsilonEnd, episodes),
+        makeSchedule(config.heuristicSchedule, config.heuristicRate, config.heuristicRateEnd, episodes),
+        controller,
+    )
@@ -0,0 +1,175 @@
+# =========================
+# file: src/telemetry.py
+# =========================
+from __future__ import annotations
+
+from typing import Any, List, Optional, TextIO
+import json
+import queue
+import socket
+import sys
+import threading
+import time
+
+
+class Telemetry:
+    # Fields:
+    # - consoleInterval (seconds between console writes)
+    # - metricsPath ("" = off, "unix:/path.sock" = socket, otherwise JSON-lines file)
+    # Methods:
+    # - info(msg)
+    # - metric(kind, **fields)
+    # - close()
+
+    def __init__(
+        self,
+        consoleInterval: float = 0.5,
+        metricsPath: str = "",
+        maxQueue: int = 10000,
+        console: bool = True,
+        stream: Optional[TextIO] = None,
+    ) -> None:
+        self.consoleInterval: float = max(0.0, float(consoleInterval))
+        self.metricsPath: str = metricsPath
+        self.console: bool = console
+
+        self._stream: TextIO = stream if stream is not None else sys.stdout
+        self.maxQueue: int = max(1, int(maxQueue))
+        self._queue: "queue.Queue[Any]" = queue.Queue(maxsize=self.maxQueue)
+
+        # bumped by producers, swapped out by the writer thread
+        self.dropped: int = 0
+        self._dropLock = threading.Lock()
+        self.sinkErrors: int = 0
+
+        self._sinkFile = None
+        self._sinkSock: Optional[socket.socket] = None
+        self._openSink()
+
+        self._closed: bool = False
+        self._thread = threading.Thread(target=self._run, name="telemetry", daemon=True)
+        self._thread.start()
+
+    def _openSink(self) -> None:
+        if not self.metricsPath:
+            return
+
+        try:
+            if self.metricsPath.startswith("unix:"):
+                sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+                sock.settimeout(1.0)
+                sock.connect(self.metricsPath[len("unix:"):])
+                self._sinkSock = sock
+            else:
+                self._sinkFile = open(self.metricsPath, "a", encoding="utf-8")
+        except OSError as e:
+            self.sinkErrors += 1
+            print(f"[TELEMETRY] metrics sink disabled: {e}", file=self._stream, flush=True)
+
+    # ------------------------
+    # Producer side (training thread, never blocks)
+    # ------------------------
+    def _put(self, item: Any) -> None:
+        if self._closed:
+            return
+        try:
+            self._queue.put_nowait(item)
+        except queue.Full:
+            self._drop(1)
+
+    def _drop(self, n: int) -> None:
+        with self._dropLock:
+            self.dropped += n
+
+    def info(self, msg: str) -> None:
+        if self.console:
+            self._put(("info", msg))
+
+    def metric(self, kind: str, **fields: Any) -> None:
+        if self._sinkFile is None and self._sinkSock is None:
+            return
+        fields["kind"] = kind
+        fields["ts"] = round(time.time(), 3)
+        self._put(("metric", fields))
+
+    # ------------------------
+    # Consumer side (background thread)
+    # ------------------------
+    def _run(self) -> None:
+        lines: List[str] = []
+        records: List[str] = []
+        lastWrite = time.monotonic()
+
+        while True:
+            timeout = max(0.01, self.consoleInterval - (time.monotonic() - lastWrite))
+            try:
+                item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                item = None
+
+            stop = item is not None and item[0] == "stop"
+
+            if item is not None and not stop:
+                kind, payload = item
+                if kind == "info":
+                    # pending console lines are bounded like the queue
+                    if len(lines) < self.maxQueue:
+                        lines.append(payload)
+                    else:
+                        self._drop(1)
+                else:
+                    records.append(json.dumps(payload, separators=(",", ":")))
+
+            if records:
+                self._writeRecords(records)
+                records = []
+
+            now = time.monotonic()
+            if lines and (stop or now - lastWrite >= self.consoleInterval):
+                self._writeLines(lines)
+                lines = []
+                lastWrite = now
+
+            if stop:
+                return
+
+    def _writeLines(self, lines: List[str]) -> None:
+        with self._dropLock:
+            dropped, self.dropped = self.dropped, 0
+        if dropped:
+            lines.append(f"[TELEMETRY] dropped {dropped} messages (queue full)")
+        try:
+            self._stream.write("\n".join(lines) + "\n")
+            self._stream.flush()
+        except (OSError, ValueError):
+            pass
+
+    def _writeRecords(self, records: List[str]) -> None:
+        data = "\n".join(records) + "\n"
+        try:
+            if self._sinkFile is not None:
+                self._sinkFile.write(data)
+                self._sinkFile.flush()
+            elif self._sinkSock is not None:
+                self._sinkSock.sendall(data.encode("utf-8"))
+        except OSError:
+            # a dead dashboard must not take training down with it
+            self.sinkErrors += 1
+            self._closeSink()
+
+    def _closeSink(self) -> None:
+        if self._sinkFile is not None:
+            self._sinkFile.close()
+            self._sinkFile = None
+        if self._sinkSock is not None:
+            self._sinkSock.close()
+            self._sinkSock = None
+
+    def close(self, timeout: float = 5.0) -> None:
+        if self._closed:
+            return
+        # the stop marker must get through even when the queue is full
+        self._queue.put(("stop", None))
+        self._closed = True
+        self._thread.join(timeout)
+        self._closeSink()
@@ -0,0 +1,49 @@
+import sys
+import os
+import random
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.alt_pathfinder import ALTPathfinder, bfsDistances, compareHeuristics
+from src.core_types import MazeGenParams, TrainingConfig
+from src.maze_generator import MazeGenerator
+from src.move_masks import movesFor
+from src.pathfinder import Pathfinder
+from src.planners import makePathfinder
+
+
+def _queries(grid, n, seed=0):
+    rng = random.Random(seed)
+    free = [(r, c) for r in range(len(grid)) for c in range(len(grid[0])) if grid[r][c] == 0]
+    return [(rng.choice(free), rng.choice(free)) for _ in range(n)]
+
+
+def test_bfs_distances_mark_unreachable_cells():
+    grid = [[0, 1, 0], [0, 1, 0], [0, 0, 1]]
+    dist = bfsDistances(movesFor(grid), 0)
+    assert list(dist) == [0, -1, -1, 1, -1, -1, 2, 3, -1]
+
+
+def test_alt_paths_are_optimal_on_random_grids():
+    grid, _, _ = MazeGenerator().generate(MazeGenParams(rows=30, cols=30, wallDensity=0.35, seed=2))
+    flat = Pathfinder()
+    alt = ALTPathfinder(landmarks=4)
+    for start, goal in _queries(grid, 40):
+        p1 = flat.getAStarPath(grid, start, goal)
+        p2 = alt.getAStarPath(grid, start, goal)
+        assert (p1 is None) == (p2 is None)
+        if p1 is not None:
+            assert len(p1) == len(p2)
+            assert p2[0] == start and p2[-1] == goal
+
+
+def test_alt_expands_fewer_nodes_in_corridor_mazes():
+    grid, _, _ = MazeGenerator().generate(MazeGenParams(rows=61, cols=61, seed=5, algorithm="backtracker"))
+    res = compareHeuristics(grid, _queries(grid, 30), landmarks=8)
+    assert res["same_lengths"]
+    assert res["alt"]["expansions"] < res["manhattan"]["expansions"]
+
+
+def test_planner_factory_builds_alt():
+    pf = makePathfinder(TrainingConfig(planner="alt", landmarks=3))
+    assert isinstance(pf, ALTPathfinder)
+    assert pf.landmarkCount == 3
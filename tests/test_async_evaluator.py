@@ -0,0 +1,60 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import pytest
+
+from src.async_evaluator import AsyncEvaluator, evaluateGreedy
+from src.core_types import Action
+
+
+def _corridor():
+    # 1 x 4 corridor, goal at the right end
+    return [[0, 0, 0, 0]], (0, 0), (0, 3)
+
+
+def _goRight():
+    return {(0, c): [0.0, 0.0, 0.0, 1.0] for c in range(3)}
+
+
+def test_greedy_rollout_does_not_touch_q_table():
+    grid, start, goal = _corridor()
+    q = _goRight()
+    res = evaluateGreedy(q, grid, start, goal, maxSteps=10)
+    assert res == {"steps": 3, "total_reward": 98.0, "success": True}
+    assert len(q) == 3
+
+
+@pytest.mark.parametrize("mode", ["thread", "fork"])
+def test_results_are_tagged_with_snapshot_episode(mode):
+    if mode == "fork" and sys.platform.startswith("win"):
+        pytest.skip("fork not available")
+
+    grid, start, goal = _corridor()
+    q = _goRight()
+    ev = AsyncEvaluator([(grid, start, goal)], maxSteps=10, mode=mode)
+
+    assert ev.submit(50, q)
+    # training keeps mutating the live table; the snapshot must not see it
+    for c in range(3):
+        q[(0, c)][Action.RIGHT] = -1.0
+    assert ev.submit(100, q)
+
+    results = ev.close()
+    assert [r["episode"] for r in results] == [50, 100]
+    assert results[0]["success_rate"] == 1.0
+    assert results[1]["success_rate"] == 0.0
+
+
+def test_submit_skips_when_too_many_in_flight():
+    grid, start, goal = _corridor()
+    ev = AsyncEvaluator([(grid, start, goal)], maxSteps=10, mode="thread", maxInFlight=1)
+    ev._pending.append((1, _NeverDone(), None))
+
+    assert not ev.submit(2, _goRight())
+    assert ev.skipped == 1
+
+
+class _NeverDone:
+    def done(self):
+        return False
@@ -0,0 +1,52 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.benchmark import SCENARIOS, compareResults, runScenario
+from src.core_types import TrainingConfig
+from src.pathfinder import Pathfinder
+
+
+def test_catalog_scenarios_are_solvable():
+    pf = Pathfinder()
+    for sc in SCENARIOS.values():
+        if sc.size > 32:
+            continue
+        grid, start, goal = sc.build(sc.size, 0)
+        assert grid[start[0]][start[1]] == 0 and grid[goal[0]][goal[1]] == 0
+        assert pf.getAStarPath(grid, start, goal) is not None, sc.name
+
+
+def test_run_scenario_reports_throughput():
+    r = runScenario("open_16", seed=1)
+    assert r["episodes"] == SCENARIOS["open_16"].episodes
+    assert r["episodes_per_s"] > 0 and r["steps_per_s"] > 0
+    assert r["env_steps"] > 0
+    assert r["astar_calls_per_episode"] > 0
+    assert r["episodes_to_target"] is not None
+
+
+def test_every_planner_reports_its_queries():
+    for planner in ("hpa", "corridor"):
+        r = runScenario("perfect_16", seed=1, config=TrainingConfig(planner=planner))
+        assert r["astar_calls_per_episode"] > 0, planner
+
+
+def test_compare_flags_regressions_by_direction():
+    base = {"results": {"a": {"episodes_per_s": 100.0, "peak_rss_mb": 50.0, "time_to_target_s": None}}}
+    new = {"results": {"a": {"episodes_per_s": 80.0, "peak_rss_mb": 45.0, "time_to_target_s": 1.0}}}
+    rows = {r["metric"]: r for r in compareResults(base, new, threshold=0.1)}
+
+    assert rows["episodes_per_s"]["regression"]
+    assert not rows["peak_rss_mb"]["regression"]
+    assert "time_to_target_s" not in rows
+
+
+def test_compare_flags_collapsed_learning():
+    base = {"results": {"a": {"final_success_rate": 0.95, "time_to_target_s": 2.0}}}
+    new = {"results": {"a": {"final_success_rate": 0.1, "time_to_target_s": None}}}
+    rows = {r["metric"]: r for r in compareResults(base, new, threshold=0.1)}
+
+    assert rows["final_success_rate"]["regression"]
+    assert rows["time_to_target_s"]["regression"] and rows["time_to_target_s"]["new"] is None
@@ -0,0 +1,83 @@
+import sys
+import os
+import csv
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.checkpoint import CheckpointManager
+from src.core_types import MazeGenParams, TrainingConfig
+from src.environment import Environment
+from src.hybrid_agent import HybridAgent
+from src.logger import Logger, iterStepRows, logPaths
+from src.main_controller import MainController
+from src.maze_generator import MazeGenerator
+
+
+def _run(tmp_path, name, episodes, resume=False, rotateEpisodes=0):
+    grid, start, goal = MazeGenerator().generate(MazeGenParams(rows=8, cols=8, wallDensity=0.2, seed=4))
+    cfg = TrainingConfig(
+        episodes=episodes,
+        evalEvery=4,
+        maxStepsPerEpisode=80,
+        checkpointEvery=5,
+        checkpointDir=str(tmp_path / (name + "_ckpt")),
+        resume=resume,
+        epsilonSchedule="linear",
+        scheduleEpisodes=20,
+        adaptiveExploration=True,
+    )
+    agent = HybridAgent(alpha=0.1, gamma=0.9, epsilon=0.3, heuristicRate=0.3, seed=11)
+    logger = Logger(str(tmp_path / (name + ".csv")), console=False, rotateEpisodes=rotateEpisodes)
+    controller = MainController(Environment(grid, start, goal, maxSteps=80), agent, None, logger, None)
+    try:
+        controller.startTraining(cfg)
+    finally:
+        logger.close()
+    return agent, str(tmp_path / (name + ".csv"))
+
+
+def _episodeRows(base):
+    with open(logPaths(base)[1], newline="") as f:
+        return [(r["episode"], r["steps"], r["total_reward"], r["sr_window"]) for r in csv.DictReader(f)]
+
+
+def _stepRows(base):
+    return [tuple(r.values()) for r in iterStepRows(base)]
+
+
+def test_changed_states_are_tracked():
+    agent = HybridAgent(alpha=0.5, gamma=0.9, epsilon=0.0, heuristicRate=0.0, seed=0)
+    agent.updateQ((0, 0), 3, -1.0, (0, 1))
+    assert agent.trackChanges() == set()
+    agent.updateQ((0, 0), 3, -1.0, (0, 1))
+    agent.updateQ((0, 2), 1, -1.0, (1, 2))
+    assert agent.trackChanges() == {(0, 0), (0, 2), (1, 2)}
+    assert agent.trackChanges() == set()
+
+
+def test_deltas_and_compaction_restore_table(tmp_path):
+    mgr = CheckpointManager(str(tmp_path), compactEvery=2)
+    q = {(0, 0): [1.0, 2.0, 3.0, 4.0]}
+    mgr.save(q, q.keys(), {"episode": 1})
+    for ep in range(2, 6):
+        q[(ep, 1)] = [float(ep)] * 4
+        q[(0, 0)][0] = -float(ep)
+        mgr.save(q, [(0, 0), (ep, 1)], {"episode": ep})
+    mgr.close()
+
+    assert len(os.listdir(str(tmp_path))) == 3  # base, one delta, manifest
+    restored, state = CheckpointManager(str(tmp_path)).load()
+    assert restored == q
+    assert state == {"episode": 5}
+
+
+def test_resume_after_crash_matches_uninterrupted_run(tmp_path):
+    full, fullLog = _run(tmp_path, "full", 20)
+
+    # "crash" after 13 episodes: the last checkpoint is after episode 10
+    _run(tmp_path, "part", 13, rotateEpisodes=4)
+    resumed, partLog = _run(tmp_path, "part", 20, resume=True, rotateEpisodes=4)
+
+    assert resumed.qTable == full.qTable
+    assert resumed._rng.getstate() == full._rng.getstate()
+    assert _episodeRows(partLog) == _episodeRows(fullLog)
+    assert _stepRows(partLog) == _stepRows(fullLog)
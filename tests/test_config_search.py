@@ -0,0 +1,78 @@
+import copy
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.config_search import SuccessiveHalving, hyperbandBrackets, runTrial, sampleConfigs
+from src.core_types import MazeGenParams, TrainingConfig
+from src.maze_generator import MazeGenerator
+
+
+def _maze():
+    return MazeGenerator().generate(MazeGenParams(rows=9, cols=9, seed=3))
+
+
+def test_sample_configs_grid_or_subset():
+    space = {"alpha": [0.1, 0.2], "epsilon": [0.1, 0.2, 0.3]}
+    assert len(sampleConfigs(space, 10)) == 6
+    sample = sampleConfigs(space, 4, seed=1)
+    assert len(sample) == 4 and len({tuple(c.values()) for c in sample}) == 4
+    assert sample == sampleConfigs(space, 4, seed=1)
+
+
+def test_hyperband_brackets_end_at_max_budget():
+    brackets = hyperbandBrackets(maxEpisodes=90, minEpisodes=10, eta=3)
+    assert brackets[0] == (9, 10)
+    assert brackets[-1] == (3, 90)
+
+
+def test_run_trial_resumes_from_q_table():
+    maze = _maze()
+    cfg = TrainingConfig(evalEvery=0, interactive=False, maxStepsPerEpisode=200)
+    first = runTrial(maze, [], cfg, {}, None, 0, 5)
+    learned = copy.deepcopy(first["qTable"])
+    assert first["envSteps"] > 0 and learned
+
+    # 5 + 5 resumed episodes replay a straight 10-episode run exactly: the
+    # learned rows are carried on and the RNG continues where it stopped
+    resumed = runTrial(maze, [], cfg, copy.deepcopy(learned), first["rngState"], 0, 5)
+    straight = runTrial(maze, [], cfg, {}, None, 0, 10)
+    assert resumed["qTable"] == straight["qTable"]
+    assert first["envSteps"] + resumed["envSteps"] == straight["envSteps"]
+    assert any(resumed["qTable"][s] != row for s, row in learned.items())
+
+    reseeded = runTrial(maze, [], cfg, copy.deepcopy(learned), None, 0, 5)
+    assert reseeded["qTable"] != straight["qTable"]
+
+
+def _search(workers):
+    search = SuccessiveHalving(
+        _maze(),
+        TrainingConfig(maxStepsPerEpisode=200),
+        eta=3,
+        minEpisodes=5,
+        maxEpisodes=45,
+        workers=workers,
+    )
+    configs = sampleConfigs({"alpha": [0.1, 0.3, 0.5], "epsilon": [0.05, 0.2, 0.4]}, 9)
+    return search, search.run(configs)
+
+
+def test_successive_halving_keeps_top_fraction():
+    search, report = _search(workers=1)
+
+    assert [(r["episodes"], r["trials"]) for r in search.rungs] == [(5, 9), (15, 3), (45, 1)]
+    assert report["winner"]["episodes"] == 45
+    assert report["compute"]["episodes"] == 6 * 5 + 2 * 15 + 45
+    assert report["compute"]["env_steps"] > 0
+    assert report["compute"]["full_sweep_episodes"] == 9 * 45
+
+
+def test_worker_processes_match_the_serial_search():
+    _, serial = _search(workers=1)
+    _, parallel = _search(workers=2)
+
+    assert parallel["winner"] == serial["winner"]
+    assert parallel["trials"] == serial["trials"]
+    assert parallel["compute"]["env_steps"] == serial["compute"]["env_steps"]
@@ -0,0 +1,71 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import random
+
+import pytest
+
+from src.core_types import MazeGenParams, TrainingConfig
+from src.corridor_pathfinder import CorridorPathfinder
+from src.maze_generator import MazeGenerator
+from src.pathfinder import Pathfinder
+from src.planners import makePathfinder
+
+
+def _assertSameAsFlat(grid, queries=200, seed=0):
+    rng = random.Random(seed)
+    free = [(r, c) for r in range(len(grid)) for c in range(len(grid[0])) if grid[r][c] == 0]
+    flat = Pathfinder()
+    cor = CorridorPathfinder()
+    for _ in range(queries):
+        s, t = rng.choice(free), rng.choice(free)
+        a = flat.getAStarPath(grid, s, t)
+        b = cor.getAStarPath(grid, s, t)
+        if a is None:
+            assert b is None
+            continue
+        assert len(b) == len(a)
+        assert b[0] == s and b[-1] == t
+        for x, y in zip(b, b[1:]):
+            assert abs(x[0] - y[0]) + abs(x[1] - y[1]) == 1
+            assert grid[y[0]][y[1]] == 0
+
+
+@pytest.mark.parametrize("algorithm", ["backtracker", "random"])
+def test_paths_are_optimal_on_generated_mazes(algorithm):
+    grid, _, _ = MazeGenerator().generate(MazeGenParams(rows=31, cols=31, seed=3, algorithm=algorithm))
+    _assertSameAsFlat(grid)
+
+
+def test_loops_without_junctions_and_loops_on_a_junction():
+    ring = [[0] * 7] + [[0] + [1] * 5 + [0] for _ in range(5)] + [[0] * 7]
+    _assertSameAsFlat(ring)
+
+    lasso = [
+        [1, 1, 1, 1, 1],
+        [1, 0, 0, 0, 1],
+        [1, 0, 1, 0, 1],
+        [0, 0, 0, 0, 1],
+        [1, 1, 1, 1, 1],
+    ]
+    _assertSameAsFlat(lasso)
+
+
+def test_perfect_maze_contracts_and_graph_is_cached():
+    grid, start, goal = MazeGenerator().generate(MazeGenParams(rows=61, cols=61, seed=1, algorithm="backtracker"))
+    pf = CorridorPathfinder()
+    g = pf.graph(grid)
+    free = sum(1 for row in grid for v in row if v == 0)
+    assert g.nodes * 4 < free
+
+    flat = Pathfinder()
+    flat.getAStarPath(grid, start, goal)
+    path = pf.getAStarPath(grid, start, goal)
+    assert pf.graph(grid) is g
+    assert pf.lastExpansions < flat.lastExpansions
+    assert pf.nextMove(grid, start, goal) == pf.nextMoveFromPath(path)
+
+
+def test_planner_factory_builds_corridor_pathfinder():
+    assert isinstance(makePathfinder(TrainingConfig(planner="corridor")), CorridorPathfinder)
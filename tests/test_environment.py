@@ -53,3 +53,17 @@ def test_episode_ends_after_max_steps():
     env.step(Action.DOWN)
     next_state, reward, done = env.step(Action.DOWN)  # should hit max steps
     assert done is True
+
+def test_invalidated_grid_edit_reaches_existing_environment():
+    from src.move_masks import invalidateMoves
+    from src.pathfinder import Pathfinder
+
+    grid = [[0, 0, 0], [1, 1, 0], [0, 0, 0]]
+    env = Environment(grid, (0, 0), (2, 0))
+    assert env.isValidMove(Action.RIGHT)
+
+    grid[0][1] = 1
+    invalidateMoves(grid)
+    assert not env.isValidMove(Action.RIGHT)
+    assert env.validActions() == ()
+    assert Pathfinder().getAStarPath(grid, (0, 0), (2, 0)) is None
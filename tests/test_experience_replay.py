@@ -0,0 +1,52 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import numpy as np
+
+from src.experience_replay import ReplayBuffer, batchUpdate, replayInto
+from src.hybrid_agent import HybridAgent
+
+
+def test_ring_buffer_overwrites_oldest():
+    buf = ReplayBuffer(3, seed=0)
+    for i in range(5):
+        buf.add(i, 0, float(i), i + 1, False)
+    assert len(buf) == 3
+    assert sorted(buf.state.tolist()) == [2, 3, 4]
+    idx, w = buf.sample(8)
+    assert set(buf.state[idx].tolist()) <= {2, 3, 4}
+    assert (w == 1.0).all()
+
+
+def test_prioritized_sampling_prefers_large_errors():
+    buf = ReplayBuffer(100, prioritized=True, seed=1)
+    for i in range(100):
+        buf.add(i, 0, 0.0, i, False)
+    buf.updatePriorities(np.arange(100), np.where(np.arange(100) == 7, 50.0, 0.01))
+    idx, w = buf.sample(200)
+    assert (idx == 7).mean() > 0.5
+    assert w.max() == 1.0
+    assert w[idx == 7].min() < w[idx != 7].max()
+
+
+def test_batch_update_matches_sequential_for_distinct_rows():
+    q = np.zeros((4, 4))
+    q[2] = [1.0, 3.0, 0.0, 0.0]
+    td = batchUpdate(q, np.array([0, 1]), np.array([3, 1]), np.array([-1.0, 10.0]),
+                     np.array([2, 3]), np.array([False, True]), lr=0.5, gamma=0.9)
+    assert q[0, 3] == 0.5 * (-1.0 + 0.9 * 3.0)
+    assert q[1, 1] == 5.0
+    assert td.tolist() == [-1.0 + 0.9 * 3.0, 10.0]
+
+
+def test_replay_updates_agent_table_and_tracks_changes():
+    agent = HybridAgent(alpha=0.5, gamma=0.9, epsilon=0.0, heuristicRate=0.0, seed=0)
+    agent.trackChanges()
+    buf = ReplayBuffer(10, seed=0)
+    buf.add(0 * 5 + 1, 3, 100.0, 0 * 5 + 2, True)  # (0, 1) -> goal (0, 2)
+
+    assert replayInto(agent, buf, 4, cols=5) == 4
+    assert agent.qTable[(0, 1)][3] == 0.5 * 100.0  # duplicates move by their mean step
+    assert (0, 2) not in agent.qTable
+    assert agent.trackChanges() == {(0, 1)}
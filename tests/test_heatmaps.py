@@ -0,0 +1,39 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import numpy as np
+
+from src.heatmaps import SOURCES, HeatmapAccumulator
+
+
+def test_record_counts_visits_by_source():
+    grid = [[0, 0, 0], [0, 1, 0]]
+    acc = HeatmapAccumulator(grid)
+    acc.record((0, 0), "greedy")
+    acc.record((0, 0), "astar")
+    acc.record((1, 2), "astar")
+
+    assert acc.visits.tolist() == [[2, 0, 0], [0, 0, 1]]
+    assert acc.bySource[SOURCES.index("astar")].sum() == 2
+    assert acc.wallMask[1, 1]
+
+
+def test_max_q_snapshot_marks_unseen_cells_nan():
+    acc = HeatmapAccumulator([[0, 0], [0, 0]])
+    q = acc.maxQ({(0, 1): [0.0, 2.5, -1.0, 0.0]})
+    assert q[0, 1] == 2.5
+    assert np.isnan(q[1, 1])
+
+
+def test_export_every_n_episodes_writes_arrays_and_pngs(tmp_path):
+    acc = HeatmapAccumulator([[0, 0], [1, 0]], exportEvery=2, outDir=str(tmp_path))
+    acc.record((0, 0), "greedy")
+
+    assert acc.endEpisode(1, {}) is None
+    path = acc.endEpisode(2, {(0, 0): [1.0, 0.0, 0.0, 0.0]})
+
+    data = np.load(path)
+    assert data["visits"][0, 0] == 1
+    assert os.path.exists(str(tmp_path / "heatmap_ep000002_visits.png"))
+    assert os.path.exists(str(tmp_path / "heatmap_ep000002_maxq.png"))
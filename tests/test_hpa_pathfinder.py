@@ -0,0 +1,85 @@
+import sys
+import os
+import random
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.core_types import Action, MazeGenParams
+from src.hpa_pathfinder import HierarchicalPathfinder, compareWithFlat
+from src.maze_generator import MazeGenerator
+from src.pathfinder import Pathfinder
+
+
+def _isValidPath(grid, path):
+    return all(
+        abs(a[0] - b[0]) + abs(a[1] - b[1]) == 1 and grid[b[0]][b[1]] == 0
+        for a, b in zip(path, path[1:])
+    )
+
+
+def test_hpa_agrees_with_flat_astar_on_reachability():
+    grid, _, _ = MazeGenerator().generate(MazeGenParams(rows=40, cols=40, wallDensity=0.3, seed=5))
+    free = [(r, c) for r in range(40) for c in range(40) if grid[r][c] == 0]
+    rng = random.Random(0)
+
+    flat = Pathfinder()
+    hpa = HierarchicalPathfinder(clusterSize=8)
+
+    for _ in range(50):
+        start, goal = rng.choice(free), rng.choice(free)
+        expected = flat.getAStarPath(grid, start, goal)
+        path = hpa.getAStarPath(grid, start, goal)
+
+        assert (path is None) == (expected is None)
+        if path is not None:
+            assert path[0] == start and path[-1] == goal
+            assert _isValidPath(grid, path)
+            assert len(path) >= len(expected)
+
+
+def test_perfect_maze_paths_are_exact_and_abstraction_is_cached():
+    grid, start, goal = MazeGenerator().generate(MazeGenParams(rows=41, cols=41, seed=2, algorithm="kruskal"))
+    hpa = HierarchicalPathfinder(clusterSize=10)
+
+    path = hpa.getAStarPath(grid, start, goal)
+    abstraction = hpa.abstraction(grid)
+    assert hpa.getAStarPath(grid, goal, start) == list(reversed(path))
+    assert hpa.abstraction(grid) is abstraction
+    assert len(path) == len(Pathfinder().getAStarPath(grid, start, goal))
+    assert hpa.nextMove(grid, start, goal) == Pathfinder().nextMoveFromPath(path)
+
+
+def test_compare_with_flat_reports_stats():
+    grid = [[0] * 30 for _ in range(30)]
+    stats = compareWithFlat(grid, [((0, 0), (29, 29)), ((5, 5), (20, 3))], clusterSize=10)
+    assert stats["solved"] == 2
+    assert stats["flat"]["expansions"] > 0
+    assert stats["hpa"]["abstract_expansions"] > 0
+
+
+def test_next_move_matches_flat_from_every_start_cell():
+    for algorithm in ("random", "backtracker"):
+        grid, _, goal = MazeGenerator().generate(
+            MazeGenParams(rows=40, cols=40, wallDensity=0.3, seed=7, algorithm=algorithm)
+        )
+        flat = Pathfinder()
+        hpa = HierarchicalPathfinder(clusterSize=8)
+        for r in range(40):
+            for c in range(40):
+                if grid[r][c] != 0 or (r, c) == goal:
+                    continue
+                move = hpa.nextMove(grid, (r, c), goal)
+                assert (move is None) == (flat.nextMove(grid, (r, c), goal) is None), (algorithm, (r, c))
+                if move is not None:
+                    dr, dc = Action.delta(move)
+                    assert grid[r + dr][c + dc] == 0
+
+
+def test_generic_counters_track_queries():
+    grid, start, goal = MazeGenerator().generate(MazeGenParams(rows=40, cols=40, wallDensity=0.3, seed=5))
+    hpa = HierarchicalPathfinder(clusterSize=8)
+    hpa.getAStarPath(grid, start, goal)
+    hpa.nextMove(grid, start, goal)
+
+    assert hpa.queries == hpa.stats["queries"] == 2
+    # the stats also count local searches done while building the abstraction
+    assert 0 < hpa.totalExpansions <= hpa.stats["abstract_expansions"] + hpa.stats["local_expansions"]
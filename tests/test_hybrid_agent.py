@@ -50,3 +50,18 @@ def test_set_epsilon_and_heuristic_rate():
     agent.setHeuristicRate(0.8)
     assert agent.epsilon == 0.9
     assert agent.heuristicRate == 0.8
+
+
+def test_dirty_set_is_independent_of_change_tracking():
+    agent = HybridAgent(alpha=0.5, gamma=0.9, epsilon=0.0, heuristicRate=0.0, seed=0)
+    agent.trackChanges()
+    agent.takeDirty()
+    agent.updateQ((0, 0), 1, 1.0, (1, 0))
+
+    assert agent.takeDirty() == {(0, 0), (1, 0)}
+    assert agent.takeDirty() == set()
+    assert agent.trackChanges() == {(0, 0), (1, 0)}
+
+    agent.stopDirty()
+    agent.updateQ((0, 0), 1, 1.0, (1, 0))
+    assert agent._dirty is None
@@ -0,0 +1,35 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.log_analytics import LearningCurve, analyzeLogs
+from src.logger import Logger, logPaths
+
+
+def test_learning_curve_stays_bounded():
+    curve = LearningCurve(maxPoints=8)
+    for i in range(1000):
+        curve.add(i + 1, reward=1.0, steps=10, success=(i % 2 == 0))
+
+    points = curve.points()
+    assert len(points) <= 8
+    assert sum(p["episodes"] for p in points) == 1000
+    assert all(p["success_rate"] == 0.5 for p in points[:-1])
+
+
+def test_analyze_logs_written_by_logger(tmp_path):
+    base = str(tmp_path / "run.csv")
+    log = Logger(base, console=False)
+    log.logStep(1, 1, 0, 0, 1, -1.0, False, "train", "greedy")
+    log.logStep(1, 2, 1, 0, 3, 100.0, True, "train", "astar")
+    log.logEpisode(1, 2, 99.0, True, "train")
+    log.logEpisode(100001, 5, -5.0, False, "eval")
+    log.close()
+
+    stepPath, epPath = logPaths(base)
+    summary, steps = analyzeLogs(epPath, stepPath, window=10)
+
+    assert summary["episodes"]["train"]["success_rate"] == 1.0
+    assert summary["episodes"]["eval"]["success_rate"] == 0.0
+    assert summary["steps"]["source_mix"]["train"] == {"greedy": 0.5, "astar": 0.5}
+    assert steps.visitGrid() == [[1], [1]]
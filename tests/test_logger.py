@@ -0,0 +1,55 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.logger import Logger, iterStepRows, stepSegments
+from src.telemetry import Telemetry
+
+
+def _logEpisodes(log, n, stepsPerEpisode=3):
+    for ep in range(1, n + 1):
+        for t in range(1, stepsPerEpisode + 1):
+            log.logStep(ep, t, 0, t, 3, -1.0, t == stepsPerEpisode, "train", "greedy")
+        log.logEpisode(ep, stepsPerEpisode, -3.0, False, "train")
+
+
+def test_rotation_by_episode_count_compresses_closed_segments(tmp_path):
+    base = str(tmp_path / "run.csv")
+    log = Logger(base, console=False, rotateEpisodes=2)
+    _logEpisodes(log, 5)
+    log.close()
+
+    segments = stepSegments(base)
+    assert [os.path.basename(p) for p in segments] == [
+        "run_steps.000001.csv.gz",
+        "run_steps.000002.csv.gz",
+        "run_steps.csv",
+    ]
+
+
+def test_rows_read_back_across_segments_in_order(tmp_path):
+    base = str(tmp_path / "run.csv")
+    log = Logger(base, console=False, rotateBytes=64)
+    _logEpisodes(log, 4)
+    log.close()
+
+    rows = list(iterStepRows(base))
+    assert len(rows) == 12
+    assert [int(r["episode"]) for r in rows[::3]] == [1, 2, 3, 4]
+
+
+def test_no_rotation_by_default(tmp_path):
+    base = str(tmp_path / "run.csv")
+    log = Logger(base, console=False)
+    _logEpisodes(log, 5)
+    log.close()
+
+    assert [os.path.basename(p) for p in stepSegments(base)] == ["run_steps.csv"]
+
+
+def test_metrics_only_telemetry_keeps_console_synchronous(tmp_path, capsys):
+    tel = Telemetry(metricsPath=str(tmp_path / "metrics.jsonl"), console=False)
+    log = Logger(str(tmp_path / "run.csv"), console=True, telemetry=tel)
+    log.info("hello")
+    assert capsys.readouterr().out == "hello\n"
+    log.close()
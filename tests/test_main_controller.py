@@ -0,0 +1,107 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.core_types import TrainingConfig
+from src.environment import Environment
+from src.hybrid_agent import HybridAgent
+from src.main_controller import MainController
+
+
+class _ScriptedUI:
+    # replays a list of control commands and records what was drawn
+    def __init__(self, script):
+        self._fps = 60
+        self.script = list(script)
+        self.drawn = []
+        self.seenAtWait = []
+
+    def setAgent(self, agent):
+        pass
+
+    def setHud(self, hud):
+        pass
+
+    def drawGrid(self, env):
+        pass
+
+    def drawAgent(self, pos):
+        self.drawn.append(pos)
+
+    def updateScreen(self):
+        pass
+
+    def _next(self):
+        cmd = {
+            "paused": True, "stop": False, "fps_delta": 0, "episodes_delta": 0,
+            "restart_episode": False, "step_once": False, "next_episode": False,
+        }
+        cmd.update(self.script.pop(0) if self.script else {"stop": True})
+        return cmd
+
+    def pollControls(self):
+        return self._next()
+
+    def waitControls(self, timeoutMs=250):
+        self.seenAtWait.append(self.drawn[-1])
+        return self._next()
+
+
+def test_paused_step_once_draws_the_post_step_state():
+    env = Environment([[0, 0, 0], [0, 0, 0], [0, 0, 0]], (0, 0), (2, 2))
+    agent = HybridAgent(0.1, 0.99, 0.0, 0.0, seed=0)
+    agent.qTable[(0, 0)] = [0.0, 0.0, 0.0, 1.0]  # greedy RIGHT
+    ui = _ScriptedUI([{}, {"step_once": True}, {}])
+    controller = MainController(env, agent, ui, None, None)
+
+    controller.runEpisode(TrainingConfig(visual=True, interactive=True, uiPollInterval=0.0))
+
+    # pause -> (wait) step -> (wait) shows the moved agent -> (wait) stop
+    assert env.agentPos == (0, 1)
+    assert ui.seenAtWait[1:] == [env.agentPos, env.agentPos]
+
+
+def _scheduleTrace(actors):
+    grid = [[0] * 4 for _ in range(4)]
+    cfg = TrainingConfig(episodes=8, evalEvery=0, actors=actors, maxStepsPerEpisode=50, interactive=False,
+                         epsilon=0.4, epsilonSchedule="linear", epsilonEnd=0.0)
+    agent = HybridAgent(cfg.alpha, cfg.gamma, cfg.epsilon, cfg.heuristicRate, seed=1)
+    controller = MainController(Environment(grid, (0, 0), (3, 3), maxSteps=50), agent, None, None, None)
+
+    trace = {}
+    applySchedule = controller._applySchedule
+
+    def record(episode):
+        applySchedule(episode)
+        trace[controller._episodeId] = agent.epsilon
+
+    controller._applySchedule = record
+    controller.startTraining(cfg)
+    return trace
+
+
+def test_schedule_episode_convention_matches_with_actors():
+    sequential = _scheduleTrace(actors=1)
+    assert sequential[1] == 0.4
+    assert _scheduleTrace(actors=2) == sequential
+
+
+def test_parallel_training_reports_every_unsupported_flag(tmp_path, capsys):
+    from src.logger import Logger
+
+    grid = [[0] * 4 for _ in range(4)]
+    cfg = TrainingConfig(episodes=2, evalEvery=0, actors=2, maxStepsPerEpisode=20, interactive=False,
+                         checkpointEvery=1, resume=True, options=True, replayCapacity=100,
+                         heatmapEvery=1, asyncEval=True)
+    agent = HybridAgent(cfg.alpha, cfg.gamma, cfg.epsilon, cfg.heuristicRate, seed=1)
+    logger = Logger(str(tmp_path / "run.csv"), console=True)
+    controller = MainController(Environment(grid, (0, 0), (3, 3), maxSteps=20), agent, None, logger, None)
+    controller.startTraining(cfg)
+    logger.close()
+
+    notes = [line for line in capsys.readouterr().out.splitlines() if "not supported with actors > 1" in line]
+    names = ("checkpointing", "resume", "options", "experience replay", "heatmaps", "async evaluation")
+    assert sorted(notes) == sorted(n for n in notes if n.startswith(tuple(f"[SYSTEM] {x} " for x in names)))
+    assert len(notes) == len(names)
+    assert controller.heatmaps is None and controller.replay is None
@@ -47,3 +47,27 @@ def test_ensure_solvable_detects_solvable():
     mg = MazeGenerator()
     grid = np.zeros((3, 3), dtype=int)
     assert mg.ensureSolvable(grid.tolist(), (0, 0), (2, 2))
+
+def test_perfect_mazes_are_spanning_trees():
+    mg = MazeGenerator()
+    for algorithm in MazeGenerator.PERFECT_ALGORITHMS:
+        params = MazeGenParams(rows=21, cols=15, seed=7, algorithm=algorithm)
+        grid, start, goal = mg.generate(params)
+
+        cells = 11 * 8
+        free = sum(1 for row in grid for v in row if v == 0)
+        assert free == 2 * cells - 1  # cells + (cells - 1) passages
+        assert goal == (20, 14)
+        assert mg.ensureSolvable(grid, start, goal)
+
+def test_perfect_maze_with_even_size_keeps_goal_on_lattice():
+    mg = MazeGenerator()
+    grid, start, goal = mg.generate(MazeGenParams(rows=10, cols=8, seed=3, algorithm="kruskal"))
+    assert (len(grid), len(grid[0])) == (10, 8)
+    assert goal == (8, 6)
+    assert grid[goal[0]][goal[1]] == 0
+
+def test_unknown_algorithm_raises():
+    import pytest
+    with pytest.raises(ValueError):
+        MazeGenerator().generate(MazeGenParams(algorithm="prim"))
@@ -0,0 +1,103 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import pytest
+
+pygame = pytest.importorskip("pygame")
+
+from src.core_types import MazeGenParams
+from src.environment import Environment
+from src.maze_generator import MazeGenerator
+from src.maze_ui import MazeUI
+
+
+@pytest.fixture
+def headless(monkeypatch):
+    monkeypatch.setenv("SDL_VIDEODRIVER", "dummy")
+    yield
+    pygame.quit()
+
+
+def _env(n, algorithm="backtracker"):
+    grid, start, goal = MazeGenerator().generate(MazeGenParams(rows=n, cols=n, seed=1, algorithm=algorithm))
+    env = Environment(grid, start, goal)
+    env.reset()
+    return env
+
+
+def test_small_maze_fits_window_without_camera(headless):
+    env = _env(9)
+    ui = MazeUI(cellSize=20)
+    ui.drawGrid(env)
+    ui.drawAgent(env.agentPos)
+    assert ui._screen.get_size() == (320, 9 * 20 + 90)
+    assert (ui._camR, ui._camC) == (0, 0)
+    assert ui._minimap is None
+    # wall / floor colours come from the level-0 surface
+    assert ui._screen.get_at((30, 10))[:3] == (60, 60, 60)
+
+
+def test_large_maze_window_is_capped_and_camera_follows(headless):
+    env = _env(1001)
+    ui = MazeUI(cellSize=28, maxWindow=(640, 480))
+    env.agentPos = (700, 300)
+    ui.drawGrid(env)
+    ui.drawAgent(env.agentPos)
+
+    assert ui._screen.get_size() == (640, 480 + 90)
+    assert ui._minimap is not None
+    vr, vc = ui._visibleCells(1001, 1001)
+    assert ui._camR <= 700 < ui._camR + vr
+    assert ui._camC <= 300 < ui._camC + vc
+
+
+@pytest.mark.parametrize("zoom", [64, 4, 1, 0.25, 1.0 / 64])
+def test_every_zoom_level_renders(headless, zoom):
+    env = _env(301)
+    ui = MazeUI(maxWindow=(400, 300))
+    ui.setZoom(zoom)
+    env.agentPos = (150, 150)
+    ui.drawGrid(env)
+    ui.drawAgent(env.agentPos)
+
+    # the agent is drawn at its on-screen position
+    x = int((150 - ui._camC) * ui._zoom)
+    y = int((150 - ui._camR) * ui._zoom)
+    assert ui._screen.get_at((x + 1, y + 1))[:3] == (120, 50, 0)
+
+
+def test_q_overlay_redraws_only_dirty_cells(headless):
+    from src.hybrid_agent import HybridAgent
+
+    env = _env(21)
+    agent = HybridAgent(alpha=0.5, gamma=0.9, epsilon=0.0, heuristicRate=0.0, seed=0)
+    ui = MazeUI(cellSize=20)
+    ui.setAgent(agent)
+    ui.setQOverlay(True)
+
+    s = env.agentPos
+    agent.updateQ(s, 3, 1.0, s)
+    ui.drawGrid(env)
+    data = ui._qData
+    assert data[s[0] * 21 + s[1]] > 128
+    assert ui._qArrows is not None
+    x, y = s[1] * 20 + 10, s[0] * 20 + 10
+    assert ui._qArrows.get_at((x, y)).a > 0
+
+    # unchanged table: the layers are reused, only the dirty row is rewritten
+    calls = []
+    ui._drawArrow = lambda table, r, c, size: calls.append((r, c))
+    agent.updateQ(s, 0, -4.0, s)
+    ui.drawGrid(env)
+    assert ui._qData is data
+    assert calls == [s]
+
+    # the colour scale grows with |max Q| and forces a full rebuild
+    agent.qTable[s] = [5.0, 0.0, 0.0, 0.0]
+    agent.updateQ(s, 0, 5.0, s)
+    ui.drawGrid(env)
+    assert ui._qScale >= max(agent.qTable[s]) and ui._qData is not data
+
+    ui.setQOverlay(False)
+    assert agent._dirty is None
@@ -0,0 +1,35 @@
+import sys
+import os
+import csv
+import json
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.core_types import MazeGenParams, TrainingConfig
+from src.environment import Environment
+from src.hybrid_agent import HybridAgent
+from src.main_controller import MainController
+from src.maze_generator import MazeGenerator
+from src.memory_profiler import CATEGORY_NAMES
+
+
+def test_training_writes_memory_timeline_and_top_sites(tmp_path):
+    grid, start, goal = MazeGenerator().generate(MazeGenParams(rows=10, cols=10, wallDensity=0.2, seed=3))
+    agent = HybridAgent(alpha=0.1, gamma=0.9, epsilon=0.3, heuristicRate=0.5, seed=0)
+    controller = MainController(Environment(grid, start, goal, maxSteps=50), agent, None, None, None)
+
+    outDir = str(tmp_path / "mem")
+    controller.startTraining(TrainingConfig(episodes=5, evalEvery=0, maxStepsPerEpisode=50,
+                                            profileMemory=2, profileDir=outDir))
+
+    with open(os.path.join(outDir, "memory_timeline.csv"), newline="") as f:
+        rows = list(csv.DictReader(f))
+    assert [r["episode"] for r in rows] == ["2", "4", "5"]
+    assert all(int(rows[-1][c]) >= 0 for c in CATEGORY_NAMES)
+    assert int(rows[-1]["qtable"]) > 0
+    assert int(rows[-1]["qtable_states"]) == len(agent.qTable)
+
+    with open(os.path.join(outDir, "memory_top.json")) as f:
+        report = json.load(f)
+    assert report["samples"] == 3
+    assert report["top"]
+    assert controller.memProfiler is None
@@ -0,0 +1,89 @@
+import sys
+import os
+import json
+import random
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.logger import EPISODE_HEADER, EPISODE_METRIC_COLUMNS, Logger, logPaths
+from src.metrics import MetricsEngine, P2Quantile, RollingWindow
+
+
+def test_rolling_window_keeps_last_values():
+    w = RollingWindow(3)
+    for x in (1, 2, 3, 4, 5):
+        w.add(x)
+    assert len(w) == 3
+    assert w.mean() == 4.0
+
+
+def test_p2_quantiles_track_exact_values():
+    rng = random.Random(3)
+    data = [rng.expovariate(0.01) for _ in range(20000)]
+    exact = sorted(data)
+
+    for p in (0.5, 0.95, 0.99):
+        q = P2Quantile(p)
+        for x in data:
+            q.add(x)
+        truth = exact[int(p * (len(exact) - 1))]
+        assert abs(q.value() - truth) / truth < 0.05
+
+
+def test_p2_small_samples_use_exact_order_statistics():
+    q = P2Quantile(0.5)
+    for x in (5, 1, 3):
+        q.add(x)
+    assert q.value() == 3
+
+
+def test_engine_separates_modes_and_windows():
+    m = MetricsEngine(windows=(2, 10))
+    for ok in (True, True, False, False):
+        m.record("train", steps=10, reward=1.0, success=ok, latencyS=0.002)
+    m.record("eval", steps=5, reward=2.0, success=True)
+
+    assert m.successRate("train") == 0.0
+    assert m.successRate("train", window=10) == 0.5
+    assert m.successRate("eval") == 1.0
+    assert m.count("train") == 4
+
+    snap = m.snapshot()
+    assert snap["train"]["latency_ms"]["p50"] == 2.0
+    assert set(m.episodeColumns("train")) == set(EPISODE_METRIC_COLUMNS)
+
+
+def test_summary_file_is_json(tmp_path):
+    m = MetricsEngine()
+    m.record("train", 4, -1.0, False)
+    path = str(tmp_path / "out" / "summary.json")
+    m.writeSummary(path)
+    with open(path) as f:
+        assert json.load(f)["train"]["steps"]["count"] == 1
+
+
+def test_logger_keeps_legacy_episode_header(tmp_path):
+    base = str(tmp_path / "run.csv")
+    _, epPath = logPaths(base)
+    with open(epPath, "w", newline="") as f:
+        f.write(",".join(EPISODE_HEADER) + "\r\n")
+
+    log = Logger(base, console=False)
+    log.logEpisode(1, 3, -3.0, False, "train", metrics={"sr_window": 0.5})
+    log.close()
+
+    with open(epPath) as f:
+        rows = [line.strip().split(",") for line in f]
+    assert rows[0] == EPISODE_HEADER
+    assert len(rows[1]) == len(EPISODE_HEADER)
+
+
+def test_logger_writes_metric_columns_for_new_logs(tmp_path):
+    base = str(tmp_path / "run.csv")
+    log = Logger(base, console=False)
+    log.logEpisode(1, 3, -3.0, False, "train", metrics={"sr_window": 0.5})
+    log.close()
+
+    with open(logPaths(base)[1]) as f:
+        rows = [line.strip().split(",") for line in f]
+    assert rows[0] == EPISODE_HEADER + EPISODE_METRIC_COLUMNS
+    assert rows[1][len(EPISODE_HEADER)] == "0.5"
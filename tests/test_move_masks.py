@@ -0,0 +1,88 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.core_types import Action
+from src.environment import Environment
+from src.move_masks import VALID_ACTIONS, invalidateMoves, movesFor
+
+
+def test_masks_match_bounds_and_walls():
+    grid = [
+        [0, 1, 0],
+        [0, 0, 0],
+    ]
+    m = movesFor(grid)
+    assert m.validActions(0, 0) == (Action.DOWN,)
+    assert m.validActions(1, 1) == (Action.LEFT, Action.RIGHT)
+    assert m.validActions(0, 2) == (Action.DOWN,)
+    assert VALID_ACTIONS[m.mask(1, 0)] == (Action.UP, Action.RIGHT)
+
+
+def test_masks_are_cached_per_grid_and_can_be_invalidated():
+    grid = [[0, 0], [0, 0]]
+    m = movesFor(grid)
+    assert movesFor(grid) is m
+
+    grid[0][1] = 1
+    invalidateMoves(grid)
+    assert movesFor(grid).validActions(0, 0) == (Action.DOWN,)
+
+
+def test_environment_valid_actions_use_masks():
+    grid = [[0, 0, 0], [1, 0, 1], [0, 0, 0]]
+    env = Environment(grid, (1, 1), (2, 2))
+    assert env.validActions() == (Action.UP, Action.DOWN)
+    assert not env.isValidMove(Action.LEFT)
+
+
+def test_corridor_next_continues_straight_and_around_corners():
+    from src.move_masks import CORRIDOR_NEXT
+
+    grid = [
+        [0, 0, 0],
+        [1, 1, 0],
+        [0, 0, 0],
+    ]
+    m = movesFor(grid)
+    # entered (0, 1) moving right: keep going right
+    assert CORRIDOR_NEXT[m.mask(0, 1)][Action.RIGHT] == Action.RIGHT
+    # corner (0, 2) entered moving right turns down
+    assert CORRIDOR_NEXT[m.mask(0, 2)][Action.RIGHT] == Action.DOWN
+    # dead end (2, 0) and a cell whose back move is not legal stop
+    assert CORRIDOR_NEXT[m.mask(2, 0)][Action.LEFT] == -1
+    assert CORRIDOR_NEXT[m.mask(0, 1)][Action.UP] == -1
+
+    open3 = [[0] * 3 for _ in range(3)]
+    assert CORRIDOR_NEXT[movesFor(open3).mask(1, 1)][Action.RIGHT] == -1
+
+
+def test_cache_keeps_the_grid_in_use_under_churn():
+    hot = [[0] * 3 for _ in range(3)]
+    masks = movesFor(hot)
+    others = [[[0] * 3 for _ in range(3)] for _ in range(20)]
+    for g in others:
+        movesFor(g)
+        assert movesFor(hot) is masks
+
+
+def test_cache_is_safe_across_threads():
+    import threading
+
+    grids = [[[0] * 4 for _ in range(4)] for _ in range(40)]
+    errors = []
+
+    def work(offset):
+        try:
+            for i in range(400):
+                g = grids[(i + offset) % len(grids)]
+                assert movesFor(g).grid is g
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=work, args=(k * 7,)) for k in range(6)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert errors == []
@@ -0,0 +1,63 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import csv
+
+from src.async_evaluator import evaluateGreedy
+from src.core_types import Action, MazeGenParams, TrainingConfig
+from src.environment import Environment
+from src.hybrid_agent import HybridAgent
+from src.logger import Logger, logPaths
+from src.main_controller import MainController
+from src.maze_generator import MazeGenerator
+from src.move_masks import DEGREE, movesFor
+
+
+def test_option_update_discounts_by_duration():
+    agent = HybridAgent(alpha=0.5, gamma=0.9, epsilon=0.0, heuristicRate=0.0, seed=0)
+    agent.qTable[(0, 5)] = [10.0, 0.0, 0.0, 0.0]
+    agent.updateQOption((0, 0), Action.RIGHT, -3.0, (0, 5), duration=5)
+    assert abs(agent.qTable[(0, 0)][Action.RIGHT] - 0.5 * (-3.0 + 0.9 ** 5 * 10.0)) < 1e-12
+
+
+def test_greedy_rollout_follows_corridors_between_decisions():
+    grid = [
+        [0, 0, 0, 0],
+        [1, 1, 1, 0],
+        [0, 0, 0, 0],
+    ]
+    # only the start has a row: RIGHT, then the corridor leads to the goal
+    q = {(0, 0): [0.0, 0.0, 0.0, 1.0]}
+    assert not evaluateGreedy(q, grid, (0, 0), (2, 0), maxSteps=20)["success"]
+    run = evaluateGreedy(q, grid, (0, 0), (2, 0), maxSteps=20, options=True)
+    assert run["success"] and run["steps"] == 8
+
+
+def test_controller_decides_only_at_junctions_and_logs_every_step(tmp_path):
+    grid, start, goal = MazeGenerator().generate(MazeGenParams(rows=21, cols=21, seed=2, algorithm="backtracker"))
+    cfg = TrainingConfig(episodes=30, evalEvery=10, options=True, maxStepsPerEpisode=2000)
+    agent = HybridAgent(cfg.alpha, cfg.gamma, cfg.epsilon, cfg.heuristicRate, seed=0)
+    logger = Logger(str(tmp_path / "opt.csv"), console=False)
+    controller = MainController(Environment(grid, start, goal, maxSteps=cfg.maxStepsPerEpisode), agent, None, logger, None)
+
+    results = []
+    runEpisode = controller.runEpisode
+    controller.runEpisode = lambda config: results.append(runEpisode(config)) or results[-1]
+    controller.startTraining(cfg)
+    logger.close()
+
+    steps = sum(r["steps"] for r in results)
+    decisions = sum(r["decisions"] for r in results)
+    assert decisions * 2 < steps
+
+    with open(logPaths(str(tmp_path / "opt.csv"))[0], newline="") as f:
+        rows = [r for r in csv.DictReader(f) if r["mode"] == "train"]
+    assert len(rows) == steps
+    assert sum(1 for r in rows if r["source"] == "option") == steps - decisions
+
+    # Q rows exist only where the agent decides or an option ends (junctions,
+    # dead ends, start and goal)
+    masks = movesFor(grid)
+    corridor = [s for s in agent.qTable if DEGREE[masks.mask(*s)] == 2 and s not in (start, goal)]
+    assert corridor == []
@@ -0,0 +1,27 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.core_types import TrainingConfig
+from src.parallel_training import ParallelTrainer, denseToQTable, qTableToDense
+
+
+def test_dense_round_trip():
+    q = {(0, 1): [1.0, 0.0, -2.0, 0.5], (2, 2): [0.0, 0.0, 0.0, 3.0]}
+    dense = qTableToDense(q, rows=3, cols=3)
+    assert len(dense) == 3 * 3 * 4
+    assert denseToQTable(dense, cols=3) == q
+
+
+def test_actors_feed_learner_until_episode_budget():
+    grid = [[0] * 4 for _ in range(4)]
+    cfg = TrainingConfig(episodes=12, actors=2, maxStepsPerEpisode=50, publishEvery=3, actorRefreshEvery=2)
+
+    seen = []
+    trainer = ParallelTrainer(grid, (0, 0), (3, 3), cfg, seed=1)
+    q = trainer.run(onEpisode=lambda res, _: seen.append(res["episode"]))
+
+    assert trainer.episodesDone == 12
+    assert seen == list(range(1, 13))
+    assert trainer.publishes == 4
+    assert q  # learner applied updates
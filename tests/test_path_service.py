@@ -0,0 +1,143 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import pickle
+import random
+import socket
+import tempfile
+
+import pytest
+
+from src.core_types import Action, MazeGenParams, TrainingConfig
+from src.maze_generator import MazeGenerator
+from src.path_service import PathService, PathServiceClient
+from src.pathfinder import Pathfinder
+from src.planners import makePathfinder
+
+pytestmark = pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="needs Unix sockets")
+
+
+@pytest.fixture
+def service():
+    # short path: Unix socket paths are limited to ~100 bytes
+    d = tempfile.mkdtemp(prefix="ps")
+    svc = PathService(os.path.join(d, "p.sock"), maxMazes=1).start()
+    yield svc
+    svc.close()
+    os.rmdir(d)
+
+
+def _maze(seed):
+    return MazeGenerator().generate(MazeGenParams(rows=31, cols=31, seed=seed, algorithm="backtracker"))
+
+
+def test_client_matches_local_pathfinder(service):
+    grid, start, goal = _maze(1)
+    client = PathServiceClient(service.socketPath)
+    flat = Pathfinder()
+    rng = random.Random(0)
+    free = [(r, c) for r in range(31) for c in range(31) if grid[r][c] == 0]
+
+    for _ in range(40):
+        s, g = rng.choice(free), rng.choice([goal, rng.choice(free)])
+        path = client.getAStarPath(grid, s, g)
+        assert len(path) == len(flat.getAStarPath(grid, s, g))
+        assert path[0] == s and path[-1] == g
+        if s != g:
+            # any first step of some shortest path
+            dr, dc = Action.delta(client.nextMove(grid, s, g))
+            assert len(flat.getAStarPath(grid, (s[0] + dr, s[1] + dc), g)) == len(path) - 1
+
+    walled = [[0, 1, 0]]
+    assert client.getAStarPath(walled, (0, 0), (0, 2)) is None
+    assert client.nextMove(walled, (0, 0), (0, 2)) is None
+    client.close()
+
+
+def test_repeated_goal_is_served_from_one_distance_field(service):
+    grid, start, goal = _maze(2)
+    client = PathServiceClient(service.socketPath)
+    free = [(r, c) for r in range(31) for c in range(31) if grid[r][c] == 0]
+
+    moves = client.nextMoves(grid, [(s, goal) for s in free if s != goal])
+    assert None not in moves
+    for s in free[:20]:
+        client.nextMove(grid, s, goal)
+
+    stats = client.stats()
+    assert stats["field_builds"] == 1
+    assert stats["searches"] == 0
+    assert stats["requests"] == len(moves) + 20
+    assert stats["client"]["requests"] == len(moves) + 20
+    assert stats["batches"] < stats["requests"]
+
+
+def test_evicted_maze_is_registered_again(service):
+    a, sa, ga = _maze(3)
+    b, sb, gb = _maze(4)
+    client = PathServiceClient(service.socketPath)
+    flat = Pathfinder()
+    for _ in range(2):
+        assert len(client.getAStarPath(a, sa, ga)) == len(flat.getAStarPath(a, sa, ga))
+        assert len(client.getAStarPath(b, sb, gb)) == len(flat.getAStarPath(b, sb, gb))
+    assert service.stats()["mazes"] == 1
+
+
+def test_planner_factory_and_pickling_use_per_process_connections(service):
+    client = makePathfinder(TrainingConfig(pathService=service.socketPath))
+    assert isinstance(client, PathServiceClient)
+    grid, start, goal = _maze(5)
+    client.nextMove(grid, start, goal)
+
+    copy = pickle.loads(pickle.dumps(client))
+    assert copy._sock is None
+    assert copy.nextMove(grid, start, goal) == client.nextMove(grid, start, goal)
+
+
+def test_socket_is_private_and_connections_are_released(service):
+    import stat
+    import time
+
+    assert stat.S_IMODE(os.stat(service.socketPath).st_mode) == 0o600
+
+    grid, start, goal = _maze(3)
+    for _ in range(5):
+        client = PathServiceClient(service.socketPath)
+        client.nextMove(grid, start, goal)
+        client.close()
+
+    deadline = time.time() + 2.0
+    while service._sendLocks and time.time() < deadline:
+        time.sleep(0.01)
+    assert service._sendLocks == {}
+
+
+def test_start_refuses_files_and_live_services_but_replaces_stale_sockets(service):
+    d = os.path.dirname(service.socketPath)
+
+    # a live service is not taken over
+    with pytest.raises(RuntimeError):
+        PathService(service.socketPath).start()
+    assert PathServiceClient(service.socketPath).nextMove(*_maze(3)) is not None
+
+    # a regular file is left alone
+    path = os.path.join(d, "f.sock")
+    with open(path, "w") as f:
+        f.write("keep")
+    with pytest.raises(RuntimeError):
+        PathService(path).start()
+    assert open(path).read() == "keep"
+    os.remove(path)
+
+    # a socket without a listener is stale and gets replaced
+    path = os.path.join(d, "s.sock")
+    stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    stale.bind(path)
+    stale.close()
+    svc = PathService(path).start()
+    try:
+        assert PathServiceClient(path).nextMove(*_maze(3)) is not None
+    finally:
+        svc.close()
+    assert os.listdir(d) == ["p.sock"]
@@ -45,3 +45,35 @@ def test_next_move_returns_none_on_short_path():
     assert pf.nextMoveFromPath(None) is None
     assert pf.nextMoveFromPath([]) is None
     assert pf.nextMoveFromPath([(1, 1)]) is None
+
+def _bfsLength(grid, start, goal):
+    from collections import deque
+    rows, cols = len(grid), len(grid[0])
+    dist = {start: 0}
+    q = deque([start])
+    while q:
+        r, c = q.popleft()
+        if (r, c) == goal:
+            return dist[(r, c)]
+        for nr, nc in ((r - 1, c), (r + 1, c), (r, c - 1), (r, c + 1)):
+            if 0 <= nr < rows and 0 <= nc < cols and grid[nr][nc] == 0 and (nr, nc) not in dist:
+                dist[(nr, nc)] = dist[(r, c)] + 1
+                q.append((nr, nc))
+    return None
+
+def test_astar_reuses_scratch_and_stays_optimal():
+    rng = np.random.default_rng(5)
+    pf = Pathfinder()
+    for _ in range(20):
+        grid = (rng.random((12, 12)) < 0.3).astype(int).tolist()
+        grid[0][0] = 0
+        grid[11][11] = 0
+        path = pf.getAStarPath(grid, (0, 0), (11, 11))
+        expected = _bfsLength(grid, (0, 0), (11, 11))
+        if expected is None:
+            assert path is None
+        else:
+            assert len(path) - 1 == expected
+            assert all(abs(a[0] - b[0]) + abs(a[1] - b[1]) == 1 for a, b in zip(path, path[1:]))
+            assert all(grid[r][c] == 0 for r, c in path)
+    assert pf._scratch.generation == 20
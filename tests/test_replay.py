@@ -0,0 +1,113 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.environment import Environment
+from src.logger import Logger
+from src.replay import EpisodeIndex, ReplayPlayer
+
+
+def _writeRun(base, episodes, rotateEpisodes=0):
+    log = Logger(base, console=False, rotateEpisodes=rotateEpisodes)
+    for ep in range(1, episodes + 1):
+        for t in range(1, ep + 1):
+            log.logStep(ep, t, ep, t, 3, -1.0, t == ep, "train", "greedy")
+        log.logEpisode(ep, ep, -float(ep), False, "train")
+    log.close()
+
+
+def test_index_seeks_to_episode_across_compressed_segments(tmp_path):
+    base = str(tmp_path / "run.csv")
+    _writeRun(base, 7, rotateEpisodes=3)
+
+    index = EpisodeIndex(base).refresh()
+    assert index.episodes() == [1, 2, 3, 4, 5, 6, 7]
+
+    rows = index.readEpisode(5)
+    assert [r[0] for r in rows] == [1, 2, 3, 4, 5]
+    assert all(r[1] == 5 for r in rows)
+    assert rows[-1][5] is True
+
+
+def test_sidecar_is_reused_and_extended_incrementally(tmp_path):
+    base = str(tmp_path / "run.csv")
+    _writeRun(base, 3)
+    EpisodeIndex(base).refresh()
+    assert os.path.exists(str(tmp_path / "run_steps.idx"))
+
+    log = Logger(base, console=False)
+    log.logStep(9, 1, 0, 0, 1, -1.0, True, "train", "astar")
+    log.close()
+
+    index = EpisodeIndex(base).refresh()
+    assert index.episodes() == [1, 2, 3, 9]
+    assert index.readEpisode(9) == [(1, 0, 0, 1, -1.0, True, "astar")]
+    assert index.readEpisode(42) == []
+
+
+def test_final_position_applies_last_move_without_touching_env(tmp_path):
+    grid = [[0, 0, 0], [1, 1, 0], [0, 0, 0]]
+    env = Environment(grid, (0, 0), (2, 2))
+    env.step(3)
+    player = ReplayPlayer(EpisodeIndex(str(tmp_path / "run.csv")), env, None)
+
+    # RIGHT from (0, 1) is legal, DOWN from (0, 1) hits a wall
+    assert player._finalPos([(1, 0, 1, 3, -1.0, True, "greedy")]) == (0, 2)
+    assert player._finalPos([(1, 0, 1, 1, -10.0, True, "greedy")]) == (0, 1)
+    assert env.agentPos == (0, 1)
+
+
+class _ScriptedUI:
+    # replays control commands; records draws and how input was read
+    def __init__(self, script):
+        self.script = list(script)
+        self.fps = 60
+        self.calls = []
+
+    def _next(self, how):
+        self.calls.append(how)
+        cmd = {"paused": True, "stop": False, "restart_episode": False, "step_once": False,
+               "next_episode": False, "fps_delta": 0, "episodes_delta": 0, "redraw": False}
+        cmd.update(self.script.pop(0) if self.script else {"stop": True})
+        return cmd
+
+    def pollControls(self):
+        return self._next("poll")
+
+    def waitControls(self, timeoutMs=250):
+        return self._next("wait")
+
+    def adjustFps(self, delta):
+        self.fps += delta
+        return self.fps
+
+    def setHud(self, hud):
+        pass
+
+    def drawGrid(self, env):
+        pass
+
+    def drawAgent(self, pos):
+        self.calls.append(pos)
+
+    def updateScreen(self):
+        pass
+
+
+def test_paused_replay_blocks_for_input_and_draws_single_steps(tmp_path):
+    base = str(tmp_path / "run.csv")
+    _writeRun(base, 3)
+    env = Environment([[0] * 5 for _ in range(5)], (0, 0), (4, 4))
+    ui = _ScriptedUI([{}, {}, {}, {"step_once": True}, {}, {"fps_delta": 10}])
+    ReplayPlayer(EpisodeIndex(base).refresh(), env, ui).play(3)
+
+    # episode 3 logs cells (3, 1), (3, 2), (3, 3)
+    assert ui.calls == [
+        "poll", (3, 1),            # paused: first frame
+        "wait", "wait",            # idle waits draw nothing
+        "wait", (3, 1),            # step: current frame, then advance
+        "poll", (3, 2),            # post-step frame
+        "wait", (3, 2),            # fps change redraws
+        "wait",                    # stop
+    ]
+    assert ui.fps == 70
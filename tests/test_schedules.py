@@ -0,0 +1,50 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import pytest
+
+from src.core_types import TrainingConfig
+from src.hybrid_agent import HybridAgent
+from src.schedules import AdaptiveController, makeExplorationSchedule, makeSchedule
+
+
+@pytest.mark.parametrize("kind", ["linear", "exp", "cosine"])
+def test_decay_schedules_hit_endpoints_and_decrease(kind):
+    s = makeSchedule(kind, 0.5, 0.05, 100)
+    values = [s.value(ep) for ep in range(0, 121)]
+    assert values[0] == pytest.approx(0.5)
+    assert values[100] == pytest.approx(0.05, abs=0.005)
+    assert values[120] == values[100]
+    assert all(a >= b for a, b in zip(values, values[1:]))
+
+
+def test_unknown_schedule_raises():
+    with pytest.raises(ValueError):
+        makeSchedule("step", 1.0, 0.0, 10)
+
+
+def test_adaptive_controller_moves_against_success_rate():
+    ctl = AdaptiveController(targetSR=0.8, gain=0.5)
+    ctl.observe(0.0)
+    assert ctl.scale > 1.0
+    for _ in range(50):
+        ctl.observe(1.0)
+    assert ctl.scale == ctl.minScale
+
+
+def test_constant_config_has_no_schedule():
+    assert makeExplorationSchedule(TrainingConfig()) is None
+
+
+def test_schedule_drives_agent():
+    cfg = TrainingConfig(episodes=10, epsilon=0.4, epsilonSchedule="linear", epsilonEnd=0.0,
+                         heuristicSchedule="cosine", heuristicRateEnd=0.1, adaptiveExploration=True)
+    schedule = makeExplorationSchedule(cfg)
+    agent = HybridAgent(alpha=0.1, gamma=0.9, epsilon=cfg.epsilon, heuristicRate=cfg.heuristicRate, seed=0)
+
+    assert schedule.apply(agent, 5) == (pytest.approx(0.2), pytest.approx(0.2))
+    schedule.observe(0.0)
+    eps, _ = schedule.apply(agent, 5)
+    assert agent.epsilon == eps > 0.2
+    assert "x" in schedule.describe()
@@ -0,0 +1,73 @@
+import sys
+import os
+import io
+import json
+import threading
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.telemetry import Telemetry
+
+
+def test_console_lines_are_written_in_order_on_close():
+    out = io.StringIO()
+    tel = Telemetry(consoleInterval=10.0, stream=out)
+    tel.info("a")
+    tel.info("b")
+    tel.close()
+    assert out.getvalue().splitlines() == ["a", "b"]
+
+
+def test_metrics_are_streamed_as_json_lines(tmp_path):
+    path = tmp_path / "metrics.jsonl"
+    tel = Telemetry(metricsPath=str(path), stream=io.StringIO())
+    tel.metric("train", episode=1, success=True)
+    tel.metric("eval", episode=2, success=False)
+    tel.close()
+
+    rows = [json.loads(line) for line in path.read_text().splitlines()]
+    assert [r["kind"] for r in rows] == ["train", "eval"]
+    assert rows[0]["episode"] == 1
+
+
+def test_full_queue_drops_instead_of_blocking():
+    class StalledStream(io.StringIO):
+        # the first write blocks until released, stalling the consumer
+        def __init__(self):
+            super().__init__()
+            self.entered = threading.Event()
+            self.release = threading.Event()
+
+        def write(self, text):
+            self.entered.set()
+            self.release.wait(5.0)
+            return super().write(text)
+
+    out = StalledStream()
+    tel = Telemetry(consoleInterval=0.0, maxQueue=5, stream=out)
+    tel.info("first")
+    assert out.entered.wait(5.0)
+
+    for i in range(12):
+        tel.info(str(i))  # 5 fit in the queue, 7 are dropped
+    assert tel.dropped == 7
+
+    out.release.set()
+    tel.close()
+
+    lines = out.getvalue().splitlines()
+    assert lines[0] == "first"
+    assert [l for l in lines if not l.startswith("[TELEMETRY]")] == ["first", "0", "1", "2", "3", "4"]
+    assert "[TELEMETRY] dropped 7 messages (queue full)" in lines
+
+
+def test_pending_console_lines_are_bounded():
+    out = io.StringIO()
+    tel = Telemetry(consoleInterval=10.0, maxQueue=10, stream=out)
+    for i in range(1000):
+        tel.info(str(i))
+    tel.close()
+
+    lines = out.getvalue().splitlines()
+    kept = lines[:-1]
+    assert len(kept) <= 10
+    assert lines[-1] == f"[TELEMETRY] dropped {1000 - len(kept)} messages (queue full)"